@@ -1,10 +1,20 @@
 import os
+import base64
+import hashlib
+import heapq
+import itertools
 import json
+import queue
+import random
+import re
 import sqlite3
-from flask import Flask, render_template, jsonify, request
-import spacy
-from openai import OpenAI
-import httpx # Needed to explicitly control the HTTP client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict, defaultdict
+import click
+from flask import Flask, render_template, jsonify, request, g, make_response
+from nlu_service import RemoteNLP
 
 # --- Flask App Setup ---
 # Get the absolute path to the directory where app.py is currently located.
@@ -20,2047 +30,945 @@ app = Flask(__name__,
 # --- Database Setup (SQLite) ---
 DATABASE = 'recipes.db'
 
-def get_db():
-    """Establishes a database connection and sets row factory to access columns by name."""
-    conn = sqlite3.connect(DATABASE)
+# Connections are expensive to open relative to the tiny queries the routes run, so
+# each worker keeps a bounded pool of long-lived connections. A request borrows one
+# for the lifetime of its app context (see get_db/close_db). DB_POOL_SIZE=0 disables
+# pooling and opens a fresh connection per request, which is mainly useful for benchmarking.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "8"))
+DB_CACHE_SIZE_KB = int(os.environ.get("DB_CACHE_SIZE_KB", "16384"))
+DB_MMAP_SIZE = int(os.environ.get("DB_MMAP_SIZE", str(64 * 1024 * 1024)))
+DB_BUSY_TIMEOUT_MS = int(os.environ.get("DB_BUSY_TIMEOUT_MS", "5000"))
+DB_STATEMENT_CACHE = 256 # Prepared statements kept per connection by the sqlite3 module
+
+# Read-only serving mode for web workers: DB_SNAPSHOT=1 copies recipes.db into a private
+# in-memory database when the worker starts, and every request reads from that copy, so
+# routes never touch the file or its locks. Writers (init_db, import-recipes) still use
+# the file. Every DB_SNAPSHOT_CHECK_INTERVAL seconds a request checks the catalog version
+# on disk and, if it moved, a fresh snapshot is loaded in the background.
+DB_SNAPSHOT = os.environ.get("DB_SNAPSHOT", "0") == "1"
+DB_SNAPSHOT_CHECK_INTERVAL = float(os.environ.get("DB_SNAPSHOT_CHECK_INTERVAL", "5"))
+
+class _Connection(sqlite3.Connection):
+    """sqlite3 connection that remembers which database generation (snapshot) it was opened on."""
+    generation = 0
+
+_db_pool = queue.LifoQueue(maxsize=max(DB_POOL_SIZE, 1))
+_db_generation = 0 # Bumped whenever request connections must be reopened (new snapshot, fork)
+_snapshot = None # {"uri", "anchor", "generation", "version", "loaded_at"} of the current in-memory copy
+_snapshot_lock = threading.Lock()
+_snapshot_init_lock = threading.Lock()
+_snapshot_checked_at = 0.0
+_snapshot_reloading = False
+
+def connect_db():
+    """Opens a new tuned connection to the recipes database."""
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE, factory=_Connection)
     conn.row_factory = sqlite3.Row # This makes rows behave like dictionaries/objects
+    # WAL lets readers proceed while a writer (init_db, imports) is active.
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA cache_size = -{DB_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+    conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+    if not _schema_ready:
+        _ensure_schema(conn)
     return conn
 
-def init_db():
-    """Initializes the database schema and populates with sample recipes if empty or not existing."""
-    conn = get_db()
-    cursor = conn.cursor()
+def _connect_request_db():
+    """Opens a connection for serving requests: to the file, or to the current snapshot in DB_SNAPSHOT mode."""
+    if not DB_SNAPSHOT:
+        conn = connect_db()
+        conn.generation = _db_generation
+        return conn
+    if _snapshot is None:
+        with _snapshot_init_lock:
+            if _snapshot is None:
+                load_snapshot()
+    snapshot = _snapshot
+    conn = sqlite3.connect(snapshot["uri"], uri=True, check_same_thread=False,
+                           cached_statements=DB_STATEMENT_CACHE, factory=_Connection)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only = ON")
+    conn.generation = snapshot["generation"]
+    return conn
+
+def _acquire_connection():
+    """Takes an idle connection from the pool, or opens a new one if none is available."""
+    if DB_POOL_SIZE > 0:
+        try:
+            return _db_pool.get_nowait()
+        except queue.Empty:
+            pass
+    return _connect_request_db()
+
+def _release_connection(conn):
+    """Returns a connection to the pool, closing it if pooling is off, the pool is full or it is outdated."""
+    if conn.in_transaction:
+        conn.rollback()
+    if DB_POOL_SIZE > 0 and conn.generation == _db_generation:
+        try:
+            _db_pool.put_nowait(conn)
+            return
+        except queue.Full:
+            pass
+    conn.close()
+
+def _reset_db_pool():
+    """Drops pooled connections; they must never be shared across a fork."""
+    global _db_pool, _db_generation, _snapshot
+    _db_pool = queue.LifoQueue(maxsize=max(DB_POOL_SIZE, 1))
+    _db_generation += 1
+    _snapshot = None # A child process loads its own copy on first use
+
+def _disk_catalog_version(conn):
+    row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'version'").fetchone()
+    return row[0] if row else 0
+
+def load_snapshot():
+    """Copies recipes.db into a new private in-memory database and switches request connections to it.
+
+    The copy is a named shared-cache memory database, so every pooled connection of this
+    process reads the same pages. Connections still open on the previous snapshot keep it
+    alive until they are returned to the pool, where they are closed instead of reused.
+    """
+    global _snapshot, _db_generation, _db_pool
+    if not _schema_ready:
+        try:
+            connect_db().close() # Brings the file's schema up to date before it is copied
+        except sqlite3.OperationalError as e:
+            print(f"WARNING: Could not check the schema of {DATABASE} before snapshotting: {e}")
+    start = time.perf_counter()
+    source = sqlite3.connect(f"file:{os.path.abspath(DATABASE)}?mode=ro", uri=True)
+    try:
+        with _snapshot_lock:
+            generation = _db_generation + 1
+            uri = f"file:recipes-snapshot-{os.getpid()}-{generation}?mode=memory&cache=shared"
+            anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            source.backup(anchor)
+            previous = _snapshot
+            _snapshot = {"uri": uri, "anchor": anchor, "generation": generation,
+                         "version": _disk_catalog_version(anchor), "loaded_at": time.time()}
+            _db_generation = generation
+            _db_pool = queue.LifoQueue(maxsize=max(DB_POOL_SIZE, 1))
+    finally:
+        source.close()
+    if previous is not None:
+        previous["anchor"].close()
+    print(f"Loaded catalog version {_snapshot['version']} into an in-memory snapshot in {(time.perf_counter() - start) * 1000:.0f} ms.")
+
+def _reload_snapshot_in_background():
+    global _snapshot_reloading
+    try:
+        load_snapshot()
+    except sqlite3.Error as e:
+        print(f"Error reloading the database snapshot: {e}")
+    finally:
+        _snapshot_reloading = False
+
+def maybe_reload_snapshot():
+    """Checks, at most every DB_SNAPSHOT_CHECK_INTERVAL seconds, whether the catalog on disk is newer than the snapshot."""
+    global _snapshot_checked_at, _snapshot_reloading
+    now = time.monotonic()
+    if _snapshot is None or _snapshot_reloading or now - _snapshot_checked_at < DB_SNAPSHOT_CHECK_INTERVAL:
+        return
+    _snapshot_checked_at = now
+    try:
+        conn = sqlite3.connect(f"file:{os.path.abspath(DATABASE)}?mode=ro", uri=True)
+        try:
+            disk_version = _disk_catalog_version(conn)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Error checking the catalog version on disk: {e}")
+        return
+    if disk_version != _snapshot["version"]:
+        _snapshot_reloading = True
+        # Requests keep being served from the current snapshot while the new one loads.
+        threading.Thread(target=_reload_snapshot_in_background, daemon=True).start()
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_db_pool)
+
+# Schema objects are created idempotently the first time a process connects, so a
+# worker started against an older recipes.db (e.g. under gunicorn, where init_db never
+# runs) upgrades it in place.
+SCHEMA_TABLES = [
     # Create recipes table with new 'category' and 'image_url' fields
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS recipes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            cuisine TEXT,
-            category TEXT,       -- New field for categorization (e.g., "Vegetarian", "Non-Vegetarian", "Sweet")
-            prep_time INTEGER,
-            cook_time INTEGER,
-            servings INTEGER,
-            instructions TEXT,   -- Stored as JSON string
-            ingredients TEXT,    -- Stored as JSON string
-            image_url TEXT       -- New field for recipe image URL
-        )
-    ''')
-
-    # Define all recipes to be added (totaling 30) with category and image_url
-    all_recipes = [
-        {
-            "name": "Scrambled Eggs",
-            "cuisine": "Continental",
-            "category": "Non-Vegetarian",
-            "prep_time": 2,
-            "cook_time": 5,
-            "servings": 1,
-            "instructions": [
-                "Crack 2 large eggs into a bowl.",
-                "Add a pinch of salt and pepper.",
-                "Whisk well until yolks and whites are combined.",
-                "Melt 1 teaspoon of butter in a non-stick pan over medium heat.",
-                "Pour the egg mixture into the hot pan.",
-                "Let sit for a few seconds until edges begin to set.",
-                "Gently push cooked portions towards the center, tilting the pan to allow uncooked egg to flow underneath.",
-                "Cook until eggs are set but still moist. Do not overcook.",
-                "Remove from heat and serve immediately."
-            ],
-            "ingredients": [
-                {"name": "eggs", "quantity": 2, "unit": "large"},
-                {"name": "salt", "quantity": 1, "unit": "pinch"},
-                {"name": "pepper", "quantity": 1, "unit": "pinch"},
-                {"name": "butter", "quantity": 1, "unit": "tsp"}
-            ],
-            "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Scrambled+Eggs"
-        },
-        {
-            "name": "Indian Chicken Curry",
-            "cuisine": "Indian",
-            "category": "Non-Vegetarian",
-            "prep_time": 20,
-            "cook_time": 45,
-            "servings": 4,
-            "instructions": [
-                "Heat 2 tablespoons of oil in a large pot over medium heat.",
-                "Add 1 chopped onion and cook until softened, about 5 minutes.",
-                "Stir in 2 teaspoons of ginger-garlic paste and cook for 1 minute.",
-                "Add 1 teaspoon of turmeric, 2 teaspoons of cumin, 2 teaspoons of coriander, and 1 teaspoon of garam masala. Cook for 30 seconds until fragrant.",
-                "Add 500g boneless chicken pieces and cook until lightly browned on all sides.",
-                "Pour in 1 cup of chopped tomatoes (or crushed tomatoes) and 1/2 cup of water. Bring to a simmer.",
-                "Cover and cook for 20-25 minutes, or until chicken is cooked through.",
-                "Stir in 1/4 cup of plain yogurt (optional, for creaminess) and cook for another 5 minutes, uncovered, until sauce thickens.",
-                "Garnish with fresh cilantro and serve hot with rice or naan."
-            ],
-            "ingredients": [
-                {"name": "vegetable oil", "quantity": 2, "unit": "tbsp"},
-                {"name": "onion", "quantity": 1, "unit": "chopped"},
-                {"name": "ginger-garlic paste", "quantity": 2, "unit": "tsp"},
-                {"name": "turmeric powder", "quantity": 1, "unit": "tsp"},
-                {"name": "cumin powder", "quantity": 2, "unit": "tsp"},
-                {"name": "coriander powder", "quantity": 2, "unit": "tsp"},
-                {"name": "garam masala", "quantity": 1, "unit": "tsp"},
-                {"name": "boneless chicken", "quantity": 500, "unit": "g"},
-                {"name": "chopped tomatoes", "quantity": 1, "unit": "cup"},
-                {"name": "water", "quantity": 0.5, "unit": "cup"},
-                {"name": "plain yogurt", "quantity": 0.25, "unit": "cup"},
-                {"name": "fresh cilantro", "quantity": 0.25, "unit": "cup, chopped"}
-            ],
-            "image_url": "https://placehold.co/400x300/ffe0b2/3e2723?text=Chicken+Curry"
-        },
-        {
-            "name": "Vegetable Pulao",
-            "cuisine": "Indian",
-            "category": "Vegetarian",
-            "prep_time": 15,
-            "cook_time": 25,
-            "servings": 3,
-            "instructions": [
-                "Wash 1.5 cups of Basmati rice and soak for 20 minutes. Drain well.",
-                "Heat 2 tablespoons of ghee or oil in a pressure cooker or heavy-bottomed pan.",
-                "Add 1 bay leaf, 2-3 green cardamom pods, 1 cinnamon stick, and 4-5 cloves. Sauté for 30 seconds.",
-                "Add 1 chopped onion and cooking until golden brown.",
-                "Stir in 1/2 cup chopped carrots, 1/2 cup green peas, and 1/4 cup chopped green beans. Sauté for 3-4 minutes.",
-                "Add the drained rice and gently mix for 1 minute.",
-                "Pour in 3 cups of water and add 1 teaspoon of salt. Stir gently.",
-                "If using a pressure cooker, close the lid and cook for 2 whistles. If using a pan, cover and cook on low heat until water is absorbed and rice is tender, about 15-20 minutes.",
-                "Let it rest for 5 minutes before opening the lid (pressure cooker) or fluffing with a fork (pan).",
-                "Garnish with fresh cilantro and serve hot with raita."
-            ],
-            "ingredients": [
-                {"name": "Basmati rice", "quantity": 1.5, "unit": "cups"},
-                {"name": "ghee or oil", "quantity": 2, "unit": "tbsp"},
-                {"name": "bay leaf", "quantity": 1, "unit": "medium"},
-                {"name": "green cardamom pods", "quantity": 3, "unit": ""},
-                {"name": "cinnamon stick", "quantity": 1, "unit": "inch"},
-                {"name": "cloves", "quantity": 5, "unit": ""},
-                {"name": "onion", "quantity": 1, "unit": "medium, chopped"},
-                {"name": "carrots", "quantity": 0.5, "unit": "cup, chopped"},
-                {"name": "green peas", "quantity": 0.5, "unit": "cup"},
-                {"name": "green beans", "quantity": 0.25, "unit": "cup, chopped"},
-                {"name": "water", "quantity": 3, "unit": "cups"},
-                {"name": "salt", "quantity": 1, "unit": "tsp"},
-                {"name": "fresh cilantro", "quantity": 0.25, "unit": "cup, chopped"}
-            ],
-            "image_url": "https://placehold.co/400x300/e8f5e9/2e7d32?text=Veg+Pulao"
-        },
-        {
-            "name": "Quick Pasta Primavera",
-            "cuisine": "Italian",
-            "category": "Vegetarian",
-            "prep_time": 10,
-            "cook_time": 20,
-            "servings": 2,
-            "instructions": [
-                "Cook 200g of pasta (e.g., penne or fusilli) according to package directions.",
-                "While pasta cooks, heat 1 tablespoon of olive oil in a large skillet over medium heat.",
-                "Add 1 clove minced garlic and 30 seconds until fragrant.",
-                "Add 1 cup chopped bell peppers (any color), 1/2 cup chopped zucchini, and 1/2 cup broccoli florets. Sauté for 5-7 minutes until vegetables are tender-crisp.",
-                "Stir in 1/4 cup cherry tomatoes (halved) and 2 tablespoons of pesto. Cook for 2 minutes.",
-                "Drain the cooked pasta and add it to the skillet with the vegetables.",
-                "Toss everything together until well combined. Add a splash of pasta water if needed for consistency.",
-                "Season with salt and black pepper to taste. Serve immediately, optionally with grated Parmesan cheese."
-            ],
-            "ingredients": [
-                {"name": "pasta", "quantity": 200, "unit": "g"},
-                {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                {"name": "garlic", "quantity": 1, "unit": "clove, minced"},
-                {"name": "bell peppers", "quantity": 1, "unit": "cup, chopped"},
-                {"name": "zucchini", "quantity": 0.5, "unit": "cup, chopped"},
-                {"name": "broccoli florets", "quantity": 0.5, "unit": "cup"},
-                {"name": "cherry tomatoes", "quantity": 0.25, "unit": "cup, halved"},
-                {"name": "pesto", "quantity": 2, "unit": "tbsp"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "black pepper", "quantity": 1, "unit": "to taste"},
-                {"name": "Parmesan cheese", "quantity": 1, "unit": "optional, grated"}
-            ],
-            "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Pasta+Primavera"
-        },
-        # --- 26 NEW RECIPES START HERE WITH CATEGORIES AND IMAGE_URLS ---
-        {
-            "name": "Classic Tomato Soup",
-            "cuisine": "American",
-            "category": "Vegetarian",
-            "prep_time": 10,
-            "cook_time": 25,
-            "servings": 4,
-            "instructions": [
-                "Melt 2 tbsp butter in a large pot. Add 1 chopped onion and cook until softened.",
-                "Stir in 1 minced garlic clove and cook for 1 minute.",
-                "Add 28 oz can crushed tomatoes, 4 cups vegetable broth, 1 tsp sugar, and 1/2 tsp dried basil.",
-                "Bring to a simmer, then reduce heat and cook for 15-20 minutes.",
-                "Blend with an immersion blender until smooth (or transfer to a regular blender).",
-                "Stir in 1/2 cup heavy cream (optional). Season with salt and pepper to taste. Serve hot."
-            ],
-            "ingredients": [
-                {"name": "butter", "quantity": 2, "unit": "tbsp"},
-                {"name": "onion", "quantity": 1, "unit": "chopped"},
-                {"name": "garlic", "quantity": 1, "unit": "clove, minced"},
-                {"name": "crushed tomatoes", "quantity": 28, "unit": "oz can"},
-                {"name": "vegetable broth", "quantity": 4, "unit": "cups"},
-                {"name": "sugar", "quantity": 1, "unit": "tsp"},
-                {"name": "dried basil", "quantity": 0.5, "unit": "tsp"},
-                {"name": "heavy cream", "quantity": 0.5, "unit": "cup", "optional": True},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "pepper", "quantity": 1, "unit": "to taste"}
-            ],
-            "image_url": "https://placehold.co/400x300/fff3e0/e65100?text=Tomato+Soup"
-        },
-        {
-            "name": "Simple Guacamole",
-            "cuisine": "Mexican",
-            "category": "Vegetarian",
-            "prep_time": 10,
-            "cook_time": 0,
-            "servings": 2,
-            "instructions": [
-                "Mash 2 ripe avocados in a bowl.",
-                "Stir in 1/4 cup finely chopped red onion, 2 tbsp chopped cilantro, and 1-2 tbsp lime juice.",
-                "Add salt and pepper to taste. Mix well.",
-                "Serve immediately with tortilla chips or as a topping."
-            ],
-            "ingredients": [
-                {"name": "avocados", "quantity": 2, "unit": "ripe"},
-                {"name": "red onion", "quantity": 0.25, "unit": "cup, chopped"},
-                {"name": "cilantro", "quantity": 2, "unit": "tbsp, chopped"},
-                {"name": "lime juice", "quantity": 1, "unit": "tbsp"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "pepper", "quantity": 1, "unit": "to taste"}
-            ],
-            "image_url": "https://placehold.co/400x300/f1f8e9/33691e?text=Guacamole"
-        },
-        {
-            "name": "Chicken Stir-fry",
-            "cuisine": "Asian",
-            "category": "Non-Vegetarian",
-            "prep_time": 15,
-            "cook_time": 20,
-            "servings": 3,
-            "instructions": [
-                "Slice 1 lb boneless, skinless chicken breast into thin strips.",
-                "Heat 1 tbsp sesame oil in a large skillet or wok over medium-high heat.",
-                "Add chicken and cook until browned and cooked through. Remove and set aside.",
-                "Add 1 tbsp more oil to the pan. Add 1 chopped bell pepper, 1 cup broccoli florets, and 1 cup snap peas.",
-                "Stir-fry for 5-7 minutes until vegetables are tender-crisp.",
-                "Return chicken to the pan. Add 1/4 cup soy sauce, 1 tbsp honey, and 1 tsp grated ginger.",
-                "Toss to coat and cook for 2 minutes. Serve hot over rice."
-            ],
-            "ingredients": [
-                {"name": "boneless, skinless chicken breast", "quantity": 1, "unit": "lb"},
-                {"name": "sesame oil", "quantity": 2, "unit": "tbsp"},
-                {"name": "bell pepper", "quantity": 1, "unit": "chopped"},
-                {"name": "broccoli florets", "quantity": 1, "unit": "cup"},
-                {"name": "snap peas", "quantity": 1, "unit": "cup"},
-                {"name": "soy sauce", "quantity": 0.25, "unit": "cup"},
-                {"name": "honey", "quantity": 1, "unit": "tbsp"},
-                {"name": "grated ginger", "quantity": 1, "unit": "tsp"}
-            ],
-            "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Chicken+Stir-fry"
-        },
-        {
-            "name": "Lentil Soup",
-            "cuisine": "Mediterranean",
-            "category": "Vegetarian",
-            "prep_time": 15,
-            "cook_time": 40,
-            "servings": 6,
-            "instructions": [
-                "Rinse 1 cup brown or green lentils.",
-                "Heat 2 tbsp olive oil in a large pot. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks. Sauté for 8-10 minutes.",
-                "Stir in 2 minced garlic cloves, 1 tsp cumin, and 1/2 tsp coriander. Cook for 1 minute.",
-                "Add rinsed lentils, 6 cups vegetable broth, and 1 (14.5 oz) can diced tomatoes.",
-                "Bring to a boil, then reduce heat, cover, and simmer for 30-35 minutes, or until lentils are tender.",
-                "Season with salt, pepper, and a squeeze of lemon juice. Garnish with fresh parsley."
-            ],
-            "ingredients": [
-                {"name": "brown or green lentils", "quantity": 1, "unit": "cup"},
-                {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                {"name": "onion", "quantity": 1, "unit": "chopped"},
-                {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                {"name": "cumin", "quantity": 1, "unit": "tsp"},
-                {"name": "coriander", "quantity": 0.5, "unit": "tsp"},
-                {"name": "vegetable broth", "quantity": 6, "unit": "cups"},
-                {"name": "diced tomatoes", "quantity": 14.5, "unit": "oz can"},
-                {"name": "lemon juice", "quantity": 1, "unit": "squeeze"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                {"name": "fresh parsley", "quantity": 1, "unit": "garnish"}
-            ],
-            "image_url": "https://placehold.co/400x300/ede7f6/512da8?text=Lentil+Soup"
-        },
-        {
-            "name": "Baked Salmon with Asparagus",
-            "cuisine": "Healthy",
-            "category": "Non-Vegetarian",
-            "prep_time": 10,
-            "cook_time": 15,
-            "servings": 2,
-            "instructions": [
-                "Preheat oven to 400°F (200°C).",
-                "Place 2 salmon fillets on a baking sheet. Drizzle with olive oil and season with salt, pepper, and garlic powder.",
-                "Toss 1 bunch of asparagus (ends trimmed) with olive oil, salt, and pepper. Arrange around salmon.",
-                "Bake for 12-15 minutes, or until salmon is cooked through and flakes easily with a fork."
-            ],
-            "ingredients": [
-                {"name": "salmon fillets", "quantity": 2, "unit": ""},
-                {"name": "asparagus", "quantity": 1, "unit": "bunch"},
-                {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                {"name": "garlic powder", "quantity": 0.5, "unit": "tsp"}
-            ],
-            "image_url": "https://placehold.co/400x300/e8f5e9/2e7d32?text=Baked+Salmon"
-        },
-        {
-            "name": "Banana Pancakes",
-            "cuisine": "American",
-            "category": "Sweet",
-            "prep_time": 5,
-            "cook_time": 15,
-            "servings": 2,
-            "instructions": [
-                "Mash 1 ripe banana in a bowl.",
-                "Whisk in 1 large egg and 1/2 cup milk.",
-                "Stir in 1/2 cup all-purpose flour, 1 tsp baking powder, and a pinch of salt until just combined (lumps are okay).",
-                "Heat a lightly oiled griddle or non-stick pan over medium heat.",
-                "Pour 1/4 cup batter per pancake. Cook for 2-3 minutes per side, until golden brown and cooked through.",
-                "Serve with maple syrup and fresh fruit."
-            ],
-            "ingredients": [
-                {"name": "ripe banana", "quantity": 1, "unit": ""},
-                {"name": "large egg", "quantity": 1, "unit": ""},
-                {"name": "milk", "quantity": 0.5, "unit": "cup"},
-                {"name": "all-purpose flour", "quantity": 0.5, "unit": "cup"},
-                {"name": "baking powder", "quantity": 1, "unit": "tsp"},
-                {"name": "salt", "quantity": 1, "unit": "pinch"},
-                {"name": "maple syrup", "quantity": 1, "unit": "to serve"},
-                {"name": "fresh fruit", "quantity": 1, "unit": "to serve"}
-            ],
-            "image_url": "https://placehold.co/400x300/fff3e0/e65100?text=Banana+Pancakes"
-        },
-        {
-            "name": "Vegetarian Chili",
-            "cuisine": "American",
-            "category": "Vegetarian",
-            "prep_time": 20,
-            "cook_time": 45,
-            "servings": 6,
-            "instructions": [
-                "Heat 1 tbsp olive oil in a large pot. Add 1 chopped onion, 1 chopped bell pepper, and 2 minced garlic cloves. Sauté for 5 minutes.",
-                "Stir in 1 tbsp chili powder, 1 tsp cumin, and 1/2 tsp smoked paprika. Cook for 1 minute.",
-                "Add 1 (28 oz) can crushed tomatoes, 1 (15 oz) can kidney beans (rinsed), 1 (15 oz) can black beans (rinsed), and 1 cup vegetable broth.",
-                "Bring to a simmer, then reduce heat, uncovered, for 30-40 minutes, stirring occasionally, until thickened.",
-                "Season with salt and pepper. Serve with desired toppings like shredded cheese or sour cream."
-            ],
-            "ingredients": [
-                {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                {"name": "onion", "quantity": 1, "unit": "chopped"},
-                {"name": "bell pepper", "quantity": 1, "unit": "chopped"},
-                {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                {"name": "chili powder", "quantity": 1, "unit": "tbsp"},
-                {"name": "cumin", "quantity": 1, "unit": "tsp"},
-                {"name": "smoked paprika", "quantity": 0.5, "unit": "tsp"},
-                {"name": "crushed tomatoes", "quantity": 28, "unit": "oz can"},
-                {"name": "kidney beans", "quantity": 15, "unit": "oz can, rinsed"},
-                {"name": "black beans", "quantity": 15, "unit": "oz can, rinsed"},
-                {"name": "vegetable broth", "quantity": 1, "unit": "cup"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                {"name": "shredded cheese", "quantity": 1, "unit": "optional"},
-                {"name": "sour cream", "quantity": 1, "unit": "optional"}
-            ],
-            "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Vegetarian+Chili"
-        },
-        {
-            "name": "Caprese Salad",
-            "cuisine": "Italian",
-            "category": "Vegetarian",
-            "prep_time": 10,
-            "cook_time": 0,
-            "servings": 2,
-            "instructions": [
-                "Slice 2 ripe tomatoes and 8 oz fresh mozzarella into 1/4-inch thick rounds.",
-                "Arrange tomato and mozzarella slices on a platter, alternating them.",
-                "Tuck fresh basil leaves between the slices.",
-                "Drizzle generously with balsamic glaze.",
-                "Season lightly with salt and freshly ground black pepper. Serve immediately."
-            ],
-            "ingredients": [
-                {"name": "ripe tomatoes", "quantity": 2, "unit": ""},
-                {"name": "fresh mozzarella", "quantity": 8, "unit": "oz"},
-                {"name": "fresh basil leaves", "quantity": 0.5, "unit": "cup"},
-                {"name": "balsamic glaze", "quantity": 2, "unit": "tbsp"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "black pepper", "quantity": 1, "unit": "to taste"}
-            ],
-            "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Caprese+Salad"
-        },
-        {
-            "name": "Garlic Butter Shrimp",
-            "cuisine": "Seafood",
-            "category": "Non-Vegetarian",
-            "prep_time": 10,
-            "cook_time": 10,
-            "servings": 2,
-            "instructions": [
-                "Pat 1 lb shrimp (peeled and deveined) dry with paper towels.",
-                "Melt 2 tbsp butter in a large skillet over medium-high heat. Add 4 minced garlic cloves and cook for 1 minute until fragrant.",
-                "Add shrimp to the skillet in a single layer. Cook for 2-3 minutes per side, until pink and cooked through.",
-                "Stir in 1 tbsp lemon juice and 2 tbsp chopped fresh parsley.",
-                "Season with salt and pepper to taste. Serve immediately, perhaps with rice or pasta."
-            ],
-            "ingredients": [
-                {"name": "shrimp", "quantity": 1, "unit": "lb, peeled and deveined"},
-                {"name": "butter", "quantity": 2, "unit": "tbsp"},
-                {"name": "garlic", "quantity": 4, "unit": "cloves, minced"},
-                {"name": "lemon juice", "quantity": 1, "unit": "tbsp"},
-                {"name": "fresh parsley", "quantity": 2, "unit": "tbsp, chopped"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                {"name": "pepper", "quantity": 1, "unit": "to taste"}
-            ],
-            "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Garlic+Shrimp"
-        },
-        {
-            "name": "Quinoa Salad with Chickpeas",
-            "cuisine": "Mediterranean",
-            "category": "Vegetarian",
-            "prep_time": 15,
-            "cook_time": 15,
-            "servings": 4,
-            "instructions": [
-                "Rinse 1 cup quinoa thoroughly. Cook according to package directions (typically 2 cups water, simmer 15 mins). Fluff with a fork.",
-                "In a large bowl, combine cooked quinoa, 1 can (15oz) chickpeas (rinsed and drained), 1 cup chopped cucumber, 1 cup chopped cherry tomatoes, and 1/2 cup chopped red onion.",
-                "For the dressing, whisk together 3 tbsp olive oil, 2 tbsp lemon juice, 1 tsp dried oregano, salt, and pepper.",
-                "Pour dressing over salad and toss to combine. Chill for at least 15 minutes before serving."
-            ],
-            "ingredients": [
-                {"name": "quinoa", "quantity": 1, "unit": "cup"},
-                {"name": "chickpeas", "quantity": 15, "unit": "oz can, rinsed"},
-                {"name": "cucumber", "quantity": 1, "unit": "cup, chopped"},
-                {"name": "cherry tomatoes", "quantity": 1, "unit": "cup, chopped"},
-                {"name": "red onion", "quantity": 0.5, "unit": "cup, chopped"},
-                {"name": "olive oil", "quantity": 3, "unit": "tbsp"},
-                {"name": "lemon juice", "quantity": 2, "unit": "tbsp"},
-                {"name": "dried oregano", "quantity": 1, "unit": "tsp"},
-                {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/f0f4c3/689f38?text=Quinoa+Salad"
-            },
-            {
-                "name": "Chocolate Chip Cookies",
-                "cuisine": "American",
-                "category": "Sweet",
-                "prep_time": 15,
-                "cook_time": 12,
-                "servings": 24,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C). Line baking sheets with parchment paper.",
-                    "In a large bowl, cream together 1/2 cup (1 stick) softened unsalted butter, 1/2 cup granulated sugar, and 1/2 cup packed light brown sugar until light and fluffy.",
-                    "Beat in 1 large egg and 1 tsp vanilla extract.",
-                    "In a separate bowl, whisk together 1 1/4 cups all-purpose flour, 1/2 tsp baking soda, and 1/4 tsp salt.",
-                    "Gradually add dry ingredients to wet ingredients, mixing until just combined.",
-                    "Fold in 1 cup chocolate chips.",
-                    "Drop rounded tablespoons of dough onto prepared baking sheets.",
-                    "Bake for 10-12 minutes, or until edges are golden brown and centers are still soft. Let cool on baking sheets for a few minutes before transferring to a wire rack."
-                ],
-                "ingredients": [
-                    {"name": "unsalted butter", "quantity": 0.5, "unit": "cup, softened"},
-                    {"name": "granulated sugar", "quantity": 0.5, "unit": "cup"},
-                    {"name": "light brown sugar", "quantity": 0.5, "unit": "cup, packed"},
-                    {"name": "large egg", "quantity": 1, "unit": ""},
-                    {"name": "vanilla extract", "quantity": 1, "unit": "tsp"},
-                    {"name": "all-purpose flour", "quantity": 1.25, "unit": "cups"},
-                    {"name": "baking soda", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 0.25, "unit": "tsp"},
-                    {"name": "chocolate chips", "quantity": 1, "unit": "cup"}
-                ],
-                "image_url": "https://placehold.co/400x300/ffe0b2/3e2723?text=Choc+Chip+Cookies"
-            },
-            {
-                "name": "Beef Tacos",
-                "cuisine": "Mexican",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 20,
-                "servings": 4,
-                "instructions": [
-                    "Brown 1 lb ground beef in a skillet over medium-high heat. Drain excess fat.",
-                    "Stir in 1 packet (1 oz) taco seasoning and 1/2 cup water. Bring to a simmer and cook for 5-7 minutes, until sauce thickens.",
-                    "Warm 12 taco shells or tortillas according to package directions.",
-                    "Fill taco shells with seasoned beef. Top with shredded lettuce, diced tomatoes, shredded cheese, and salsa."
-                ],
-                "ingredients": [
-                    {"name": "ground beef", "quantity": 1, "unit": "lb"},
-                    {"name": "taco seasoning", "quantity": 1, "unit": "packet (1 oz)"},
-                    {"name": "water", "quantity": 0.5, "unit": "cup"},
-                    {"name": "taco shells or tortillas", "quantity": 12, "unit": ""},
-                    {"name": "shredded lettuce", "quantity": 2, "unit": "cups"},
-                    {"name": "diced tomatoes", "quantity": 1, "unit": "cup"},
-                    {"name": "shredded cheese", "quantity": 1, "unit": "cup"},
-                    {"name": "salsa", "quantity": 1, "unit": "cup"}
-                ],
-                "image_url": "https://placehold.co/400x300/ffccbc/bf360c?text=Beef+Tacos"
-            },
-            {
-                "name": "Mushroom Risotto",
-                "cuisine": "Italian",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 30,
-                "servings": 4,
-                "instructions": [
-                    "Heat 6 cups vegetable or chicken broth in a saucepan; keep warm over low heat.",
-                    "In a large, heavy-bottomed pot, melt 2 tbsp butter with 1 tbsp olive oil over medium heat. Add 1 chopped onion and cook until softened, about 5 minutes.",
-                    "Add 8 oz sliced mushrooms and cook until browned, about 5-7 minutes.",
-                    "Stir in 2 minced garlic cloves and 1.5 cups Arborio rice. Cook for 1-2 minutes until edges are translucent.",
-                    "Pour in 1/2 cup dry white wine and stir until absorbed.",
-                    "Add warm broth, 1 ladle at a time, stirring constantly until each addition is absorbed before adding more. This will take about 20-25 minutes.",
-                    "Once all broth is absorbed and rice is creamy but still al dente, stir in 1/2 cup grated Parmesan cheese and 2 tbsp butter.",
-                    "Season with salt and pepper. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "vegetable or chicken broth", "quantity": 6, "unit": "cups"},
-                    {"name": "butter", "quantity": 4, "unit": "tbsp"},
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "mushrooms", "quantity": 8, "unit": "oz, sliced"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "Arborio rice", "quantity": 1.5, "unit": "cups"},
-                    {"name": "dry white wine", "quantity": 0.5, "unit": "cup"},
-                    {"name": "Parmesan cheese", "quantity": 0.5, "unit": "cup, grated"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Mushroom+Risotto"
-            },
-            {
-                "name": "French Toast",
-                "cuisine": "American",
-                "category": "Sweet",
-                "prep_time": 5,
-                "cook_time": 10,
-                "servings": 2,
-                "instructions": [
-                    "In a shallow dish, whisk together 2 large eggs, 1/2 cup milk, 1 tbsp sugar, and 1/2 tsp vanilla extract.",
-                    "Dip each slice of bread into the egg mixture, coating both sides.",
-                    "Heat a lightly oiled griddle or non-stick pan over medium heat.",
-                    "Cook bread slices for 2-3 minutes per side, until golden brown and cooked through.",
-                    "Serve immediately with maple syrup and powdered sugar."
-                ],
-                "ingredients": [
-                    {"name": "large eggs", "quantity": 2, "unit": ""},
-                    {"name": "milk", "quantity": 0.5, "unit": "cup"},
-                    {"name": "sugar", "quantity": 1, "unit": "tbsp"},
-                    {"name": "vanilla extract", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "bread slices", "quantity": 4, "unit": ""},
-                    {"name": "maple syrup", "quantity": 1, "unit": "to serve"},
-                    {"name": "powdered sugar", "quantity": 1, "unit": "to serve"}
-                ],
-                "image_url": "https://placehold.co/400x300/fff3e0/e65100?text=French+Toast"
-            },
-            {
-                "name": "Chicken Noodle Soup",
-                "cuisine": "American",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 30,
-                "servings": 6,
-                "instructions": [
-                    "Heat 1 tbsp olive oil in a large pot over medium heat. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks. Sauté for 5-7 minutes until softened.",
-                    "Add 2 minced garlic cloves and cook for 1 minute.",
-                    "Pour in 8 cups chicken broth and add 1 cup cooked shredded chicken.",
-                    "Bring to a simmer. Add 2 cups egg noodles and cook according to package directions, about 7-10 minutes.",
-                    "Season with salt, pepper, and fresh parsley to taste. Serve hot."
-                ],
-                "ingredients": [
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                    {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "chicken broth", "quantity": 8, "unit": "cups"},
-                    {"name": "cooked shredded chicken", "quantity": 1, "unit": "cup"},
-                    {"name": "egg noodles", "quantity": 2, "unit": "cups"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "fresh parsley", "quantity": 1, "unit": "to garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Chicken+Noodle+Soup"
-            },
-            {
-                "name": "Spaghetti Carbonara",
-                "cuisine": "Italian",
-                "category": "Non-Vegetarian",
-                "prep_time": 10,
-                "cook_time": 15,
-                "servings": 2,
-                "instructions": [
-                    "Cook 200g spaghetti according to package directions until al dente. Reserve 1 cup pasta water.",
-                    "While pasta cooks, cook 4 oz pancetta or bacon (diced) in a large skillet over medium heat until crispy. Remove pancetta to a plate, leaving rendered fat in the skillet.",
-                    "In a bowl, whisk together 2 large eggs, 1/2 cup grated Pecorino Romano cheese, and plenty of black pepper.",
-                    "Add drained spaghetti to the skillet with the fat. Toss to coat.",
-                    "Pour egg mixture over pasta, stirring vigorously to coat. Add a few tablespoons of reserved pasta water as needed to create a creamy sauce.",
-                    "Stir in crispy pancetta. Serve immediately with extra cheese and pepper."
-                ],
-                "ingredients": [
-                    {"name": "spaghetti", "quantity": 200, "unit": "g"},
-                    {"name": "pancetta or bacon", "quantity": 4, "unit": "oz, diced"},
-                    {"name": "large eggs", "quantity": 2, "unit": ""},
-                    {"name": "Pecorino Romano cheese", "quantity": 0.5, "unit": "cup, grated"},
-                    {"name": "black pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Spaghetti+Carbonara"
-            },
-            {
-                "name": "Oatmeal",
-                "cuisine": "Breakfast",
-                "category": "Vegetarian",
-                "prep_time": 1,
-                "cook_time": 5,
-                "servings": 1,
-                "instructions": [
-                    "Combine 1/2 cup rolled oats and 1 cup water (or milk) in a small saucepan.",
-                    "Bring to a boil, then reduce heat to low and simmer, stirring occasionally, for 3-5 minutes, until oats are tender and liquid is absorbed.",
-                    "Remove from heat. Stir in a pinch of salt and any desired toppings like fruit, nuts, or honey.",
-                    "Serve warm."
-                ],
-                "ingredients": [
-                    {"name": "rolled oats", "quantity": 0.5, "unit": "cup"},
-                    {"name": "water or milk", "quantity": 1, "unit": "cup"},
-                    {"name": "salt", "quantity": 1, "unit": "pinch"},
-                    {"name": "fruit", "quantity": 1, "unit": "optional, for topping"},
-                    {"name": "nuts", "quantity": 1, "unit": "optional, for topping"},
-                    {"name": "honey", "quantity": 1, "unit": "optional, for topping"}
-                ],
-                "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Oatmeal"
-            },
-            {
-                "name": "Homemade Pizza",
-                "cuisine": "Italian",
-                "category": "Vegetarian",
-                "prep_time": 20,
-                "cook_time": 15,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 450°F (230°C) with a pizza stone or baking steel if you have one.",
-                    "On a lightly floured surface, stretch or roll out 1 lb pizza dough into a 12-inch round.",
-                    "Transfer dough to a parchment-lined baking sheet or a pizza peel dusted with cornmeal.",
-                    "Spread 1/2 cup pizza sauce evenly over the dough, leaving a 1-inch border.",
-                    "Sprinkle with 1 cup shredded mozzarella cheese and desired toppings.",
-                    "Bake for 12-15 minutes, or until crust is golden brown and cheese is bubbly and lightly browned."
-                ],
-                "ingredients": [
-                    {"name": "pizza dough", "quantity": 1, "unit": "lb"},
-                    {"name": "pizza sauce", "quantity": 0.5, "unit": "cup"},
-                    {"name": "shredded mozzarella cheese", "quantity": 1, "unit": "cup"},
-                    {"name": "desired toppings", "quantity": 1, "unit": "to taste"},
-                    {"name": "cornmeal", "quantity": 1, "unit": "for dusting"}
-                ],
-                "image_url": "https://placehold.co/400x300/fff8e1/ff8f00?text=Homemade+Pizza"
-            },
-            {
-                "name": "Lemon Herb Roasted Chicken",
-                "cuisine": "European",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 60,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 400°F (200°C).",
-                    "Pat 1 (3-4 lb) whole chicken dry with paper towels.",
-                    "In a small bowl, combine 2 tbsp olive oil, 2 tbsp chopped fresh rosemary, 2 tbsp chopped fresh thyme, 1 tbsp lemon zest, 2 minced garlic cloves, salt, and pepper.",
-                    "Rub the herb mixture all over the chicken, including under the skin.",
-                    "Stuff the cavity with lemon halves and extra herb sprigs if desired.",
-                    "Roast for 60-75 minutes, or until internal temperature reaches 165°F (74°C) in the thickest part of the thigh."
-                ],
-                "ingredients": [
-                    {"name": "whole chicken", "quantity": 1, "unit": "3-4 lb"},
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "fresh rosemary", "quantity": 2, "unit": "tbsp, chopped"},
-                    {"name": "fresh thyme", "quantity": 2, "unit": "tbsp, chopped"},
-                    {"name": "lemon zest", "quantity": 1, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "lemon", "quantity": 1, "unit": "halved, for cavity"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f7fa/006064?text=Roasted+Chicken"
-            },
-            {
-                "name": "Black Bean Burgers",
-                "cuisine": "Vegetarian",
-                "category": "Vegetarian",
-                "prep_time": 20,
-                "cook_time": 15,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C) or prepare grill/skillet.",
-                    "In a large bowl, mash 1 (15 oz) can black beans (drained and rinsed) with a fork, leaving some whole.",
-                    "Stir in 1/2 cup cooked brown rice, 1/4 cup finely chopped red onion, 2 tbsp breadcrumbs, 1 large egg, 1 tsp chili powder, 1/2 tsp cumin, and salt/pepper.",
-                    "Form into 4 patties.",
-                    "Bake for 10-12 minutes per side, or cook in a lightly oiled skillet/grill until browned and heated through.",
-                    "Serve on buns with desired toppings."
-                ],
-                "ingredients": [
-                    {"name": "black beans", "quantity": 15, "unit": "oz can, rinsed"},
-                    {"name": "cooked brown rice", "quantity": 0.5, "unit": "cup"},
-                    {"name": "red onion", "quantity": 0.25, "unit": "cup, chopped"},
-                    {"name": "breadcrumbs", "quantity": 2, "unit": "tbsp"},
-                    {"name": "large egg", "quantity": 1, "unit": ""},
-                    {"name": "chili powder", "quantity": 1, "unit": "tsp"},
-                    {"name": "cumin", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "burger buns", "quantity": 4, "unit": ""}
-                ],
-                "image_url": "https://placehold.co/400x300/c8e6c9/2e7d32?text=Black+Bean+Burger"
-            },
-            {
-                "name": "Greek Salad",
-                "cuisine": "Mediterranean",
-                "category": "Vegetarian",
-                "prep_time": 10,
-                "cook_time": 0,
-                "servings": 2,
-                "instructions": [
-                    "In a large bowl, combine 4 cups chopped romaine lettuce, 1/2 cup sliced cucumber, 1/2 cup chopped tomatoes, 1/4 cup sliced red onion, 1/4 cup Kalamata olives, and 1/4 cup crumbled feta cheese.",
-                    "For the dressing, whisk together 3 tbsp olive oil, 1 tbsp red wine vinegar, 1/2 tsp dried oregano, salt, and pepper.",
-                    "Pour dressing over salad and toss gently to combine. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "romaine lettuce", "quantity": 4, "unit": "cups, chopped"},
-                    {"name": "cucumber", "quantity": 0.5, "unit": "cup, sliced"},
-                    {"name": "tomatoes", "quantity": 0.5, "unit": "cup, chopped"},
-                    {"name": "red onion", "quantity": 0.25, "unit": "cup, sliced"},
-                    {"name": "Kalamata olives", "quantity": 0.25, "unit": "cup"},
-                    {"name": "feta cheese", "quantity": 0.25, "unit": "cup, crumbled"},
-                    {"name": "olive oil", "quantity": 3, "unit": "tbsp"},
-                    {"name": "red wine vinegar", "quantity": 1, "unit": "tbsp"},
-                    {"name": "dried oregano", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/ede7f6/512da8?text=Greek+Salad"
-            },
-            {
-                "name": "Beef and Broccoli",
-                "cuisine": "Asian",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 15,
-                "servings": 4,
-                "instructions": [
-                    "Slice 1 lb flank steak thinly against the grain. Marinate in 2 tbsp soy sauce, 1 tbsp cornstarch, and 1 tbsp sesame oil for 15 minutes.",
-                    "Steam or blanch 4 cups broccoli florets until tender-crisp.",
-                    "Heat 1 tbsp vegetable oil in a large skillet or wok over high heat. Add beef in batches and cook until browned. Remove beef.",
-                    "In the same skillet, add 1 tbsp more oil to the pan. Add 2 minced garlic cloves and 1 tsp grated ginger. Cook for 30 seconds.",
-                    "Whisk together 1/4 cup beef broth, 2 tbsp soy sauce, 1 tbsp oyster sauce, 1 tbsp brown sugar, and 1 tsp cornstarch. Pour into skillet and bring to a simmer until slightly thickened.",
-                    "Return beef and broccoli to the skillet. Toss to coat in sauce. Serve hot over rice."
-                ],
-                "ingredients": [
-                    {"name": "flank steak", "quantity": 1, "unit": "lb"},
-                    {"name": "soy sauce", "quantity": 4, "unit": "tbsp"},
-                    {"name": "cornstarch", "quantity": 2, "unit": "tbsp"},
-                    {"name": "sesame oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "broccoli florets", "quantity": 4, "unit": "cups"},
-                    {"name": "vegetable oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "grated ginger", "quantity": 1, "unit": "tsp"},
-                    {"name": "beef broth", "quantity": 0.25, "unit": "cup"},
-                    {"name": "oyster sauce", "quantity": 1, "unit": "tbsp"},
-                    {"name": "brown sugar", "quantity": 1, "unit": "tbsp"}
-                ],
-                "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Beef+Broccoli"
-            },
-            {
-                "name": "Minestrone Soup",
-                "cuisine": "Italian",
-                "category": "Vegetarian",
-                "prep_time": 20,
-                "cook_time": 40,
-                "servings": 6,
-                "instructions": [
-                    "Heat 2 tbsp olive oil in a large pot. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks. Sauté for 8-10 minutes.",
-                    "Add 3 minced garlic cloves, 1 tsp dried oregano, and 1/2 tsp dried basil. Cook for 1 minute.",
-                    "Stir in 1 (28 oz) can crushed tomatoes, 6 cups vegetable broth, 1 (15 oz) can cannellini beans (rinsed), 1 cup small pasta (e.g., ditalini), and 1 cup chopped zucchini.",
-                    "Bring to a simmer. Cook for 15-20 minutes, or until pasta is al dente and vegetables are tender.",
-                    "Stir in 2 cups baby spinach until wilted. Season with salt and pepper. Serve with grated Parmesan."
-                ],
-                "ingredients": [
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                    {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 3, "unit": "cloves, minced"},
-                    {"name": "dried oregano", "quantity": 1, "unit": "tsp"},
-                    {"name": "dried basil", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "crushed tomatoes", "quantity": 28, "unit": "oz can"},
-                    {"name": "vegetable broth", "quantity": 6, "unit": "cups"},
-                    {"name": "cannellini beans", "quantity": 15, "unit": "oz can, rinsed"},
-                    {"name": "small pasta", "quantity": 1, "unit": "cup"},
-                    {"name": "zucchini", "quantity": 1, "unit": "cup, chopped"},
-                    {"name": "baby spinach", "quantity": 2, "unit": "cups"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "Parmesan cheese", "quantity": 1, "unit": "garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/ede7f6/512da8?text=Minestrone+Soup"
-            },
-            {
-                "name": "Crispy Baked Chicken Thighs",
-                "cuisine": "American",
-                "category": "Non-Vegetarian",
-                "prep_time": 10,
-                "cook_time": 35,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 400°F (200°C).",
-                    "Pat 4 bone-in, skin-on chicken thighs dry with paper towels.",
-                    "In a small bowl, combine 1 tbsp olive oil, 1 tsp garlic powder, 1 tsp paprika, 1/2 tsp dried thyme, salt, and pepper.",
-                    "Rub seasoning mix all over chicken thighs.",
-                    "Place chicken thighs skin-side up on a baking sheet. Bake for 30-35 minutes, or until skin is crispy and internal temperature reaches 165°F (74°C)."
-                ],
-                "ingredients": [
-                    {"name": "bone-in, skin-on chicken thighs", "quantity": 4, "unit": ""},
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "garlic powder", "quantity": 1, "unit": "tsp"},
-                    {"name": "paprika", "quantity": 1, "unit": "tsp"},
-                    {"name": "dried thyme", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Crispy+Chicken"
-            },
-            {
-                "name": "Pesto Chicken Sandwich",
-                "cuisine": "Italian",
-                "category": "Non-Vegetarian",
-                "prep_time": 5,
-                "cook_time": 10,
-                "servings": 1,
-                "instructions": [
-                    "Toast 2 slices of your favorite bread.",
-                    "Spread 1-2 tbsp pesto on one side of each toasted bread slice.",
-                    "Layer 4 oz cooked chicken breast (sliced or shredded) on one slice of bread.",
-                    "Top with 2 slices of fresh mozzarella and a few slices of roasted red bell pepper (from a jar).",
-                    "Place the other slice of bread on top. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "bread slices", "quantity": 2, "unit": ""},
-                    {"name": "pesto", "quantity": 2, "unit": "tbsp"},
-                    {"name": "cooked chicken breast", "quantity": 4, "unit": "oz, sliced or shredded"},
-                    {"name": "fresh mozzarella", "quantity": 2, "unit": "slices"},
-                    {"name": "roasted red bell pepper", "quantity": 2, "unit": "slices (from jar)"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Pesto+Chicken+Sandwich"
-            },
-            {
-                "name": "Avocado Toast",
-                "cuisine": "Breakfast",
-                "category": "Vegetarian",
-                "prep_time": 5,
-                "cook_time": 2,
-                "servings": 1,
-                "instructions": [
-                    "Toast 1 slice of your favorite bread until golden.",
-                    "In a small bowl, mash 1/2 ripe avocado with a fork.",
-                    "Spread mashed avocado evenly over the toasted bread.",
-                    "Season with a pinch of flaky sea salt, red pepper flakes (optional), and a squeeze of lemon juice (optional).",
-                    "Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "bread slice", "quantity": 1, "unit": ""},
-                    {"name": "ripe avocado", "quantity": 0.5, "unit": ""},
-                    {"name": "flaky sea salt", "quantity": 1, "unit": "pinch"},
-                    {"name": "red pepper flakes", "quantity": 1, "unit": "pinch", "optional": True},
-                    {"name": "lemon juice", "quantity": 1, "unit": "squeeze", "optional": True}
-                ],
-                "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Avocado+Toast"
-            },
-            {
-                "name": "Beef Stew",
-                "cuisine": "European",
-                "category": "Non-Vegetarian",
-                "prep_time": 25,
-                "cook_time": 120,
-                "servings": 6,
-                "instructions": [
-                    "Pat 1.5 lb beef chuck (cut into 1-inch cubes) dry. Season with salt and pepper.",
-                    "Heat 2 tbsp olive oil in a large Dutch oven or pot over medium-high heat. Brown beef in batches, then remove.",
-                    "Add 1 more tbsp oil. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks. Sauté for 7-10 minutes until softened.",
-                    "Stir in 3 minced garlic cloves, 1 tsp dried thyme, and 1 bay leaf. Cook for 1 minute.",
-                    "Pour in 4 cups beef broth and 1 cup red wine (optional). Scrape up any browned bits from the bottom of the pot.",
-                    "Return roast to the pot. Add 1 lb small potatoes (halved) and 1 cup chopped mushrooms.",
-                    "Bring to a simmer, then cover and transfer to a preheated oven at 325°F (160°C). Cook for 2.5 - 3 hours, or until beef is very tender.",
-                    "Add 2 chopped potatoes (peeled) and 1 cup frozen peas. Cook for another 20-30 minutes until potatoes are tender.",
-                    "Remove bay leaf. Season with salt and pepper. Serve hot."
-                ],
-                "ingredients": [
-                    {"name": "beef chuck", "quantity": 1.5, "unit": "lb, cubed"},
-                    {"name": "olive oil", "quantity": 3, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                    {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 3, "unit": "cloves, minced"},
-                    {"name": "dried thyme", "quantity": 1, "unit": "tsp"},
-                    {"name": "bay leaf", "quantity": 1, "unit": ""},
-                    {"name": "beef broth", "quantity": 4, "unit": "cups"},
-                    {"name": "red wine", "quantity": 1, "unit": "cup", "optional": True},
-                    {"name": "tomato paste", "quantity": 1, "unit": "tbsp"},
-                    {"name": "potatoes", "quantity": 2, "unit": "chopped, peeled"},
-                    {"name": "frozen peas", "quantity": 1, "unit": "cup"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f7fa/006064?text=Beef+Stew"
-            },
-            {
-                "name": "Chicken Quesadillas",
-                "cuisine": "Mexican",
-                "category": "Non-Vegetarian",
-                "prep_time": 10,
-                "cook_time": 15,
-                "servings": 2,
-                "instructions": [
-                    "Shred 1 cup cooked chicken breast.",
-                    "Heat a large non-stick skillet over medium heat. Place 1 tortilla in the skillet.",
-                    "Sprinkle half of 1 cup shredded cheddar cheese over one half of the tortilla.",
-                    "Top with half of the shredded chicken and 2 tbsp salsa.",
-                    "Fold the other half of the tortilla over the filling. Cook for 3-4 minutes per side, until golden brown and cheese is melted.",
-                    "Repeat with remaining ingredients for the second quesadilla. Slice and serve with sour cream or guacamole."
-                ],
-                "ingredients": [
-                    {"name": "cooked chicken breast", "quantity": 1, "unit": "cup, shredded"},
-                    {"name": "flour tortillas", "quantity": 2, "unit": "large"},
-                    {"name": "shredded cheddar cheese", "quantity": 1, "unit": "cup"},
-                    {"name": "salsa", "quantity": 4, "unit": "tbsp"},
-                    {"name": "sour cream", "quantity": 1, "unit": "optional"},
-                    {"name": "guacamole", "quantity": 1, "unit": "optional"}
-                ],
-                "image_url": "https://placehold.co/400x300/ffccbc/bf360c?text=Chicken+Quesadilla"
-            },
-            {
-                "name": "Vegetable Frittata",
-                "cuisine": "Italian",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 25,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C).",
-                    "Heat 1 tbsp olive oil in an oven-safe, non-stick skillet over medium heat.",
-                    "Add 1/2 cup chopped onion and 1 cup chopped bell peppers. Sauté for 5 minutes until softened.",
-                    "Add 1 cup chopped spinach and cook until wilted. Remove vegetables from skillet and set aside.",
-                    "In a bowl, whisk together 6 large eggs, 1/4 cup milk, 1/4 cup grated Parmesan cheese, salt, and pepper.",
-                    "Return skillet to low heat. Pour egg mixture into the skillet. Sprinkle cooked vegetables evenly over the eggs.",
-                    "Cook on stovetop for 5 minutes until edges begin to set.",
-                    "Transfer skillet to preheated oven and bake for 15-20 minutes, or until frittata is set and lightly golden."
-                ],
-                "ingredients": [
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 0.5, "unit": "cup, chopped"},
-                    {"name": "bell peppers", "quantity": 1, "unit": "cup, chopped"},
-                    {"name": "spinach", "quantity": 1, "unit": "cup, chopped"},
-                    {"name": "large eggs", "quantity": 6, "unit": ""},
-                    {"name": "milk", "quantity": 0.25, "unit": "cup"},
-                    {"name": "Parmesan cheese", "quantity": 0.25, "unit": "cup, grated"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Veg+Frittata"
-            },
-            {
-                "name": "Simple Garden Salad",
-                "cuisine": "American",
-                "category": "Vegetarian",
-                "prep_time": 10,
-                "cook_time": 0,
-                "servings": 2,
-                "instructions": [
-                    "In a large bowl, combine 4 cups mixed greens, 1/2 cup sliced cucumber, 1/2 cup cherry tomatoes (halved), and 1/4 cup shredded carrots.",
-                    "For the dressing, whisk together 2 tbsp olive oil, 1 tbsp apple cider vinegar, 1 tsp Dijon mustard, salt, and pepper.",
-                    "Pour dressing over salad and toss to coat. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "mixed greens", "quantity": 4, "unit": "cups"},
-                    {"name": "cucumber", "quantity": 0.5, "unit": "cup, sliced"},
-                    {"name": "cherry tomatoes", "quantity": 0.5, "unit": "cup, halved"},
-                    {"name": "shredded carrots", "quantity": 0.25, "unit": "cup"},
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "apple cider vinegar", "quantity": 1, "unit": "tbsp"},
-                    {"name": "Dijon mustard", "quantity": 1, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Garden+Salad"
-            },
-            {
-                "name": "Grilled Cheese Sandwich",
-                "cuisine": "American",
-                "category": "Vegetarian",
-                "prep_time": 2,
-                "cook_time": 8,
-                "servings": 1,
-                "instructions": [
-                    "Butter one side of each of 2 slices of bread.",
-                    "Place one slice of bread, butter-side down, in a non-stick skillet over medium heat.",
-                    "Layer 2 slices of cheddar cheese (or other favorite cheese) on the bread.",
-                    "Place the second slice of bread, butter-side up, on top.",
-                    "Cook for 3-4 minutes per side, or until bread is golden brown and cheese is melted and bubbly."
-                ],
-                "ingredients": [
-                    {"name": "bread slices", "quantity": 2, "unit": ""},
-                    {"name": "butter", "quantity": 1, "unit": "tbsp"},
-                    {"name": "cheddar cheese slices", "quantity": 2, "unit": ""}
-                ],
-                "image_url": "https://placehold.co/400x300/fff8e1/ff8f00?text=Grilled+Cheese"
-            },
-            {
-                "name": "Hummus and Veggie Wraps",
-                "cuisine": "Mediterranean",
-                "category": "Vegetarian",
-                "prep_time": 10,
-                "cook_time": 0,
-                "servings": 2,
-                "instructions": [
-                    "Lay out 2 large whole wheat tortillas.",
-                    "Spread 2-3 tbsp hummus evenly over each tortilla.",
-                    "Layer with 1/2 cup shredded carrots, 1/2 cup chopped cucumber, 1/4 cup chopped bell pepper, and a handful of spinach leaves.",
-                    "Roll up tortillas tightly. Slice in half and serve."
-                ],
-                "ingredients": [
-                    {"name": "whole wheat tortillas", "quantity": 2, "unit": "large"},
-                    {"name": "hummus", "quantity": 6, "unit": "tbsp"},
-                    {"name": "shredded carrots", "quantity": 0.5, "unit": "cup"},
-                    {"name": "chopped cucumber", "quantity": 0.5, "unit": "cup"},
-                    {"name": "chopped bell pepper", "quantity": 0.25, "unit": "cup"},
-                    {"name": "spinach leaves", "quantity": 1, "unit": "handful"}
-                ],
-                "image_url": "https://placehold.co/400x300/ede7f6/512da8?text=Veggie+Wraps"
-            },
-            {
-                "name": "Tuna Salad Sandwich",
-                "cuisine": "American",
-                "category": "Non-Vegetarian",
-                "prep_time": 5,
-                "cook_time": 0,
-                "servings": 1,
-                "instructions": [
-                    "Drain 1 (5 oz) can tuna.",
-                    "In a small bowl, combine drained tuna with 2 tbsp mayonnaise, 1 tbsp finely chopped celery, and 1 tsp relish (optional).",
-                    "Season with salt and pepper to taste. Mix well.",
-                    "Spread tuna salad onto 2 slices of bread. Serve immediately, optionally with lettuce and tomato."
-                ],
-                "ingredients": [
-                    {"name": "tuna", "quantity": 5, "unit": "oz can, drained"},
-                    {"name": "mayonnaise", "quantity": 2, "unit": "tbsp"},
-                    {"name": "celery", "quantity": 1, "unit": "tbsp, finely chopped"},
-                    {"name": "relish", "quantity": 1, "unit": "tsp", "optional": True},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "bread slices", "quantity": 2, "unit": ""}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Tuna+Sandwich"
-            },
-            {
-                "name": "Chicken and Vegetable Skewers",
-                "cuisine": "Grill/BBQ",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 15,
-                "servings": 4,
-                "instructions": [
-                    "Cut 1 lb boneless, skinless chicken breast into 1-inch cubes.",
-                    "Cut 1 bell pepper, 1 zucchini, and 1 red onion into 1-inch pieces.",
-                    "Thread chicken and vegetables onto skewers, alternating them.",
-                    "In a bowl, whisk together 3 tbsp olive oil, 2 minced garlic cloves, 1 tbsp lemon juice, 1 tsp dried oregano, salt, and pepper.",
-                    "Brush skewers generously with the marinade.",
-                    "Preheat grill to medium-high heat. Grill skewers for 10-15 minutes, turning occasionally, until chicken is cooked through and vegetables are tender-crisp."
-                ],
-                "ingredients": [
-                    {"name": "boneless, skinless chicken breast", "quantity": 1, "unit": "lb, cubed"},
-                    {"name": "bell pepper", "quantity": 1, "unit": ""},
-                    {"name": "zucchini", "quantity": 1, "unit": ""},
-                    {"name": "red onion", "quantity": 1, "unit": ""},
-                    {"name": "wooden or metal skewers", "quantity": 8, "unit": ""},
-                    {"name": "olive oil", "quantity": 3, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "lemon juice", "quantity": 1, "unit": "tbsp"},
-                    {"name": "dried oregano", "quantity": 1, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Chicken+Skewers"
-            },
-            {
-                "name": "Quick Black Bean Soup",
-                "cuisine": "Mexican",
-                "category": "Vegetarian",
-                "prep_time": 5,
-                "cook_time": 15,
-                "servings": 2,
-                "instructions": [
-                    "In a medium saucepan, combine 1 (15 oz) can black beans (undrained), 1 cup vegetable broth, 1/4 cup salsa, and 1/2 tsp cumin.",
-                    "Bring to a simmer over medium heat. Cook for 10-12 minutes, stirring occasionally, until heated through and slightly thickened.",
-                    "Use an immersion blender to blend about half of the soup for a creamier texture (optional).",
-                    "Season with salt and pepper. Serve with a dollop of sour cream or chopped avocado."
-                ],
-                "ingredients": [
-                    {"name": "black beans", "quantity": 15, "unit": "oz can, undrained"},
-                    {"name": "vegetable broth", "quantity": 1, "unit": "cup"},
-                    {"name": "salsa", "quantity": 0.25, "unit": "cup"},
-                    {"name": "cumin", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "sour cream or avocado", "quantity": 1, "unit": "optional, for topping"}
-                ],
-                "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Black+Bean+Soup"
-            },
-            {
-                "name": "Spinach and Feta Omelette",
-                "cuisine": "Mediterranean",
-                "category": "Vegetarian",
-                "prep_time": 5,
-                "cook_time": 10,
-                "servings": 1,
-                "instructions": [
-                    "Whisk 2 large eggs with 1 tbsp milk (optional), salt, and pepper in a small bowl.",
-                    "Heat 1 tsp olive oil or butter in a small non-stick skillet over medium heat.",
-                    "Add 1 cup fresh spinach and cook until wilted, about 1-2 minutes. Remove spinach and set aside.",
-                    "Pour egg mixture into the skillet. As eggs set, gently push cooked portions to the center, tilting pan to allow uncooked egg to flow underneath.",
-                    "When eggs are mostly set but still slightly wet on top, sprinkle cooked spinach and 2 tbsp crumbled feta cheese over one half.",
-                    "Fold the other half over. Cook for another minute until cheese is melted. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "large eggs", "quantity": 2, "unit": ""},
-                    {"name": "milk", "quantity": 1, "unit": "tbsp", "optional": True},
-                    {"name": "salt", "quantity": 1, "unit": "pinch"},
-                    {"name": "pepper", "quantity": 1, "unit": "pinch"},
-                    {"name": "olive oil or butter", "quantity": 1, "unit": "tsp"},
-                    {"name": "fresh spinach", "quantity": 1, "unit": "cup"},
-                    {"name": "feta cheese", "quantity": 2, "unit": "tbsp, crumbled"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Spinach+Omelette"
-            },
-            {
-                "name": "Teriyaki Chicken",
-                "cuisine": "Asian",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 20,
-                "servings": 4,
-                "instructions": [
-                    "Cut 1 lb boneless, skinless chicken thighs or breasts into 1-inch pieces.",
-                    "In a bowl, whisk together 1/2 cup soy sauce, 2 tbsp honey or brown sugar, 1 tbsp rice vinegar, 1 tsp grated ginger, 1 minced garlic clove, and 1 tsp sesame oil.",
-                    "Add chicken to marinade and toss to coat. Marinate for at least 15 minutes (or up to 30 mins).",
-                    "Heat 1 tbsp vegetable oil in a large skillet over medium-high heat. Add chicken and cook until browned on all sides and cooked through. Pour remaining marinade over chicken and bring to a simmer.",
-                    "Cook for 2-3 minutes, stirring, until sauce thickens and coats the chicken. Garnish with sesame seeds and chopped green onions. Serve with rice."
-                ],
-                "ingredients": [
-                    {"name": "boneless, skinless chicken thighs or breasts", "quantity": 1, "unit": "lb"},
-                    {"name": "soy sauce", "quantity": 0.5, "unit": "cup"},
-                    {"name": "honey or brown sugar", "quantity": 2, "unit": "tbsp"},
-                    {"name": "rice vinegar", "quantity": 1, "unit": "tbsp"},
-                    {"name": "grated ginger", "quantity": 1, "unit": "tsp"},
-                    {"name": "garlic", "quantity": 1, "unit": "clove, minced"},
-                    {"name": "sesame oil", "quantity": 1, "unit": "tsp"},
-                    {"name": "vegetable oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "sesame seeds", "quantity": 1, "unit": "optional, for garnish"},
-                    {"name": "green onions", "quantity": 1, "unit": "optional, chopped, for garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Teriyaki+Chicken"
-            },
-            {
-                "name": "Vegetarian Lentil Shepherd's Pie",
-                "cuisine": "British",
-                "category": "Vegetarian",
-                "prep_time": 25,
-                "cook_time": 45,
-                "servings": 6,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C).",
-                    "For filling: Heat 1 tbsp olive oil in a large pot. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks. Sauté for 7-10 minutes.",
-                    "Add 2 minced garlic cloves, 1 cup cooked green lentils, 1 (14.5 oz) can diced tomatoes, 1 cup vegetable broth, 1 tbsp tomato paste, 1 tsp dried thyme, and 1/2 tsp dried rosemary.",
-                    "Bring to a simmer, reduce heat, and cook for 15 minutes, stirring occasionally, until thickened.",
-                    "For topping: Boil 2 lbs potatoes (peeled and chopped) until very tender. Drain and mash with 1/4 cup milk, 2 tbsp butter, salt, and pepper.",
-                    "Pour lentil filling into a 9x13 inch baking dish. Spread mashed potatoes evenly over the top.",
-                    "Bake for 25-30 minutes, or until topping is golden and filling is bubbly."
-                ],
-                "ingredients": [
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                    {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "cooked green lentils", "quantity": 1, "unit": "cup"},
-                    {"name": "diced tomatoes", "quantity": 14.5, "unit": "oz can"},
-                    {"name": "vegetable broth", "quantity": 1, "unit": "cup"},
-                    {"name": "tomato paste", "quantity": 1, "unit": "tbsp"},
-                    {"name": "dried thyme", "quantity": 1, "unit": "tsp"},
-                    {"name": "dried rosemary", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "potatoes", "quantity": 2, "unit": "lbs, peeled and chopped"},
-                    {"name": "milk", "quantity": 0.25, "unit": "cup"},
-                    {"name": "butter", "quantity": 2, "unit": "tbsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Lentil+Shepherd's+Pie"
-            },
-            {
-                "name": "Chicken Caesar Salad",
-                "cuisine": "American",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 10,
-                "servings": 2,
-                "instructions": [
-                    "Cook 8 oz chicken breast (grilled or pan-fried) until cooked through. Slice into strips.",
-                    "In a large bowl, combine 4 cups chopped romaine lettuce, 1/2 cup croutons, and 1/4 cup grated Parmesan cheese.",
-                    "Add Caesar dressing and toss to coat.",
-                    "Top with sliced chicken breast. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "chicken breast", "quantity": 8, "unit": "oz, cooked"},
-                    {"name": "romaine lettuce", "quantity": 4, "unit": "cups, chopped"},
-                    {"name": "croutons", "quantity": 0.5, "unit": "cup"},
-                    {"name": "Parmesan cheese", "quantity": 0.25, "unit": "cup, grated"},
-                    {"name": "Caesar dressing", "quantity": 0.5, "unit": "cup"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Chicken+Caesar+Salad"
-            },
-            {
-                "name": "Thai Green Curry",
-                "cuisine": "Thai",
-                "category": "Non-Vegetarian",
-                "prep_time": 20,
-                "cook_time": 30,
-                "servings": 4,
-                "instructions": [
-                    "Heat 1 tbsp vegetable oil in a large pot or wok. Add 2 tbsp green curry paste and cook for 1 minute until fragrant.",
-                    "Stir in 1 (13.5 oz) can full-fat coconut milk and 1/2 cup chicken or vegetable broth. Bring to a simmer.",
-                    "Add 1 lb boneless, skinless chicken thighs (cut into bite-sized pieces) or firm tofu cubes. Cook for 10-12 minutes until cooked through.",
-                    "Add 1 cup chopped bell peppers, 1 cup bamboo shoots (sliced), and 1 cup snap peas. Cook for 5-7 minutes until vegetables are tender-crisp.",
-                    "Stir in 1 tbsp fish sauce (or soy sauce for vegetarian), 1 tsp brown sugar, and juice of 1 lime.",
-                    "Garnish with fresh basil leaves and serve hot over jasmine rice."
-                ],
-                "ingredients": [
-                    {"name": "vegetable oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "green curry paste", "quantity": 2, "unit": "tbsp"},
-                    {"name": "full-fat coconut milk", "quantity": 13.5, "unit": "oz can"},
-                    {"name": "chicken or vegetable broth", "quantity": 0.5, "unit": "cup"},
-                    {"name": "boneless, skinless chicken thighs or firm tofu", "quantity": 1, "unit": "lb"},
-                    {"name": "bell peppers", "quantity": 1, "unit": "cup, chopped"},
-                    {"name": "bamboo shoots", "quantity": 1, "unit": "cup, sliced"},
-                    {"name": "snap peas", "quantity": 1, "unit": "cup"},
-                    {"name": "fish sauce", "quantity": 1, "unit": "tbsp"},
-                    {"name": "brown sugar", "quantity": 1, "unit": "tsp"},
-                    {"name": "lime juice", "quantity": 1, "unit": "from 1 lime"},
-                    {"name": "fresh basil leaves", "quantity": 1, "unit": "for garnish"},
-                    {"name": "jasmine rice", "quantity": 1, "unit": "to serve"}
-                ],
-                "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Thai+Green+Curry"
-            },
-            {
-                "name": "Classic Macaroni and Cheese",
-                "cuisine": "American",
-                "category": "Vegetarian",
-                "prep_time": 10,
-                "cook_time": 25,
-                "servings": 4,
-                "instructions": [
-                    "Cook 8 oz elbow macaroni according to package directions. Drain.",
-                    "In a large saucepan, melt 3 tbsp butter over medium heat. Whisk in 3 tbsp all-purpose flour and cook for 1 minute.",
-                    "Gradually whisk in 2 cups milk until smooth. Bring to a simmer, whisking constantly, until sauce thickens, about 5 minutes.",
-                    "Remove from heat. Stir in 2 cups shredded cheddar cheese and 1/2 cup grated Gruyère or Parmesan cheese until melted and smooth.",
-                    "Add cooked macaroni to the cheese sauce and stir to combine. Season with salt and pepper to taste.",
-                    "Serve immediately, or transfer to a baking dish, top with breadcrumbs, and bake at 375°F (190°C) for 15 minutes for a baked mac and cheese."
-                ],
-                "ingredients": [
-                    {"name": "elbow macaroni", "quantity": 8, "unit": "oz"},
-                    {"name": "butter", "quantity": 3, "unit": "tbsp"},
-                    {"name": "all-purpose flour", "quantity": 3, "unit": "tbsp"},
-                    {"name": "milk", "quantity": 2, "unit": "cups"},
-                    {"name": "shredded cheddar cheese", "quantity": 2, "unit": "cups"},
-                    {"name": "Gruyère or Parmesan cheese", "quantity": 0.5, "unit": "cup, grated"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "breadcrumbs", "quantity": 1, "unit": "optional, for topping"}
-                ],
-                "image_url": "https://placehold.co/400x300/fff8e1/ff8f00?text=Mac+Cheese"
-            },
-            {
-                "name": "Chicken Fajitas",
-                "cuisine": "Mexican",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 20,
-                "servings": 4,
-                "instructions": [
-                    "Slice 1.5 lbs chicken breast into thin strips.",
-                    "Slice 2 bell peppers (different colors) and 1 onion into thin strips.",
-                    "In a large bowl, toss chicken and vegetables with 2 tbsp olive oil and 1 packet (1 oz) fajita seasoning.",
-                    "Heat a large cast-iron skillet or heavy-bottomed pan over medium-high heat until very hot.",
-                    "Add chicken and vegetables to the hot skillet in a single layer. Cook for 5-7 minutes, stirring occasionally, until chicken is cooked through and vegetables are tender-crisp and slightly charred.",
-                    "Serve immediately with warm tortillas and desired toppings like salsa, guacamole, and sour cream."
-                ],
-                "ingredients": [
-                    {"name": "chicken breast", "quantity": 1.5, "unit": "lbs, sliced"},
-                    {"name": "bell peppers", "quantity": 2, "unit": "sliced"},
-                    {"name": "onion", "quantity": 1, "unit": "sliced"},
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "fajita seasoning", "quantity": 1, "unit": "packet (1 oz)"},
-                    {"name": "tortillas", "quantity": 8, "unit": "warm"},
-                    {"name": "salsa", "quantity": 1, "unit": "optional"},
-                    {"name": "guacamole", "quantity": 1, "unit": "optional"},
-                    {"name": "sour cream", "quantity": 1, "unit": "optional"}
-                ],
-                "image_url": "https://placehold.co/400x300/ffccbc/bf360c?text=Chicken+Fajitas"
-            },
-            {
-                "name": "Simple Tomato Pasta",
-                "cuisine": "Italian",
-                "category": "Vegetarian",
-                "prep_time": 5,
-                "cook_time": 20,
-                "servings": 2,
-                "instructions": [
-                    "Cook 8 oz spaghetti or preferred pasta according to package directions. Reserve 1/2 cup pasta water. Drain.",
-                    "While pasta cooks, heat 1 tbsp olive oil in a large skillet over medium heat. Add 3 minced garlic cloves and cook for 1 minute until fragrant.",
-                    "Stir in 1 (14.5 oz) can crushed tomatoes and 1/2 tsp dried oregano. Bring to a simmer.",
-                    "Reduce heat and cook for 10-15 minutes, stirring occasionally, until sauce is slightly thickened.",
-                    "Add drained pasta to the skillet. Toss to coat, adding reserved pasta water as needed to reach desired consistency.",
-                    "Stir in 1/4 cup fresh basil leaves (chopped). Season with salt and pepper. Serve with grated Parmesan cheese."
-                ],
-                "ingredients": [
-                    {"name": "spaghetti or pasta", "quantity": 8, "unit": "oz"},
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 3, "unit": "cloves, minced"},
-                    {"name": "crushed tomatoes", "quantity": 14.5, "unit": "oz can"},
-                    {"name": "dried oregano", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "fresh basil leaves", "quantity": 0.25, "unit": "cup, chopped"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "Parmesan cheese", "quantity": 1, "unit": "optional, for serving"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Tomato+Pasta"
-            },
-            {
-                "name": "Chicken and Rice Soup",
-                "cuisine": "Comfort Food",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 35,
-                "servings": 6,
-                "instructions": [
-                    "Heat 1 tbsp olive oil in a large pot. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks. Sauté for 5-7 minutes.",
-                    "Add 2 minced garlic cloves and cook for 1 minute.",
-                    "Pour in 8 cups chicken broth and 1 cup cooked shredded chicken. Bring to a simmer.",
-                    "Add 1 cup chopped potatoes (peeled) and 1/2 cup uncooked white rice.",
-                    "Cook for 20-25 minutes, or until rice is tender.",
-                    "Season with salt, pepper, and fresh parsley. Serve hot."
-                ],
-                "ingredients": [
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                    {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "chicken broth", "quantity": 8, "unit": "cups"},
-                    {"name": "cooked shredded chicken", "quantity": 1, "unit": "cup"},
-                    {"name": "uncooked white rice", "quantity": 0.5, "unit": "cup"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "fresh parsley", "quantity": 1, "unit": "for garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Chicken+Rice+Soup"
-            },
-            {
-                "name": "Classic Pot Roast",
-                "cuisine": "American",
-                "category": "Non-Vegetarian",
-                "prep_time": 20,
-                "cook_time": 180,
-                "servings": 6,
-                "instructions": [
-                    "Pat 3 lbs beef chuck roast dry. Season generously with salt and pepper.",
-                    "Heat 2 tbsp olive oil in a large Dutch oven over medium-high heat. Brown roast on all sides.",
-                    "Remove roast. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks to the pot. Sauté for 5 minutes.",
-                    "Stir in 3 minced garlic cloves, 1 tbsp tomato paste, and 1 tsp dried thyme. Cook for 1 minute.",
-                    "Pour in 2 cups beef broth and 1 cup red wine (optional). Scrape up any browned bits from the bottom of the pot.",
-                    "Return roast to the pot. Add 1 lb small potatoes (halved) and 1 cup chopped mushrooms.",
-                    "Bring to a simmer, then cover and transfer to a preheated oven at 325°F (160°C). Cook for 2.5 - 3 hours, or until beef is fork-tender.",
-                    "Add 2 chopped potatoes (peeled) and 1 cup frozen peas. Cook for another 20-30 minutes until potatoes are tender.",
-                    "Remove bay leaf. Season with salt and pepper. Serve hot."
-                ],
-                "ingredients": [
-                    {"name": "beef chuck roast", "quantity": 3, "unit": "lbs"},
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                    {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 3, "unit": "cloves, minced"},
-                    {"name": "tomato paste", "quantity": 1, "unit": "tbsp"},
-                    {"name": "dried thyme", "quantity": 1, "unit": "tsp"},
-                    {"name": "beef broth", "quantity": 2, "unit": "cups"},
-                    {"name": "red wine", "quantity": 1, "unit": "cup", "optional": True},
-                    {"name": "small potatoes", "quantity": 1, "unit": "lb, halved"},
-                    {"name": "mushrooms", "quantity": 1, "unit": "cup, chopped"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "cornstarch", "quantity": 1, "unit": "optional, for thickening"}
-                ],
-                "image_url": "https://placehold.co/400x300/c8e6c9/2e7d32?text=Pot+Roast"
-            },
-            {
-                "name": "Chicken Pad Thai",
-                "cuisine": "Thai",
-                "category": "Non-Vegetarian",
-                "prep_time": 25,
-                "cook_time": 20,
-                "servings": 2,
-                "instructions": [
-                    "Soak 6 oz dried flat rice noodles in hot water for 15-20 minutes until tender but still firm. Drain.",
-                    "Slice 8 oz chicken breast into thin strips.",
-                    "In a bowl, whisk together 2 tbsp fish sauce, 2 tbsp brown sugar, 1 tbsp rice vinegar, 1 tbsp lime juice, and 1 tsp sriracha (optional).",
-                    "Add chicken to marinade and toss to coat. Marinate for at least 15 minutes (or up to 30 mins).",
-                    "Heat 1 tbsp vegetable oil in a large wok or skillet over high heat. Add chicken and cook until browned and cooked through. Push chicken to one side.",
-                    "Add 2 minced garlic cloves and 1/4 cup chopped shallots (or red onion) to the empty side and cook for 1 minute.",
-                    "Push everything to one side. Crack 1 large egg into the empty side and scramble until cooked. Mix with other ingredients.",
-                    "Add drained noodles to the wok. Pour sauce over noodles. Toss constantly for 2-3 minutes until noodles are coated.",
-                    "Stir in 1 cup bean sprouts and 1/4 cup chopped peanuts. Serve immediately with extra lime wedges and cilantro."
-                ],
-                "ingredients": [
-                    {"name": "dried flat rice noodles", "quantity": 6, "unit": "oz"},
-                    {"name": "chicken breast", "quantity": 8, "unit": "oz, sliced"},
-                    {"name": "fish sauce", "quantity": 2, "unit": "tbsp"},
-                    {"name": "brown sugar", "quantity": 2, "unit": "tbsp"},
-                    {"name": "rice vinegar", "quantity": 1, "unit": "tbsp"},
-                    {"name": "lime juice", "quantity": 1, "unit": "tbsp"},
-                    {"name": "sriracha", "quantity": 1, "unit": "tsp", "optional": True},
-                    {"name": "vegetable oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "chopped shallots or red onion", "quantity": 0.25, "unit": "cup"},
-                    {"name": "large egg", "quantity": 1, "unit": ""},
-                    {"name": "bean sprouts", "quantity": 1, "unit": "cup"},
-                    {"name": "chopped peanuts", "quantity": 0.25, "unit": "cup"},
-                    {"name": "lime wedges", "quantity": 1, "unit": "for serving"},
-                    {"name": "cilantro", "quantity": 1, "unit": "for garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Chicken+Pad+Thai"
-            },
-            {
-                "name": "Veggie Burgers",
-                "cuisine": "Vegetarian",
-                "category": "Vegetarian",
-                "prep_time": 20,
-                "cook_time": 15,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C) or prepare grill/skillet.",
-                    "In a large bowl, combine 1 can (15oz) black beans (mashed), 1 cup cooked quinoa, 1/2 cup breadcrumbs, 1/4 cup finely chopped onion, 1 large egg, 1 tbsp soy sauce, 1 tsp smoked paprika, and 1/2 tsp garlic powder.",
-                    "Mix well until combined. Form into 4 patties.",
-                    "Bake for 10-12 minutes per side, or cook in a lightly oiled skillet/grill until browned and heated through.",
-                    "Serve on buns with desired toppings."
-                ],
-                "ingredients": [
-                    {"name": "black beans", "quantity": 15, "unit": "oz can, rinsed and mashed"},
-                    {"name": "cooked quinoa", "quantity": 1, "unit": "cup"},
-                    {"name": "breadcrumbs", "quantity": 0.5, "unit": "cup"},
-                    {"name": "onion", "quantity": 0.25, "unit": "cup, finely chopped"},
-                    {"name": "large egg", "quantity": 1, "unit": ""},
-                    {"name": "soy sauce", "quantity": 1, "unit": "tbsp"},
-                    {"name": "smoked paprika", "quantity": 1, "unit": "tsp"},
-                    {"name": "garlic powder", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "burger buns", "quantity": 4, "unit": ""}
-                ],
-                "image_url": "https://placehold.co/400x300/c8e6c9/2e7d32?text=Veggie+Burger"
-            },
-            {
-                "name": "Chicken Lettuce Wraps",
-                "cuisine": "Asian",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 15,
-                "servings": 4,
-                "instructions": [
-                    "Heat 1 tbsp sesame oil in a large skillet or wok over medium-high heat. Add 1 lb ground chicken and cook until browned. Drain excess fat.",
-                    "Stir in 1/4 cup hoisin sauce, 2 tbsp soy sauce, 1 tbsp rice vinegar, 1 tbsp grated ginger, and 2 minced garlic cloves. Cook for 2-3 minutes.",
-                    "Add 1/2 cup finely chopped water chestnuts and 1/2 cup shredded carrots. Cook for 3-5 minutes until heated through.",
-                    "Serve warm mixture in large lettuce cups (e.g., butter lettuce or iceberg). Garnish with chopped green onions and sesame seeds."
-                ],
-                "ingredients": [
-                    {"name": "sesame oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "ground chicken", "quantity": 1, "unit": "lb"},
-                    {"name": "hoisin sauce", "quantity": 0.25, "unit": "cup"},
-                    {"name": "soy sauce", "quantity": 2, "unit": "tbsp"},
-                    {"name": "rice vinegar", "quantity": 1, "unit": "tbsp"},
-                    {"name": "grated ginger", "quantity": 1, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "water chestnuts", "quantity": 0.5, "unit": "cup, finely chopped"},
-                    {"name": "shredded carrots", "quantity": 0.5, "unit": "cup"},
-                    {"name": "lettuce cups", "quantity": 1, "unit": "large head"},
-                    {"name": "green onions", "quantity": 1, "unit": "for garnish"},
-                    {"name": "sesame seeds", "quantity": 1, "unit": "for garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Chicken+Lettuce+Wraps"
-            },
-            {
-                "name": "Creamy Tomato Soup",
-                "cuisine": "European",
-                "category": "Vegetarian",
-                "prep_time": 10,
-                "cook_time": 25,
-                "servings": 4,
-                "instructions": [
-                    "Melt 2 tbsp butter in a large pot. Add 1 chopped onion and cook until softened.",
-                    "Stir in 1 minced garlic clove and cook for 1 minute.",
-                    "Add 28 oz can crushed tomatoes, 4 cups vegetable broth, 1 tsp sugar, and 1/2 tsp dried basil.",
-                    "Bring to a simmer, then reduce heat and cook for 15-20 minutes.",
-                    "Blend with an immersion blender until smooth (or transfer to a regular blender).",
-                    "Stir in 1/2 cup heavy cream. Season with salt and pepper to taste. Serve hot."
-                ],
-                "ingredients": [
-                    {"name": "butter", "quantity": 2, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 1, "unit": "clove, minced"},
-                    {"name": "crushed tomatoes", "quantity": 28, "unit": "oz can"},
-                    {"name": "vegetable broth", "quantity": 4, "unit": "cups"},
-                    {"name": "sugar", "quantity": 1, "unit": "tsp"},
-                    {"name": "dried basil", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "heavy cream", "quantity": 0.5, "unit": "cup"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/fff3e0/e65100?text=Creamy+Tomato+Soup"
-            },
-            {
-                "name": "Chicken Enchiladas",
-                "cuisine": "Mexican",
-                "category": "Non-Vegetarian",
-                "prep_time": 20,
-                "cook_time": 25,
-                "servings": 6,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C).",
-                    "In a bowl, combine 2 cups cooked shredded chicken, 1 cup shredded Monterey Jack cheese, and 1/2 cup green chilies (canned, diced).",
-                    "Spread 1/2 cup enchilada sauce in the bottom of a 9x13 inch baking dish.",
-                    "Warm 12 corn tortillas slightly to make them pliable. Fill each tortilla with chicken mixture and roll up tightly.",
-                    "Place seam-side down in the baking dish. Pour remaining enchilada sauce over enchiladas and sprinkle with 1 cup shredded cheddar cheese.",
-                    "Bake for 20-25 minutes, or until cheese is bubbly and lightly browned. Garnish with fresh cilantro and serve."
-                ],
-                "ingredients": [
-                    {"name": "cooked shredded chicken", "quantity": 2, "unit": "cups"},
-                    {"name": "shredded Monterey Jack cheese", "quantity": 1, "unit": "cup"},
-                    {"name": "green chilies", "quantity": 0.5, "unit": "cup, canned, diced"},
-                    {"name": "enchilada sauce", "quantity": 1, "unit": "can (19 oz)"},
-                    {"name": "corn tortillas", "quantity": 12, "unit": ""},
-                    {"name": "shredded cheddar cheese", "quantity": 1, "unit": "cup"},
-                    {"name": "fresh cilantro", "quantity": 1, "unit": "for garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/ffccbc/bf360c?text=Chicken+Enchiladas"
-            },
-            {
-                "name": "Spinach Salad with Poppy Seed Dressing",
-                "cuisine": "American",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 0,
-                "servings": 4,
-                "instructions": [
-                    "In a large bowl, combine 6 cups fresh spinach, 1/2 cup sliced strawberries, 1/4 cup sliced red onion, and 1/4 cup crumbled feta cheese (optional).",
-                    "For the dressing: In a small jar or bowl, whisk together 1/4 cup olive oil, 2 tbsp apple cider vinegar, 1 tbsp honey, 1 tsp Dijon mustard, 1 tsp poppy seeds, salt, and pepper.",
-                    "Pour dressing over salad and toss gently to coat. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "fresh spinach", "quantity": 6, "unit": "cups"},
-                    {"name": "sliced strawberries", "quantity": 0.5, "unit": "cup"},
-                    {"name": "sliced red onion", "quantity": 0.25, "unit": "cup"},
-                    {"name": "feta cheese", "quantity": 0.25, "unit": "cup, crumbled", "optional": True},
-                    {"name": "olive oil", "quantity": 0.25, "unit": "cup"},
-                    {"name": "apple cider vinegar", "quantity": 2, "unit": "tbsp"},
-                    {"name": "honey", "quantity": 1, "unit": "tbsp"},
-                    {"name": "Dijon mustard", "quantity": 1, "unit": "tsp"},
-                    {"name": "poppy seeds", "quantity": 1, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Spinach+Salad"
-            },
-            {
-                "name": "Stuffed Bell Peppers",
-                "cuisine": "Mediterranean",
-                "category": "Non-Vegetarian", # Can also be vegetarian if using plant-based mince
-                "prep_time": 20,
-                "cook_time": 40,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C).",
-                    "Halve 4 bell peppers lengthwise and remove seeds. Place cut-side up in a baking dish.",
-                    "In a bowl, combine 1 lb cooked ground beef or turkey, 1 cup cooked rice, 1/2 cup chopped onion, 1/2 cup chopped tomatoes, 1/4 cup tomato sauce, 1 tsp Italian seasoning, salt, and pepper.",
-                    "Spoon mixture evenly into bell pepper halves.",
-                    "Pour 1/2 inch water into the bottom of the baking dish.",
-                    "Bake for 30-35 minutes, or until peppers are tender and filling is heated through. Optionally top with cheese for last 5 minutes."
-                ],
-                "ingredients": [
-                    {"name": "bell peppers", "quantity": 4, "unit": ""},
-                    {"name": "cooked ground beef or turkey", "quantity": 1, "unit": "lb"},
-                    {"name": "cooked rice", "quantity": 1, "unit": "cup"},
-                    {"name": "chopped onion", "quantity": 0.5, "unit": "cup"},
-                    {"name": "chopped tomatoes", "quantity": 0.5, "unit": "cup"},
-                    {"name": "tomato sauce", "quantity": 0.25, "unit": "cup"},
-                    {"name": "Italian seasoning", "quantity": 1, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "shredded cheese", "quantity": 1, "unit": "optional"}
-                ],
-                "image_url": "https://placehold.co/400x300/c8e6c9/2e7d32?text=Stuffed+Peppers"
-            },
-            {
-                "name": "Baked Ziti",
-                "cuisine": "Italian",
-                "category": "Vegetarian",
-                "prep_time": 20,
-                "cook_time": 30,
-                "servings": 6,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C).",
-                    "Cook 12 oz ziti pasta according to package directions until al dente. Drain.",
-                    "In a large bowl, combine cooked ziti, 1 (24 oz) jar marinara sauce, 15 oz ricotta cheese, 1 large egg, 1/2 cup grated Parmesan cheese, and 1/4 cup chopped fresh parsley.",
-                    "Stir well to combine all ingredients.",
-                    "Pour half of the ziti mixture into a 9x13 inch baking dish. Top with 1 cup shredded mozzarella cheese.",
-                    "Add remaining ziti mixture and top with another 1 cup shredded mozzarella cheese.",
-                    "Bake for 25-30 minutes, or until bubbly and cheese is melted and lightly golden. Let stand 5 minutes before serving."
-                ],
-                "ingredients": [
-                    {"name": "ziti pasta", "quantity": 12, "unit": "oz"},
-                    {"name": "marinara sauce", "quantity": 24, "unit": "oz jar"},
-                    {"name": "ricotta cheese", "quantity": 15, "unit": "oz"},
-                    {"name": "large egg", "quantity": 1, "unit": ""},
-                    {"name": "Parmesan cheese", "quantity": 0.5, "unit": "cup, grated"},
-                    {"name": "fresh parsley", "quantity": 0.25, "unit": "cup, chopped"},
-                    {"name": "shredded mozzarella cheese", "quantity": 2, "unit": "cups"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Baked+Ziti"
-            },
-            {
-                "name": "Chicken Tenders",
-                "cuisine": "American",
-                "category": "Non-Vegetarian",
-                "prep_time": 10,
-                "cook_time": 15,
-                "servings": 2,
-                "instructions": [
-                    "Preheat oven to 400°F (200°C).",
-                    "Pat 1 lb chicken tenderloins dry.",
-                    "In a shallow dish, whisk 1 large egg. In another shallow dish, combine 1 cup breadcrumbs, 1/2 tsp garlic powder, 1/2 tsp paprika, salt, and pepper.",
-                    "Dip each chicken tenderloin in egg, then dredge in breadcrumb mixture, pressing to coat.",
-                    "Place coated chicken on a baking sheet. Spray lightly with cooking spray or drizzle with oil.",
-                    "Bake for 12-15 minutes, flipping halfway, until golden brown and cooked through."
-                ],
-                "ingredients": [
-                    {"name": "chicken tenderloins", "quantity": 1, "unit": "lb"},
-                    {"name": "large egg", "quantity": 1, "unit": ""},
-                    {"name": "breadcrumbs", "quantity": 1, "unit": "cup"},
-                    {"name": "garlic powder", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "paprika", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "cooking spray or oil", "quantity": 1, "unit": "for baking"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Chicken+Tenders"
-            },
-            {
-                "name": "Shrimp Scampi",
-                "cuisine": "Italian",
-                "category": "Non-Vegetarian",
-                "prep_time": 10,
-                "cook_time": 15,
-                "servings": 2,
-                "instructions": [
-                    "Cook 8 oz linguine or spaghetti according to package directions. Reserve 1/2 cup pasta water. Drain.",
-                    "Pat 1 lb shrimp (peeled and deveined) dry. Season with salt and pepper.",
-                    "Heat 2 tbsp olive oil and 2 tbsp butter in a large skillet over medium heat. Add 4 minced garlic cloves and 1 minute until fragrant.",
-                    "Add shrimp and cook for 2-3 minutes per side until pink and opaque. Remove shrimp.",
-                    "Add 1/4 cup dry white wine or chicken broth to the skillet. Bring to a simmer and scrape up any browned bits.",
-                    "Stir in 2 tbsp lemon juice and 2 tbsp chopped fresh parsley. Return shrimp to skillet. Add drained pasta.",
-                    "Toss everything together, adding reserved pasta water as needed to create a light sauce. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "linguine or spaghetti", "quantity": 8, "unit": "oz"},
-                    {"name": "shrimp", "quantity": 1, "unit": "lb, peeled and deveined"},
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "butter", "quantity": 2, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 4, "unit": "cloves, minced"},
-                    {"name": "dry white wine or chicken broth", "quantity": 0.25, "unit": "cup"},
-                    {"name": "lemon juice", "quantity": 2, "unit": "tbsp"},
-                    {"name": "fresh parsley", "quantity": 2, "unit": "tbsp, chopped"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Shrimp+Scampi"
-            },
-            {
-                "name": "Simple Tomato Cucumber Salad",
-                "cuisine": "Mediterranean",
-                "category": "Vegetarian",
-                "prep_time": 10,
-                "cook_time": 0,
-                "servings": 2,
-                "instructions": [
-                    "Dice 2 medium tomatoes and 1 large cucumber.",
-                    "In a bowl, combine diced tomatoes and cucumber with 1/4 cup finely chopped red onion and 1/4 cup chopped fresh parsley.",
-                    "For the dressing, whisk together 2 tbsp olive oil, 1 tbsp lemon juice, and a pinch of salt and pepper.",
-                    "Pour dressing over vegetables and toss gently to combine. Serve immediately as a side dish."
-                ],
-                "ingredients": [
-                    {"name": "medium tomatoes", "quantity": 2, "unit": ""},
-                    {"name": "large cucumber", "quantity": 1, "unit": ""},
-                    {"name": "red onion", "quantity": 0.25, "unit": "cup, finely chopped"},
-                    {"name": "fresh parsley", "quantity": 0.25, "unit": "cup, chopped"},
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "lemon juice", "quantity": 1, "unit": "tbsp"},
-                    {"name": "salt", "quantity": 1, "unit": "pinch"},
-                    {"name": "pepper", "quantity": 1, "unit": "pinch"}
-                ],
-                "image_url": "https://placehold.co/400x300/e8f5e9/33691e?text=Tomato+Cucumber+Salad"
-            },
-            {
-                "name": "Breakfast Burritos",
-                "cuisine": "Mexican",
-                "category": "Vegetarian",
-                "prep_time": 10,
-                "cook_time": 15,
-                "servings": 2,
-                "instructions": [
-                    "Scramble 4 large eggs in a bowl with a pinch of salt and pepper. Cook in a lightly oiled skillet until set. Remove.",
-                    "In the same skillet, cook 1/2 cup diced cooked potatoes or frozen hash browns until browned and crispy.",
-                    "Warm 2 large flour tortillas.",
-                    "On each tortilla, layer scrambled eggs, cooked potatoes, 1/4 cup shredded cheddar cheese, and 2 tbsp salsa.",
-                    "Fold in the sides of the tortilla, then roll up tightly. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "large eggs", "quantity": 4, "unit": ""},
-                    {"name": "salt", "quantity": 1, "unit": "pinch"},
-                    {"name": "pepper", "quantity": 1, "unit": "pinch"},
-                    {"name": "cooked diced potatoes or hash browns", "quantity": 0.5, "unit": "cup"},
-                    {"name": "large flour tortillas", "quantity": 2, "unit": ""},
-                    {"name": "shredded cheddar cheese", "quantity": 0.5, "unit": "cup"},
-                    {"name": "salsa", "quantity": 4, "unit": "tbsp"}
-                ],
-                "image_url": "https://placehold.co/400x300/ffccbc/bf360c?text=Breakfast+Burrito"
-            },
-            {
-                "name": "Vegetable Fried Rice",
-                "cuisine": "Asian",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 15,
-                "servings": 2,
-                "instructions": [
-                    "Heat 1 tbsp vegetable oil in a large wok or skillet over high heat.",
-                    "Add 1/2 cup diced carrots and 1/2 cup frozen peas. Stir-fry for 3-4 minutes until tender-crisp.",
-                    "Push vegetables to one side. Add 1 tbsp oil to the empty side. Crack 1 large egg into the empty side and scramble until cooked. Mix with vegetables.",
-                    "Add 2 cups cooked day-old rice to the wok. Break up any clumps.",
-                    "Pour 2 tbsp soy sauce and 1 tsp sesame oil over the rice. Stir-fry for 5-7 minutes, breaking up rice and tossing, until heated through and slightly browned.",
-                    "Stir in 2 chopped green onions. Serve hot."
-                ],
-                "ingredients": [
-                    {"name": "vegetable oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "diced carrots", "quantity": 0.5, "unit": "cup"},
-                    {"name": "frozen peas", "quantity": 0.5, "unit": "cup"},
-                    {"name": "large egg", "quantity": 1, "unit": ""},
-                    {"name": "cooked day-old rice", "quantity": 2, "unit": "cups"},
-                    {"name": "soy sauce", "quantity": 2, "unit": "tbsp"},
-                    {"name": "sesame oil", "quantity": 1, "unit": "tsp"},
-                    {"name": "green onions", "quantity": 2, "unit": "chopped"}
-                ],
-                "image_url": "https://placehold.co/400x300/fffde7/f57f17?text=Veg+Fried+Rice"
-            },
-            {
-                "name": "Cream of Mushroom Soup",
-                "cuisine": "European",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 30,
-                "servings": 4,
-                "instructions": [
-                    "Melt 2 tbsp butter in a large pot over medium heat. Add 1 lb sliced mushrooms and cook until browned and tender, about 8-10 minutes. Remove half of the mushrooms and set aside.",
-                    "Add 1 chopped onion to the pot and cook until softened, about 5 minutes.",
-                    "Stir in 2 minced garlic cloves and cook for 1 minute.",
-                    "Whisk in 1/4 cup all-purpose flour and cook for 1 minute.",
-                    "Gradually whisk in 4 cups vegetable or chicken broth and 1 cup milk (or cream). Bring to a simmer, whisking constantly, until thickened.",
-                    "Season with salt, pepper, and 1/2 tsp dried thyme. If desired, blend half of the soup with an immersion blender for a creamier texture.",
-                    "Return reserved mushrooms to the pot. Heat through and serve hot."
-                ],
-                "ingredients": [
-                    {"name": "butter", "quantity": 2, "unit": "tbsp"},
-                    {"name": "sliced mushrooms", "quantity": 1, "unit": "lb"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "all-purpose flour", "quantity": 0.25, "unit": "cup"},
-                    {"name": "vegetable or chicken broth", "quantity": 4, "unit": "cups"},
-                    {"name": "milk or cream", "quantity": 1, "unit": "cup"},
-                    {"name": "dried thyme", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/ede7f6/512da8?text=Mushroom+Soup"
-            },
-            {
-                "name": "Chicken BLT Sandwich",
-                "cuisine": "American",
-                "category": "Non-Vegetarian",
-                "prep_time": 10,
-                "cook_time": 10,
-                "servings": 1,
-                "instructions": [
-                    "Cook 3-4 slices of bacon until crispy. Drain on paper towels.",
-                    "Toast 2 slices of your favorite bread.",
-                    "Spread 1 tbsp mayonnaise on one side of each toasted bread slice.",
-                    "Layer 4 oz cooked chicken breast (sliced), crispy bacon, 2 lettuce leaves, and 2 tomato slices on one slice of bread.",
-                    "Place the other slice of bread on top. Slice in half and serve."
-                ],
-                "ingredients": [
-                    {"name": "bacon slices", "quantity": 3, "unit": ""},
-                    {"name": "bread slices", "quantity": 2, "unit": ""},
-                    {"name": "mayonnaise", "quantity": 1, "unit": "tbsp"},
-                    {"name": "cooked chicken breast", "quantity": 4, "unit": "oz, sliced"},
-                    {"name": "lettuce leaves", "quantity": 2, "unit": ""},
-                    {"name": "tomato slices", "quantity": 2, "unit": ""}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Chicken+BLT"
-            },
-            {
-                "name": "Roasted Vegetable Medley",
-                "cuisine": "Side Dish",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 25,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 400°F (200°C).",
-                    "Chop 1 zucchini, 1 yellow squash, 1 bell pepper, 1 red onion, and 1 cup broccoli florets into bite-sized pieces.",
-                    "Toss vegetables with 2 tbsp olive oil, 1 tsp dried Italian seasoning, 1/2 tsp garlic powder, salt, and pepper on a large baking sheet.",
-                    "Spread vegetables in a single layer. Roast for 20-25 minutes, stirring halfway, until tender and lightly browned."
-                ],
-                "ingredients": [
-                    {"name": "zucchini", "quantity": 1, "unit": ""},
-                    {"name": "yellow squash", "quantity": 1, "unit": ""},
-                    {"name": "bell pepper", "quantity": 1, "unit": ""},
-                    {"name": "red onion", "quantity": 1, "unit": ""},
-                    {"name": "broccoli florets", "quantity": 1, "unit": "cup"},
-                    {"name": "olive oil", "quantity": 2, "unit": "tbsp"},
-                    {"name": "dried Italian seasoning", "quantity": 1, "unit": "tsp"},
-                    {"name": "garlic powder", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/c8e6c9/2e7d32?text=Roasted+Veg"
-            },
-            {
-                "name": "Homemade Coleslaw",
-                "cuisine": "American",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 0,
-                "servings": 6,
-                "instructions": [
-                    "In a large bowl, combine 4 cups shredded green cabbage, 1 cup shredded red cabbage, and 1 large shredded carrot.",
-                    "For the dressing: In a separate bowl, whisk together 1/2 cup mayonnaise, 2 tbsp apple cider vinegar, 1 tbsp sugar, 1 tsp Dijon mustard, 1/2 tsp celery salt, salt, and pepper.",
-                    "Pour dressing over cabbage mixture and toss well to coat.",
-                    "Cover and refrigerate for at least 30 minutes before serving to allow flavors to meld."
-                ],
-                "ingredients": [
-                    {"name": "shredded green cabbage", "quantity": 4, "unit": "cups"},
-                    {"name": "shredded red cabbage", "quantity": 1, "unit": "cup"},
-                    {"name": "large carrot", "quantity": 1, "unit": "shredded"},
-                    {"name": "mayonnaise", "quantity": 0.5, "unit": "cup"},
-                    {"name": "apple cider vinegar", "quantity": 2, "unit": "tbsp"},
-                    {"name": "sugar", "quantity": 1, "unit": "tbsp"},
-                    {"name": "Dijon mustard", "quantity": 1, "unit": "tsp"},
-                    {"name": "celery salt", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/ede7f6/512da8?text=Coleslaw"
-            },
-            {
-                "name": "Chicken Alfredo",
-                "cuisine": "Italian",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 25,
-                "servings": 4,
-                "instructions": [
-                    "Cook 8 oz fettuccine or preferred pasta according to package directions. Reserve 1 cup pasta water. Drain.",
-                    "While pasta cooks, cook 1 lb boneless, skinless chicken breast (sliced) in 1 tbsp olive oil in a large skillet over medium-high heat until cooked through. Remove chicken.",
-                    "In the same skillet, melt 4 tbsp butter over medium heat. Add 2 minced garlic cloves and cook for 1 minute.",
-                    "Stir in 1.5 cups heavy cream and bring to a gentle simmer. Cook for 5 minutes, stirring, until slightly thickened.",
-                    "Remove from heat. Stir in 1 cup grated Parmesan cheese until melted and smooth. Season with salt and pepper.",
-                    "Add cooked pasta and chicken to the sauce. Toss to coat, adding reserved pasta water as needed to reach desired consistency.",
-                    "Garnish with fresh parsley and serve hot."
-                ],
-                "ingredients": [
-                    {"name": "fettuccine or pasta", "quantity": 8, "unit": "oz"},
-                    {"name": "boneless, skinless chicken breast", "quantity": 1, "unit": "lb, sliced"},
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "butter", "quantity": 4, "unit": "tbsp"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "heavy cream", "quantity": 1.5, "unit": "cups"},
-                    {"name": "Parmesan cheese", "quantity": 1, "unit": "cup, grated"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "fresh parsley", "quantity": 1, "unit": "for garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Chicken+Alfredo"
-            },
-            {
-                "name": "Spicy Black Bean Tacos",
-                "cuisine": "Mexican",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 15,
-                "servings": 3,
-                "instructions": [
-                    "Heat 1 tbsp olive oil in a skillet over medium heat. Add 1/2 chopped onion and 2 minced garlic cloves. Sauté for 3 minutes.",
-                    "Add 1 (15 oz) can black beans (rinsed and drained), 1/2 cup corn (frozen or fresh), 1/2 tsp chili powder, and 1/4 tsp cayenne pepper (optional).",
-                    "Cook for 5-7 minutes, mashing some of the beans with a fork, until heated through and slightly thickened.",
-                    "Warm 6 small tortillas. Fill with black bean mixture. Top with desired toppings like avocado, salsa, or hot sauce."
-                ],
-                "ingredients": [
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 0.5, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "black beans", "quantity": 15, "unit": "oz can, rinsed"},
-                    {"name": "corn", "quantity": 0.5, "unit": "cup"},
-                    {"name": "chili powder", "quantity": 0.5, "unit": "tsp"},
-                    {"name": "cayenne pepper", "quantity": 0.25, "unit": "tsp", "optional": True},
-                    {"name": "small tortillas", "quantity": 6, "unit": ""},
-                    {"name": "avocado", "quantity": 1, "unit": "optional"},
-                    {"name": "salsa", "quantity": 1, "unit": "optional"},
-                    {"name": "hot sauce", "quantity": 1, "unit": "optional"}
-                ],
-                "image_url": "https://placehold.co/400x300/ffccbc/bf360c?text=Black+Bean+Tacos"
-            },
-            {
-                "name": "Breakfast Smoothie",
-                "cuisine": "Healthy",
-                "category": "Sweet",
-                "prep_time": 5,
-                "cook_time": 0,
-                "servings": 1,
-                "instructions": [
-                    "Combine 1 ripe banana, 1/2 cup berries (fresh or frozen), 1/2 cup milk (dairy or non-dairy), 1/4 cup plain yogurt, and 1 tbsp honey or maple syrup (optional) in a blender.",
-                    "Blend until smooth and creamy. If too thick, add a little more milk. If too thin, add a few ice cubes.",
-                    "Pour into a glass and serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "ripe banana", "quantity": 1, "unit": ""},
-                    {"name": "berries", "quantity": 0.5, "unit": "cup, fresh or frozen"},
-                    {"name": "milk", "quantity": 0.5, "unit": "cup"},
-                    {"name": "plain yogurt", "quantity": 0.25, "unit": "cup"},
-                    {"name": "honey or maple syrup", "quantity": 1, "unit": "tbsp", "optional": True},
-                    {"name": "ice cubes", "quantity": 1, "unit": "optional"}
-                ],
-                "image_url": "https://placehold.co/400x300/fff3e0/e65100?text=Breakfast+Smoothie"
-            },
-            {
-                "name": "Tomato Basil Bruschetta",
-                "cuisine": "Italian",
-                "category": "Vegetarian",
-                "prep_time": 15,
-                "cook_time": 10,
-                "servings": 4,
-                "instructions": [
-                    "Preheat oven to 375°F (190°C).",
-                    "Slice 1 baguette diagonally into 1/2-inch thick slices.",
-                    "Arrange bread slices on a baking sheet. Drizzle lightly with olive oil.",
-                    "Bake for 8-10 minutes, or until lightly golden and crisp.",
-                    "While bread toasts, dice 3 ripe tomatoes. In a bowl, combine diced tomatoes with 2 minced garlic cloves, 1/4 cup chopped fresh basil, 1 tbsp olive oil, 1 tsp balsamic glaze, salt, and pepper.",
-                    "Spoon tomato mixture over toasted baguette slices. Serve immediately."
-                ],
-                "ingredients": [
-                    {"name": "baguette", "quantity": 1, "unit": ""},
-                    {"name": "olive oil", "quantity": 3, "unit": "tbsp"},
-                    {"name": "ripe tomatoes", "quantity": 3, "unit": "diced"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "fresh basil", "quantity": 0.25, "unit": "cup, chopped"},
-                    {"name": "balsamic glaze", "quantity": 1, "unit": "tsp"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"}
-                ],
-                "image_url": "https://placehold.co/400x300/f3e5f5/4a148c?text=Bruschetta"
-            },
-            {
-                "name": "Chicken Soup with Vegetables",
-                "cuisine": "Comfort Food",
-                "category": "Non-Vegetarian",
-                "prep_time": 15,
-                "cook_time": 40,
-                "servings": 6,
-                "instructions": [
-                    "Heat 1 tbsp olive oil in a large pot. Add 1 chopped onion, 2 chopped carrots, and 2 chopped celery stalks. Sauté for 5-7 minutes.",
-                    "Add 2 minced garlic cloves and cook for 1 minute.",
-                    "Pour in 8 cups chicken broth and 1 cup cooked shredded chicken. Bring to a simmer.",
-                    "Add 1 cup chopped potatoes (peeled) and 1/2 cup frozen peas. Cook for 20-25 minutes, or until potatoes are tender.",
-                    "Season with salt, pepper, and fresh dill (optional). Serve hot."
-                ],
-                "ingredients": [
-                    {"name": "olive oil", "quantity": 1, "unit": "tbsp"},
-                    {"name": "onion", "quantity": 1, "unit": "chopped"},
-                    {"name": "carrots", "quantity": 2, "unit": "chopped"},
-                    {"name": "celery stalks", "quantity": 2, "unit": "chopped"},
-                    {"name": "garlic", "quantity": 2, "unit": "cloves, minced"},
-                    {"name": "chicken broth", "quantity": 8, "unit": "cups"},
-                    {"name": "cooked shredded chicken", "quantity": 1, "unit": "cup"},
-                    {"name": "potatoes", "quantity": 1, "unit": "cup, chopped, peeled"},
-                    {"name": "frozen peas", "quantity": 0.5, "unit": "cup"},
-                    {"name": "salt", "quantity": 1, "unit": "to taste"},
-                    {"name": "pepper", "quantity": 1, "unit": "to taste"},
-                    {"name": "fresh dill", "quantity": 1, "unit": "optional, for garnish"}
-                ],
-                "image_url": "https://placehold.co/400x300/e0f2f7/263238?text=Chicken+Veg+Soup"
+    '''
+    CREATE TABLE IF NOT EXISTS recipes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        cuisine TEXT,
+        category TEXT,       -- New field for categorization (e.g., "Vegetarian", "Non-Vegetarian", "Sweet")
+        prep_time INTEGER,
+        cook_time INTEGER,
+        servings INTEGER,
+        instructions TEXT,   -- Stored as JSON string
+        ingredients TEXT,    -- Stored as JSON string
+        image_url TEXT       -- New field for recipe image URL
+    )
+    ''',
+    # Small key/value table; 'version' is bumped by triggers on every catalog write
+    '''
+    CREATE TABLE IF NOT EXISTS catalog_meta (
+        key TEXT PRIMARY KEY,
+        value
+    )
+    ''',
+    # Normalized copies of the JSON columns, maintained by the recipes_normalize_* triggers
+    '''
+    CREATE TABLE IF NOT EXISTS recipe_steps (
+        recipe_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        text TEXT NOT NULL,
+        PRIMARY KEY (recipe_id, position)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS recipe_ingredients (
+        recipe_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        normalized_name TEXT NOT NULL, -- lower(trim(name)), used for lookups across recipes
+        quantity NUMERIC,
+        unit TEXT,
+        optional INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (recipe_id, position)
+    ) WITHOUT ROWID
+    ''',
+]
+
+SCHEMA_INDEXES = {
+    # Serves the category filter and its (name, id) keyset order without a sort step
+    "idx_recipes_category_name": "CREATE INDEX IF NOT EXISTS idx_recipes_category_name ON recipes (lower(category), name)",
+    "idx_recipe_ingredients_normalized_name": "CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_normalized_name ON recipe_ingredients (normalized_name, recipe_id)",
+}
+
+# Shared by the normalize triggers and the backfill so both expand the JSON identically.
+# {row} is the alias of the recipes row being expanded; {tables} names it when it isn't NEW.
+_STEPS_FROM_JSON_SQL = "SELECT {row}.id, key, value FROM {tables}json_each({row}.instructions)"
+_INGREDIENTS_FROM_JSON_SQL = (
+    "SELECT {row}.id, key, coalesce(json_extract(value, '$.name'), ''), lower(trim(coalesce(json_extract(value, '$.name'), ''))),"
+    " json_extract(value, '$.quantity'), json_extract(value, '$.unit'), coalesce(json_extract(value, '$.optional'), 0)"
+    " FROM {tables}json_each({row}.ingredients)"
+)
+_INSERT_STEPS_SQL = "INSERT INTO recipe_steps (recipe_id, position, text) "
+_INSERT_INGREDIENTS_SQL = "INSERT INTO recipe_ingredients (recipe_id, position, name, normalized_name, quantity, unit, optional) "
+_NEW_ROW = {"row": "NEW", "tables": ""}
+
+SCHEMA_TRIGGERS = {
+    "recipes_version_ai": "CREATE TRIGGER IF NOT EXISTS recipes_version_ai AFTER INSERT ON recipes BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'version'; END",
+    "recipes_version_au": "CREATE TRIGGER IF NOT EXISTS recipes_version_au AFTER UPDATE ON recipes BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'version'; END",
+    "recipes_version_ad": "CREATE TRIGGER IF NOT EXISTS recipes_version_ad AFTER DELETE ON recipes BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'version'; END",
+    "recipes_normalize_ai": (
+        "CREATE TRIGGER IF NOT EXISTS recipes_normalize_ai AFTER INSERT ON recipes BEGIN "
+        + _INSERT_STEPS_SQL + _STEPS_FROM_JSON_SQL.format(**_NEW_ROW) + "; "
+        + _INSERT_INGREDIENTS_SQL + _INGREDIENTS_FROM_JSON_SQL.format(**_NEW_ROW) + "; END"
+    ),
+    "recipes_normalize_au": (
+        "CREATE TRIGGER IF NOT EXISTS recipes_normalize_au AFTER UPDATE OF instructions, ingredients ON recipes BEGIN "
+        "DELETE FROM recipe_steps WHERE recipe_id = OLD.id; DELETE FROM recipe_ingredients WHERE recipe_id = OLD.id; "
+        + _INSERT_STEPS_SQL + _STEPS_FROM_JSON_SQL.format(**_NEW_ROW) + "; "
+        + _INSERT_INGREDIENTS_SQL + _INGREDIENTS_FROM_JSON_SQL.format(**_NEW_ROW) + "; END"
+    ),
+    "recipes_normalize_ad": (
+        "CREATE TRIGGER IF NOT EXISTS recipes_normalize_ad AFTER DELETE ON recipes BEGIN "
+        "DELETE FROM recipe_steps WHERE recipe_id = OLD.id; DELETE FROM recipe_ingredients WHERE recipe_id = OLD.id; END"
+    ),
+}
+
+# Full-text index over the searchable text of each recipe (rowid = recipes.id). It is a
+# regular FTS5 table rather than external-content so snippet() has the text to quote.
+FTS_TABLE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5("
+    "name, cuisine, ingredients, instructions, tokenize = 'porter unicode61 remove_diacritics 2')"
+)
+# Column weights for bm25(): a hit in the name counts far more than one in the method.
+FTS_RANK = "bm25(10.0, 2.0, 4.0, 1.0)"
+_FTS_ROW_SQL = (
+    "SELECT {row}.id, {row}.name, {row}.cuisine,"
+    " (SELECT group_concat(json_extract(value, '$.name'), ' ') FROM json_each({row}.ingredients)),"
+    " (SELECT group_concat(value, ' ') FROM json_each({row}.instructions))"
+)
+_INSERT_FTS_SQL = "INSERT INTO recipes_fts (rowid, name, cuisine, ingredients, instructions) "
+FTS_TRIGGERS = {
+    "recipes_fts_ai": "CREATE TRIGGER IF NOT EXISTS recipes_fts_ai AFTER INSERT ON recipes BEGIN " + _INSERT_FTS_SQL + _FTS_ROW_SQL.format(row="NEW") + "; END",
+    "recipes_fts_au": (
+        "CREATE TRIGGER IF NOT EXISTS recipes_fts_au AFTER UPDATE ON recipes BEGIN "
+        "DELETE FROM recipes_fts WHERE rowid = OLD.id; " + _INSERT_FTS_SQL + _FTS_ROW_SQL.format(row="NEW") + "; END"
+    ),
+    "recipes_fts_ad": "CREATE TRIGGER IF NOT EXISTS recipes_fts_ad AFTER DELETE ON recipes BEGIN DELETE FROM recipes_fts WHERE rowid = OLD.id; END",
+}
+
+MIGRATION_BATCH_SIZE = int(os.environ.get("MIGRATION_BATCH_SIZE", "500"))
+
+_schema_ready = False
+_schema_lock = threading.Lock()
+fts_enabled = False # False when this SQLite build lacks FTS5; /api/search then answers 503
+
+def init_schema(conn):
+    """Creates any missing tables and triggers."""
+    global fts_enabled
+    with conn:
+        for statement in SCHEMA_TABLES:
+            conn.execute(statement)
+        conn.execute("INSERT OR IGNORE INTO catalog_meta (key, value) VALUES ('version', 0)")
+        for statement in SCHEMA_INDEXES.values():
+            conn.execute(statement)
+        for statement in SCHEMA_TRIGGERS.values():
+            conn.execute(statement)
+    backfill_normalized_tables(conn)
+
+    try:
+        with conn:
+            conn.execute(FTS_TABLE)
+            conn.execute("INSERT INTO recipes_fts (recipes_fts, rank) VALUES ('rank', ?)", (FTS_RANK,))
+            for statement in FTS_TRIGGERS.values():
+                conn.execute(statement)
+            # One-off build for databases that predate the index; the triggers keep it current afterwards.
+            if not conn.execute("SELECT 1 FROM catalog_meta WHERE key = 'fts_built'").fetchone():
+                conn.execute("DELETE FROM recipes_fts")
+                conn.execute(_INSERT_FTS_SQL + _FTS_ROW_SQL.format(row="recipes") + " FROM recipes")
+                conn.execute("INSERT INTO catalog_meta (key, value) VALUES ('fts_built', 1)")
+        fts_enabled = True
+    except sqlite3.OperationalError as e:
+        print(f"WARNING: Full-text search disabled, SQLite FTS5 is unavailable: {e}")
+
+def backfill_normalized_tables(conn, batch_size=MIGRATION_BATCH_SIZE):
+    """Populates recipe_steps/recipe_ingredients for rows written before the normalize triggers existed.
+
+    Works through the recipes in id order, committing every batch_size rows so other
+    processes can keep reading (and writing) between batches. Progress is stored in
+    catalog_meta, so an interrupted migration resumes where it stopped.
+    """
+    meta = dict(conn.execute("SELECT key, value FROM catalog_meta WHERE key LIKE 'normalized_backfill_%'").fetchall())
+    if meta.get('normalized_backfill_done'):
+        return
+    last_id = meta.get('normalized_backfill_id', 0)
+    migrated = 0
+    batch_row = {"row": "r", "tables": "recipes r, "}
+    while True:
+        with conn:
+            ids = conn.execute("SELECT id FROM recipes WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)).fetchall()
+            if not ids:
+                conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('normalized_backfill_done', 1)")
+                break
+            first_id, last_id = ids[0][0], ids[-1][0]
+            # Deleting first makes each batch idempotent with rows the triggers already wrote.
+            conn.execute("DELETE FROM recipe_steps WHERE recipe_id BETWEEN ? AND ?", (first_id, last_id))
+            conn.execute("DELETE FROM recipe_ingredients WHERE recipe_id BETWEEN ? AND ?", (first_id, last_id))
+            conn.execute(
+                _INSERT_STEPS_SQL + _STEPS_FROM_JSON_SQL.format(**batch_row)
+                + " WHERE r.id BETWEEN ? AND ?", (first_id, last_id))
+            conn.execute(
+                _INSERT_INGREDIENTS_SQL + _INGREDIENTS_FROM_JSON_SQL.format(**batch_row)
+                + " WHERE r.id BETWEEN ? AND ?", (first_id, last_id))
+            conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('normalized_backfill_id', ?)", (last_id,))
+        migrated += len(ids)
+    if migrated:
+        print(f"Migrated {migrated} recipes to normalized step/ingredient tables.")
+
+def _ensure_schema(conn):
+    """Runs init_schema once per process."""
+    global _schema_ready
+    with _schema_lock:
+        if not _schema_ready:
+            init_schema(conn)
+            _schema_ready = True
+
+def get_db():
+    """Returns the database connection bound to the current app context, borrowing one from the pool on first use."""
+    if '_database' not in g:
+        g._database = _acquire_connection()
+    return g._database
+
+if DB_SNAPSHOT:
+    @app.before_request
+    def check_snapshot():
+        maybe_reload_snapshot()
+
+@app.teardown_appcontext
+def close_db(exception):
+    """Hands the app context's connection back to the pool."""
+    conn = g.pop('_database', None)
+    if conn is not None:
+        _release_connection(conn)
+
+# Sample catalog, read only when init_db actually needs to (re)seed.
+SEED_FILE = os.path.join(CURRENT_FILE_DIR, 'data', 'seed_recipes.json')
+
+RECIPE_INSERT_SQL = (
+    "INSERT OR IGNORE INTO recipes (name, cuisine, category, prep_time, cook_time, servings, instructions, ingredients, image_url)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+def recipe_row(recipe_data):
+    """Maps a recipe record (as found in the seed file) to RECIPE_INSERT_SQL parameters."""
+    return (recipe_data['name'], recipe_data.get('cuisine'), recipe_data.get('category'), recipe_data.get('prep_time'),
+            recipe_data.get('cook_time'), recipe_data.get('servings'),
+            json.dumps(recipe_data.get('instructions', [])), json.dumps(recipe_data.get('ingredients', [])),
+            recipe_data.get('image_url'))
+
+def init_db():
+    """Initializes the database schema and populates it with the sample recipes.
+
+    A checksum of the seed file is stored in catalog_meta, so when the file hasn't changed
+    since the last successful seed, nothing is read or written.
+    """
+    conn = connect_db()
+    try:
+        with open(SEED_FILE, 'rb') as f:
+            seed_bytes = f.read()
+        checksum = hashlib.sha256(seed_bytes).hexdigest()
+        stored = conn.execute("SELECT value FROM catalog_meta WHERE key = 'seed_checksum'").fetchone()
+        if stored and stored[0] == checksum:
+            return
+
+        all_recipes = json.loads(seed_bytes)
+        with conn:
+            # INSERT OR IGNORE skips recipes that already exist, based on the unique 'name'
+            cursor = conn.executemany(RECIPE_INSERT_SQL, [recipe_row(r) for r in all_recipes])
+            conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('seed_checksum', ?)", (checksum,))
+        print(f"Seeded {cursor.rowcount} new recipes ({len(all_recipes) - cursor.rowcount} already in the database).")
+    finally:
+        conn.close()
+
+# --- Bulk Import (flask import-recipes) ---
+IMPORT_BATCH_SIZE = 5000
+IMPORT_MAX_REPORTED_ERRORS = 20
+
+def validate_recipe(record):
+    """Returns a list of problems with an import record; an empty list means it can be inserted."""
+    if not isinstance(record, dict):
+        return ["record is not a JSON object"]
+    errors = []
+    name = record.get('name')
+    if not isinstance(name, str) or not name.strip():
+        errors.append("'name' must be a non-empty string")
+    for field in ('cuisine', 'category', 'image_url'):
+        if record.get(field) is not None and not isinstance(record[field], str):
+            errors.append(f"'{field}' must be a string")
+    for field in ('prep_time', 'cook_time', 'servings'):
+        value = record.get(field)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 0):
+            errors.append(f"'{field}' must be a non-negative integer")
+    instructions = record.get('instructions', [])
+    if not isinstance(instructions, list) or not all(isinstance(step, str) for step in instructions):
+        errors.append("'instructions' must be a list of strings")
+    ingredients = record.get('ingredients', [])
+    if not isinstance(ingredients, list):
+        errors.append("'ingredients' must be a list")
+    else:
+        for i, ing in enumerate(ingredients):
+            if not isinstance(ing, dict) or not isinstance(ing.get('name'), str) or not ing['name'].strip():
+                errors.append(f"ingredient {i} must be an object with a non-empty 'name'")
+            elif ing.get('quantity') is not None and (isinstance(ing['quantity'], bool) or not isinstance(ing['quantity'], (int, float))):
+                errors.append(f"ingredient {i} 'quantity' must be a number")
+            elif ing.get('unit') is not None and not isinstance(ing['unit'], str):
+                errors.append(f"ingredient {i} 'unit' must be a string")
+    return errors
+
+def _rebuild_derived_tables(conn, after_id):
+    """Fills the normalized tables and the FTS index for every recipe with id > after_id, in one pass each."""
+    batch_row = {"row": "r", "tables": "recipes r, "}
+    with conn:
+        conn.execute("DELETE FROM recipe_steps WHERE recipe_id > ?", (after_id,))
+        conn.execute("DELETE FROM recipe_ingredients WHERE recipe_id > ?", (after_id,))
+        conn.execute(_INSERT_STEPS_SQL + _STEPS_FROM_JSON_SQL.format(**batch_row) + " WHERE r.id > ?", (after_id,))
+        conn.execute(_INSERT_INGREDIENTS_SQL + _INGREDIENTS_FROM_JSON_SQL.format(**batch_row) + " WHERE r.id > ?", (after_id,))
+        if fts_enabled:
+            conn.execute("DELETE FROM recipes_fts WHERE rowid > ?", (after_id,))
+            conn.execute(_INSERT_FTS_SQL + _FTS_ROW_SQL.format(row="r") + " FROM recipes r WHERE r.id > ?", (after_id,))
+        # The per-row version triggers were off during the import; one bump invalidates every worker's caches.
+        conn.execute("UPDATE catalog_meta SET value = value + 1 WHERE key = 'version'")
+        conn.execute("DELETE FROM catalog_meta WHERE key = 'import_rebuild_from'")
+
+def import_recipes(conn, lines, batch_size=IMPORT_BATCH_SIZE, report=print):
+    """Streams NDJSON recipe records from `lines` into the database.
+
+    Per-row triggers and secondary indexes are dropped for the duration of the import and
+    the derived tables are rebuilt once at the end, which is far cheaper than maintaining
+    them row by row. If a previous import died before its rebuild, that rebuild runs first.
+    Returns a dict of counters.
+    """
+    pending = conn.execute("SELECT value FROM catalog_meta WHERE key = 'import_rebuild_from'").fetchone()
+    if pending:
+        report(f"Finishing the index rebuild of an interrupted import (recipes after id {pending[0]})...")
+        _rebuild_derived_tables(conn, pending[0])
+        init_schema(conn)
+
+    # AUTOINCREMENT guarantees every row inserted from here on gets a larger id.
+    after_id = conn.execute(
+        "SELECT max(coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'recipes'), 0), coalesce((SELECT max(id) FROM recipes), 0))"
+    ).fetchone()[0]
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('import_rebuild_from', ?)", (after_id,))
+        for name in list(SCHEMA_TRIGGERS) + list(FTS_TRIGGERS):
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for name in SCHEMA_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+    stats = {"read": 0, "inserted": 0, "duplicates": 0, "invalid": 0}
+    start = time.perf_counter()
+    batch = []
+
+    def flush():
+        with conn:
+            inserted = conn.executemany(RECIPE_INSERT_SQL, batch).rowcount
+        stats["inserted"] += inserted
+        stats["duplicates"] += len(batch) - inserted
+        batch.clear()
+        elapsed = time.perf_counter() - start
+        report(f"  {stats['read']} records read, {stats['inserted']} inserted, {stats['invalid']} invalid"
+               f" ({stats['read'] / elapsed:,.0f} records/s)")
+
+    try:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            stats["read"] += 1
+            try:
+                record = json.loads(line)
+                errors = validate_recipe(record)
+            except json.JSONDecodeError as e:
+                errors = [f"invalid JSON: {e}"]
+            if errors:
+                stats["invalid"] += 1
+                if stats["invalid"] <= IMPORT_MAX_REPORTED_ERRORS:
+                    report(f"  line {line_number}: skipped, {'; '.join(errors)}")
+                continue
+            batch.append(recipe_row(record))
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    finally:
+        # Runs on failure too, so whatever made it in is indexed and the triggers come back.
+        rebuild_start = time.perf_counter()
+        report("Rebuilding ingredient, step and search indexes...")
+        _rebuild_derived_tables(conn, after_id)
+        init_schema(conn)
+        stats["rebuild_seconds"] = time.perf_counter() - rebuild_start
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+@app.cli.command('import-recipes')
+@click.argument('source', type=click.File('r', encoding='utf-8'))
+@click.option('--batch-size', default=IMPORT_BATCH_SIZE, show_default=True, help='Records per insert transaction.')
+def import_recipes_command(source, batch_size):
+    """Bulk-loads recipes from an NDJSON file (one recipe object per line, '-' for stdin)."""
+    conn = connect_db()
+    try:
+        stats = import_recipes(conn, source, batch_size=batch_size, report=click.echo)
+    finally:
+        conn.close()
+    rate = stats['read'] / stats['seconds'] if stats['seconds'] else 0
+    click.echo(f"Imported {stats['inserted']} recipes ({stats['duplicates']} duplicates, {stats['invalid']} invalid) "
+               f"from {stats['read']} records in {stats['seconds']:.1f}s ({rate:,.0f} records/s, "
+               f"index rebuild {stats['rebuild_seconds']:.1f}s).")
+
+# --- Catalog Caching ---
+class LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used entry.
+
+    Entries are tagged with the catalog version they were built from: a lookup with a
+    different version drops everything, so data written by any process is never served stale.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def _sync(self, version):
+        if version != self._version:
+            self._data.clear()
+            self._version = version
+
+    def get(self, key, version=None):
+        with self._lock:
+            self._sync(version)
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, version=None):
+        with self._lock:
+            self._sync(version)
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
             }
-    ]
 
-    for recipe_data in all_recipes:
-        try:
-            # Use INSERT OR IGNORE into recipes to prevent duplicates based on unique 'name'
-            cursor.execute(
-                "INSERT OR IGNORE INTO recipes (name, cuisine, category, prep_time, cook_time, servings, instructions, ingredients, image_url) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (recipe_data['name'], recipe_data['cuisine'], recipe_data['category'], recipe_data['prep_time'],
-                 recipe_data['cook_time'], recipe_data['servings'],
-                 json.dumps(recipe_data['instructions']), json.dumps(recipe_data['ingredients']), recipe_data['image_url'])
-            )
-            if cursor.rowcount > 0:
-                print(f"Added recipe '{recipe_data['name']}' to the database.")
-            else:
-                print(f"Recipe '{recipe_data['name']}' already exists, skipped insertion.")
-        except Exception as e:
-            print(f"Error adding recipe '{recipe_data['name']}': {e}")
+RECIPE_CACHE_SIZE = int(os.environ.get("RECIPE_CACHE_SIZE", "512"))
+recipe_cache = LRUCache(RECIPE_CACHE_SIZE)
 
-    conn.commit()
-    conn.close()
+def catalog_version():
+    """Returns the catalog version counter, read at most once per app context."""
+    if '_catalog_version' not in g:
+        row = get_db().execute("SELECT value FROM catalog_meta WHERE key = 'version'").fetchone()
+        g._catalog_version = row[0] if row else 0
+    return g._catalog_version
+
+def fetch_recipe(recipe_id):
+    """Returns a fully assembled recipe dict (instructions/ingredients as lists), or None if it doesn't exist.
+
+    The returned dict is shared through the cache and must not be mutated.
+    """
+    version = catalog_version()
+    recipe = recipe_cache.get(recipe_id, version)
+    if recipe is not None:
+        return recipe
+
+    db = get_db()
+    row = db.execute("SELECT id, name, cuisine, category, prep_time, cook_time, servings, image_url FROM recipes WHERE id = ?", (recipe_id,)).fetchone()
+    if row is None:
+        return None
+    recipe = dict(row)
+    # Both lookups are range scans on the (recipe_id, position) primary keys.
+    recipe['instructions'] = [step['text'] for step in db.execute(
+        "SELECT text FROM recipe_steps WHERE recipe_id = ? ORDER BY position", (row['id'],))]
+    recipe['ingredients'] = [_ingredient_entry(ing) for ing in db.execute(
+        "SELECT name, quantity, unit, optional FROM recipe_ingredients WHERE recipe_id = ? ORDER BY position", (row['id'],))]
+    recipe_cache.put(recipe_id, recipe, version)
+    return recipe
+
+def _ingredient_entry(row):
+    ingredient = {"name": row['name'], "quantity": row['quantity'], "unit": row['unit']}
+    if row['optional']:
+        ingredient['optional'] = True
+    return ingredient
+
+def fetch_recipes(recipe_ids):
+    """fetch_recipe for many ids: cached recipes are reused and the rest load with three queries in total.
+
+    Returns {recipe_id: recipe} for the ids that exist; the dicts are shared like fetch_recipe's.
+    """
+    version = catalog_version()
+    found = {}
+    missing = []
+    for recipe_id in set(recipe_ids):
+        recipe = recipe_cache.get(recipe_id, version)
+        if recipe is None:
+            missing.append(recipe_id)
+        else:
+            found[recipe_id] = recipe
+    if not missing:
+        return found
+
+    db = get_db()
+    marks = ",".join("?" * len(missing))
+    loaded = {}
+    for row in db.execute(f"SELECT id, name, cuisine, category, prep_time, cook_time, servings, image_url FROM recipes WHERE id IN ({marks})", missing):
+        loaded[row['id']] = dict(row, instructions=[], ingredients=[])
+    for step in db.execute(f"SELECT recipe_id, text FROM recipe_steps WHERE recipe_id IN ({marks}) ORDER BY recipe_id, position", missing):
+        loaded[step['recipe_id']]['instructions'].append(step['text'])
+    for ing in db.execute(f"SELECT recipe_id, name, quantity, unit, optional FROM recipe_ingredients WHERE recipe_id IN ({marks}) ORDER BY recipe_id, position", missing):
+        loaded[ing['recipe_id']]['ingredients'].append(_ingredient_entry(ing))
+    for recipe_id, recipe in loaded.items():
+        recipe_cache.put(recipe_id, recipe, version)
+    found.update(loaded)
+    return found
+
+# Serialized bodies of the catalog GET endpoints, keyed by route + query string. Entries
+# are rebuilt only after the catalog version changes.
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", "1024"))
+# Seconds clients may reuse a catalog response without asking; 0 means always revalidate (cheap, via ETag).
+CATALOG_MAX_AGE = int(os.environ.get("CATALOG_MAX_AGE", "0"))
+response_cache = LRUCache(RESPONSE_CACHE_SIZE)
+_CATALOG_CACHE_CONTROL = f"public, max-age={CATALOG_MAX_AGE}" if CATALOG_MAX_AGE else "public, no-cache"
+
+def cached_json_response(key, build):
+    """Serves a catalog response from pre-serialized bytes, answering If-None-Match with 304.
+
+    `build` produces the response on a cache miss; only 200 responses are cached. The
+    strong ETag combines the catalog version with a digest of the body.
+    """
+    version = catalog_version()
+    entry = response_cache.get(key, version)
+    if entry is None:
+        built = make_response(build())
+        if built.status_code != 200:
+            return built
+        body = built.get_data()
+        entry = (body, f"{version}-{hashlib.blake2b(body, digest_size=8).hexdigest()}")
+        response_cache.put(key, entry, version)
+
+    # Headers are set directly: Response.make_conditional also handles ranges and dates
+    # and costs more than the rest of this function together.
+    body, etag = entry
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.headers['ETag'] = f'"{etag}"'
+    response.headers['Cache-Control'] = _CATALOG_CACHE_CONTROL
+    return response
+
+def _request_cache_key():
+    return (request.path, tuple(sorted(request.args.items(multi=True))))
+
+# --- Recipe Name Resolution ---
+def _name_words(text):
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+class TrigramIndex:
+    """Fuzzy string lookup over character trigrams.
+
+    Candidates are the strings sharing at least one trigram with the query, found through
+    an inverted index, and are ranked by the Dice coefficient of the two trigram sets.
+    """
+
+    def __init__(self, entries):
+        self.names = {}
+        self._sizes = {}
+        self._postings = defaultdict(list)
+        for entry_id, name in entries:
+            grams = self.trigrams(name)
+            self.names[entry_id] = name
+            self._sizes[entry_id] = len(grams)
+            for gram in grams:
+                self._postings[gram].append(entry_id)
+
+    @staticmethod
+    def trigrams(text):
+        # Padding makes word starts and ends count, so whole-word matches score higher.
+        padded = "  " + " ".join(_name_words(text)) + " "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def search(self, query, limit=5, min_score=0.35):
+        """Returns up to `limit` (score, id, name) tuples, best first, scoring at least min_score."""
+        grams = self.trigrams(query)
+        if not grams:
+            return []
+        shared = Counter()
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings:
+                shared.update(postings)
+        scored = []
+        for entry_id, count in shared.items():
+            score = 2 * count / (len(grams) + self._sizes[entry_id])
+            if score >= min_score:
+                scored.append((round(score, 3), entry_id, self.names[entry_id]))
+        return heapq.nlargest(limit, scored)
+
+class RecipeNameIndex:
+    """Resolves spoken, possibly misrecognized recipe names ("spagetti carbonera") to catalog recipes.
+
+    Scanning every name's trigrams does not scale, since common words like "chicken" are
+    in a large share of any catalog. Instead each spoken word is matched fuzzily against the
+    much smaller vocabulary of words used in recipe names. The recipes containing those words
+    are intersected, rarest word first, and only the few survivors are ranked by trigram
+    similarity of the full name.
+    """
+
+    MAX_RANKED = 256 # Upper bound on names scored per query
+    WORD_MIN_SCORE = 0.4
+
+    def __init__(self, entries):
+        self.names = dict(entries)
+        self._word_postings = defaultdict(set)
+        for entry_id, name in self.names.items():
+            for word in _name_words(name):
+                self._word_postings[word].add(entry_id)
+        self._vocabulary = TrigramIndex((word, word) for word in self._word_postings)
+
+    def search(self, query, limit=5, min_score=0.35):
+        """Returns up to `limit` (score, recipe id, name) tuples, best first, scoring at least min_score."""
+        word_matches = []
+        for word in set(_name_words(query)):
+            similar = self._vocabulary.search(word, limit=3, min_score=self.WORD_MIN_SCORE)
+            if len(similar) == 1:
+                word_matches.append(self._word_postings[similar[0][1]])
+            elif similar:
+                word_matches.append(set().union(*(self._word_postings[w] for _, w, _ in similar)))
+        if not word_matches:
+            return []
+
+        word_matches.sort(key=len)
+        candidates = word_matches[0]
+        for ids in word_matches[1:]:
+            narrowed = candidates & ids
+            if narrowed: # A word that matches none of the remaining names is treated as noise
+                candidates = narrowed
+        if len(candidates) > self.MAX_RANKED:
+            # Every candidate shares the matched words, so names closest in length to the query rank highest.
+            candidates = heapq.nsmallest(self.MAX_RANKED, candidates, key=lambda i: abs(len(self.names[i]) - len(query)))
+
+        query_grams = TrigramIndex.trigrams(query)
+        scored = []
+        for entry_id in candidates:
+            name_grams = TrigramIndex.trigrams(self.names[entry_id])
+            score = 2 * len(query_grams & name_grams) / (len(query_grams) + len(name_grams))
+            if score >= min_score:
+                scored.append((round(score, 3), entry_id, self.names[entry_id]))
+        return heapq.nlargest(limit, scored)
+
+_name_index = None # (catalog version, RecipeNameIndex) built from the recipe names in the database
+_name_index_lock = threading.Lock()
+
+def recipe_name_index():
+    """Returns the recipe name index for the current catalog version, rebuilding it if the catalog changed.
+
+    While one thread rebuilds, others keep using the previous index rather than waiting.
+    """
+    global _name_index
+    version = catalog_version()
+    current = _name_index
+    if current is not None and current[0] == version:
+        return current[1]
+    if not _name_index_lock.acquire(blocking=current is None):
+        return current[1]
+    try:
+        if _name_index is None or _name_index[0] != version:
+            rows = get_db().execute("SELECT id, name FROM recipes").fetchall()
+            _name_index = (version, RecipeNameIndex((row['id'], row['name']) for row in rows))
+        return _name_index[1]
+    finally:
+        _name_index_lock.release()
+
+# Words that can surround a recipe name in a load command without being part of it.
+_LOAD_COMMAND_FILLER = re.compile(
+    r"\b(?:load|switch|to|open|recipe|recipes|the|a|an|for|me|please|assistant|can|could|would|you|i|want|like|let's|lets|make|cook)\b"
+)
+
+# How closely a spoken name must match a recipe for "load"/"switch to" without the word "recipe"
+# to count as a load command: "switch to pancakes" (0.67) loads, "switch to butter" (0.43) doesn't.
+LOAD_WITHOUT_RECIPE_CUE_MIN_SCORE = 0.6
+
+def extract_recipe_name(command_text):
+    """Pulls the spoken recipe name out of a command like "load the recipe for spaghetti carbonara please"."""
+    text = command_text.lower()
+    triggers = list(re.finditer(r"\b(?:load|switch to|open)\b", text))
+    if triggers:
+        text = text[triggers[-1].end():]
+    return " ".join(_LOAD_COMMAND_FILLER.sub(" ", re.sub(r"[^\w\s']", " ", text)).split())
 
 # --- AI Model Loading ---
-try:
-    nlp = spacy.load("en_core_web_sm")
-    print("SpaCy model 'en_core_web_sm' loaded successfully.")
-except OSError:
-    print("SpaCy model 'en_core_web_sm' not found. Attempting to download...")
+# spaCy and the OpenAI SDK account for most of this module's import time, so they are imported
+# and loaded by the accessors below rather than at import. STARTUP_MODE picks when that happens
+# once the server starts (start_up, called by the entry points or before the first request):
+#   eager      - right away, before the first request is served
+#   background - in a warm-up thread; /readyz answers 200 once it is done
+#   lazy       - whenever a request first needs them
+STARTUP_MODE = os.environ.get("STARTUP_MODE", "background")
+
+class LazyResource:
+    """A value built by `load` on first use, exactly once; concurrent callers wait for that load."""
+
+    def __init__(self, name, load):
+        self.name = name
+        self._load = load
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.value = None
+        self.load_seconds = None
+
+    def get(self):
+        if not self.loaded:
+            with self._lock:
+                if not self.loaded:
+                    start = time.perf_counter()
+                    self.value = self._load()
+                    self.load_seconds = round(time.perf_counter() - start, 3)
+                    self.loaded = True
+        return self.value
+
+    def reset_lock(self):
+        """Used after fork: the lock may have been held by a loading thread that the child doesn't have."""
+        self._lock = threading.Lock()
+
+    def status(self):
+        return {"loaded": self.loaded, "load_seconds": self.load_seconds}
+
+SPACY_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+# NLU only reads POS tags (tagger plus attribute_ruler, which maps tags to pos_), entities and
+# like_num, so SPACY_EXCLUDE=parser,senter,lemmatizer should be safe to set. The full pipeline
+# stays the default until benchmarks/bench_spacy_pipeline.py has shown, with the real model,
+# that the trimmed one gives the same answers. Excluded components are not read from disk at
+# all; disabled ones are loaded but skipped unless a call enables them.
+SPACY_EXCLUDE = [name.strip() for name in os.environ.get("SPACY_EXCLUDE", "").split(",") if name.strip()]
+SPACY_DISABLE = [name.strip() for name in os.environ.get("SPACY_DISABLE", "").split(",") if name.strip()]
+
+def load_nlp():
+    import spacy
+    return spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE, disable=SPACY_DISABLE)
+
+def _load_spacy_model():
+    try:
+        nlp = load_nlp()
+        print(f"SpaCy model '{SPACY_MODEL}' loaded successfully with components: {', '.join(nlp.pipe_names)}.")
+        return nlp
+    except OSError:
+        print(f"SpaCy model '{SPACY_MODEL}' not found. Attempting to download...")
     try:
         import subprocess
-        subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-        nlp = spacy.load("en_core_web_sm")
+        subprocess.run(["python", "-m", "spacy", "download", SPACY_MODEL], check=True)
+        nlp = load_nlp()
         print("SpaCy model downloaded and loaded.")
+        return nlp
     except Exception as e:
         print(f"Failed to download SpaCy model: {e}")
-        print("Some NLU functionalities might be limited. Please ensure 'en_core_web_sm' is installed.")
-        nlp = None
+        print(f"Some NLU functionalities might be limited. Please ensure '{SPACY_MODEL}' is installed.")
+        return None
+
+def _load_blank_nlp():
+    import spacy
+    return spacy.blank("en")
+
+# With a socket set, the model lives in a separate nlu_service.py process shared by all
+# workers; this process then only tokenizes, and sends texts that need the model's
+# components to the service.
+NLU_SERVICE_SOCKET = os.environ.get("NLU_SERVICE_SOCKET")
+NLU_SERVICE_TIMEOUT = float(os.environ.get("NLU_SERVICE_TIMEOUT", "2"))
+
+def _load_nlp_backend():
+    if NLU_SERVICE_SOCKET:
+        print(f"Using the NLU service at {NLU_SERVICE_SOCKET}.")
+        return RemoteNLP(NLU_SERVICE_SOCKET, _blank_nlp.get().vocab, timeout=NLU_SERVICE_TIMEOUT)
+    return _load_spacy_model()
+
+_spacy_model = LazyResource("spacy_model", _load_nlp_backend)
+_blank_nlp = LazyResource("spacy_blank", _load_blank_nlp)
+
+def get_nlp():
+    """The configured spaCy pipeline, a RemoteNLP when NLU_SERVICE_SOCKET is set, or None when the model can't be loaded."""
+    return _spacy_model.get()
+
+def get_tokenizer_nlp():
+    """The spaCy pipeline to tokenize with: the local model, or a blank English pipeline.
+
+    A blank pipeline still tokenizes and sets lexical attributes such as like_num, so
+    tokenizer-only work (catalog matching, timer durations) keeps working without the model.
+    """
+    nlp = get_nlp()
+    return nlp if nlp is not None and not NLU_SERVICE_SOCKET else _blank_nlp.get()
 
 # Initialize OpenAI client. API key should be set as an environment variable.
 openai_api_key = os.environ.get("OPENAI_API_KEY")
@@ -2070,55 +978,418 @@ if not openai_api_key:
     print('Windows (PowerShell): $env:OPENAI_API_KEY="sk-YOUR_KEY_HERE"')
     print('macOS/Linux: export OPENAI_API_KEY="sk-YOUR_KEY_HERE"')
 
-# CRITICAL FIX: Explicitly create httpx.Client to disable environment proxy detection.
-# This prevents the 'proxies' unexpected keyword argument TypeError.
-try:
-    # Create a custom httpx client that does not trust environment variables for proxies.
-    # This prevents 'proxies' from being implicitly passed, which was causing the TypeError.
-    custom_httpx_client = httpx.Client(trust_env=False)
-    client = OpenAI(api_key=openai_api_key, http_client=custom_httpx_client)
-except Exception as e:
-    # This fallback is a last resort; ideally, the above 'trust_env=False' fixes it.
-    print(f"CRITICAL ERROR: Failed to initialize OpenAI client with custom httpx.Client: {e}")
-    # Attempt a basic initialization as a last resort, though it's likely to fail again if the root cause persists.
-    client = OpenAI(api_key=openai_api_key)
+# Transport for the OpenAI API. Every worker thread shares one connection pool; the timeouts
+# bound how long a slow or unreachable upstream can hold a request thread. The SDK's own retries
+# are off: create_chat_completion retries with jittered backoff behind the circuit breaker.
+OPENAI_MAX_CONNECTIONS = int(os.environ.get("OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_MAX_KEEPALIVE = int(os.environ.get("OPENAI_MAX_KEEPALIVE", "10"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.environ.get("OPENAI_KEEPALIVE_EXPIRY", "30"))
+OPENAI_CONNECT_TIMEOUT = float(os.environ.get("OPENAI_CONNECT_TIMEOUT", "3"))
+OPENAI_READ_TIMEOUT = float(os.environ.get("OPENAI_READ_TIMEOUT", "20")) # Between two bytes received, not for the whole answer
+OPENAI_WRITE_TIMEOUT = float(os.environ.get("OPENAI_WRITE_TIMEOUT", "10"))
+OPENAI_POOL_TIMEOUT = float(os.environ.get("OPENAI_POOL_TIMEOUT", "2"))
+OPENAI_HTTP2 = os.environ.get("OPENAI_HTTP2", "0") == "1" # Needs the h2 package (pip install httpx[http2])
+
+def _load_openai_client():
+    if not openai_api_key:
+        return None # get_ai_response_llm answers without calling the API
+    from openai import OpenAI
+    import httpx # Needed to explicitly control the HTTP client
+
+    timeout = httpx.Timeout(connect=OPENAI_CONNECT_TIMEOUT, read=OPENAI_READ_TIMEOUT, write=OPENAI_WRITE_TIMEOUT, pool=OPENAI_POOL_TIMEOUT)
+    limits = httpx.Limits(max_connections=OPENAI_MAX_CONNECTIONS, max_keepalive_connections=OPENAI_MAX_KEEPALIVE,
+                          keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY)
+    # CRITICAL FIX: Explicitly create httpx.Client to disable environment proxy detection.
+    # This prevents the 'proxies' unexpected keyword argument TypeError.
+    try:
+        # Create a custom httpx client that does not trust environment variables for proxies.
+        # This prevents 'proxies' from being implicitly passed, which was causing the TypeError.
+        try:
+            custom_httpx_client = httpx.Client(trust_env=False, timeout=timeout, limits=limits, http2=OPENAI_HTTP2)
+        except ImportError:
+            print("WARNING: OPENAI_HTTP2 is set but the h2 package is not installed; using HTTP/1.1.")
+            custom_httpx_client = httpx.Client(trust_env=False, timeout=timeout, limits=limits)
+        # The SDK sends its own timeout with every request, so it has to be given the same one
+        return OpenAI(api_key=openai_api_key, http_client=custom_httpx_client, timeout=timeout, max_retries=0)
+    except Exception as e:
+        # This fallback is a last resort; ideally, the above 'trust_env=False' fixes it.
+        print(f"CRITICAL ERROR: Failed to initialize OpenAI client with custom httpx.Client: {e}")
+        # Attempt a basic initialization as a last resort, though it's likely to fail again if the root cause persists.
+        return OpenAI(api_key=openai_api_key, timeout=timeout, max_retries=0)
+
+_openai_client = LazyResource("openai_client", _load_openai_client)
+
+def get_openai_client():
+    return _openai_client.get()
+
+# --- Catalog Entity Matching ---
+class CatalogMatcher:
+    """Finds the catalog's ingredient and recipe names in a command in one pass over its tokens.
+
+    Every phrase has its own match key ("INGREDIENT|olive oil"), so a catalog change only adds
+    and removes the phrases that changed instead of rebuilding the whole matcher.
+    """
+    def __init__(self, pipeline):
+        from spacy.matcher import PhraseMatcher
+        self._tokenizer = pipeline.tokenizer
+        self._matcher = PhraseMatcher(pipeline.vocab) # Phrases and commands are both lowercased, so ORTH is enough
+        self._lock = threading.Lock() # PhraseMatcher is not safe to call while it is being changed
+        self.ingredients = set()
+        self.recipes = {} # lowercased recipe name -> recipe id
+
+    def sync(self, ingredients, recipes):
+        """Brings the matcher in line with the given ingredient phrases and {recipe phrase: id}."""
+        ingredients = set(ingredients)
+        removed = [f"INGREDIENT|{p}" for p in self.ingredients - ingredients]
+        removed += [f"RECIPE|{p}" for p in self.recipes.keys() - recipes.keys()]
+        added = [("INGREDIENT", p) for p in ingredients - self.ingredients]
+        added += [("RECIPE", p) for p in recipes.keys() - self.recipes.keys()]
+        patterns = self._tokenizer.pipe(phrase for _, phrase in added)
+        added = [(f"{label}|{phrase}", pattern) for (label, phrase), pattern in zip(added, patterns)]
+        with self._lock:
+            for key in removed:
+                self._matcher.remove(key)
+            for key, pattern in added:
+                self._matcher.add(key, [pattern])
+            self.ingredients, self.recipes = ingredients, recipes
+        return len(added), len(removed)
+
+    def match(self, doc):
+        """Returns (label, phrase) for the longest non-overlapping catalog names in the Doc, in order."""
+        from spacy.util import filter_spans
+        with self._lock:
+            spans = self._matcher(doc, as_spans=True)
+        return [tuple(span.label_.split("|", 1)) for span in filter_spans(spans)]
+
+_catalog_matcher = None # Created on first use, with the vocab of get_tokenizer_nlp()
+_catalog_matcher_version = None # Catalog version _catalog_matcher was last synced with
+_catalog_matcher_lock = threading.Lock()
+
+def catalog_matcher():
+    """Returns the catalog matcher, first syncing it with the database if the catalog changed.
+
+    Like recipe_name_index, only the first sync blocks; later ones run in one thread while the
+    others keep matching against the previous catalog.
+    """
+    global _catalog_matcher, _catalog_matcher_version
+    version = catalog_version()
+    if _catalog_matcher_version == version:
+        return _catalog_matcher
+    if not _catalog_matcher_lock.acquire(blocking=_catalog_matcher_version is None):
+        return _catalog_matcher
+    try:
+        if _catalog_matcher_version != version:
+            if _catalog_matcher is None:
+                _catalog_matcher = CatalogMatcher(get_tokenizer_nlp())
+            db = get_db()
+            # SQLite's lower() only folds ASCII; lowercasing again here matches how commands are lowercased
+            ingredients = {row[0].lower() for row in db.execute("SELECT DISTINCT normalized_name FROM recipe_ingredients")}
+            recipes = {}
+            for recipe_id, name in db.execute("SELECT id, name FROM recipes ORDER BY id"):
+                recipes.setdefault(name.strip().lower(), recipe_id)
+            added, removed = _catalog_matcher.sync(ingredients, recipes)
+            _catalog_matcher_version = version
+            print(f"Catalog matcher synced to version {version}: {added} phrases added, {removed} removed.")
+        return _catalog_matcher
+    finally:
+        _catalog_matcher_lock.release()
+
+# Connective words inside ingredient names ("salt and pepper", "ghee or oil") that say nothing
+# about which ingredient is meant.
+_INGREDIENT_STOPWORDS = frozenset(["a", "an", "and", "for", "in", "of", "or", "the", "to", "with"])
+
+def _singular(word):
+    """Crude English singular, applied to both sides of a lookup so "eggs" finds "large egg"."""
+    if len(word) > 3 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith(("oes", "ches", "shes", "sses", "xes")):
+        return word[:-2]
+    if len(word) > 2 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+def _ingredient_terms(text):
+    return [_singular(word) for word in re.findall(r"[a-z]+", text.lower()) if word not in _INGREDIENT_STOPWORDS]
+
+class IngredientIndex:
+    """Quantity answers for one recipe, looked up by ingredient term instead of scanning the list.
+
+    Each entry keeps its ingredient's terms and its "You need ..." answer rendered up front, so
+    a quantity question is a few dict and set operations.
+    """
+    def __init__(self, recipe):
+        self.exact = {}
+        self.by_term = defaultdict(list)
+        self.entries = []
+        for ingredient in recipe['ingredients']:
+            entry = (
+                frozenset(_ingredient_terms(ingredient['name'])),
+                f"You need {ingredient['quantity']} {ingredient['unit'] or ''} of {ingredient['name']} for {recipe['name']}.",
+            )
+            self.entries.append(entry)
+            self.exact.setdefault(" ".join(_ingredient_terms(ingredient['name'])), entry)
+            for term in entry[0]:
+                self.by_term[term].append(entry)
 
+    def find(self, name):
+        """The entry named exactly by `name`, else the first whose name contains all of its terms."""
+        terms = _ingredient_terms(name)
+        entry = self.exact.get(" ".join(terms))
+        if entry is not None or not terms:
+            return entry
+        wanted = set(terms)
+        return next((entry for entry in self.by_term.get(terms[0], ()) if wanted <= entry[0]), None)
+
+    def mentioned_in(self, text):
+        """The entry sharing the most terms with free text, first listed on ties, or None."""
+        counts = Counter()
+        for term in set(_ingredient_terms(text)):
+            for entry in self.by_term.get(term, ()):
+                counts[entry] += 1
+        if not counts:
+            return None
+        best = max(counts.values())
+        return next(entry for entry in self.entries if counts[entry] == best)
+
+ingredient_index_cache = LRUCache(RECIPE_CACHE_SIZE)
+
+def ingredient_index(recipe):
+    """Returns the IngredientIndex of a fetched recipe, building it on first use per catalog version."""
+    version = catalog_version()
+    index = ingredient_index_cache.get(recipe['id'], version)
+    if index is None:
+        index = IngredientIndex(recipe)
+        ingredient_index_cache.put(recipe['id'], index, version)
+    return index
 
 # --- NLU/NER Function (SpaCy based) ---
-def process_with_nlu(command_text, current_step_index, recipe):
+# Trigger phrases per intent. When a command contains phrases of several intents, the one
+# with the highest priority wins, regardless of where the phrases appear. Phrases match
+# whole words only, so "hi" no longer fires inside "chili" or "this".
+INTENT_TRIGGERS = [
+    # (intent, priority, phrases)
+    ("list_ingredients", 100, ["ingredients", "what do i need", "list ingredients"]), # "how many ingredients are there"
+    ("get_quantity", 97, ["how much", "how many"]),
+    ("set_timer", 95, ["set timer", "start timer", "set a timer", "start a timer"]),
+    ("next_step", 90, ["next step", "what's next", "whats next", "move on"]),
+    ("show_non_vegetarian", 80, ["show non-vegetarian", "non-vegetarian recipes", "show non vegetarian", "non vegetarian recipes"]),
+    ("show_vegetarian", 75, ["show vegetarian", "vegetarian recipes"]),
+    ("show_sweet", 72, ["show sweet", "sweet recipes", "dessert recipes", "show desserts"]),
+    ("show_all_recipes", 70, ["show all", "show all recipes", "all recipes"]),
+    ("load_recipe", 65, ["load", "switch to"]),
+    ("repeat_step", 60, ["repeat", "say again", "say that again", "what was that"]),
+    ("back_to_list", 50, ["go back", "back to recipes", "back to the list"]),
+    ("greeting", 10, ["hello", "hi", "hey"]),
+]
+
+def _phrase_trie_regex(phrases):
+    """Regex source for a set of phrases, factored into a character trie.
+
+    A flat "a|b|c" alternation retries every phrase at every position; the trie rejects a
+    position after one character comparison per branch. Where a phrase is a prefix of a
+    longer one the longer tail is optional and greedy, so the longest phrase is tried first.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+# Every trigger phrase maps to (priority, intent). The pattern is wrapped in a lookahead, so
+# matches are zero-width and a phrase never hides another one that overlaps it, e.g.
+# "vegetarian recipes" inside "non-vegetarian recipes": finditer reports both in one pass.
+_INTENT_BY_PHRASE = {phrase: (priority, intent) for intent, priority, phrases in INTENT_TRIGGERS for phrase in phrases}
+_INTENT_PATTERN = re.compile(r"\b(?=(" + _phrase_trie_regex(_INTENT_BY_PHRASE) + r")\b)")
+
+# A greeting only counts when nothing else is said: "hey can i use margarine" is a question.
+_GREETING_WORDS = {word for intent, _, phrases in INTENT_TRIGGERS if intent == "greeting" for word in phrases}
+_GREETING_WORDS.update(["there", "assistant", "chef", "again", "everyone"])
+
+def classify_intent(command_text):
+    """Returns the highest-priority intent whose trigger phrases occur in the command, or "unknown"."""
+    best = (-1, "unknown")
+    for match in _INTENT_PATTERN.finditer(command_text.lower()):
+        found = _INTENT_BY_PHRASE[match.group(1)]
+        if found > best:
+            best = found
+    if best[1] == "greeting" and not _GREETING_WORDS.issuperset(_name_words(command_text)):
+        return "unknown"
+    return best[1]
+
+NUMBER_WORDS = {word: value for value, word in enumerate(
+    "zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen fifteen "
+    "sixteen seventeen eighteen nineteen".split())}
+NUMBER_WORDS.update(twenty=20, thirty=30, forty=40, fifty=50, sixty=60, seventy=70, eighty=80, ninety=90)
+NUMBER_TENS = {value for value in NUMBER_WORDS.values() if value >= 20}
+
+def parse_number(text):
+    """The value of a number token as spoken or written ("five", "10", "2.5"), or None."""
+    text = text.lower()
+    if text in NUMBER_WORDS:
+        return NUMBER_WORDS[text]
+    try:
+        value = float(text.replace(",", ""))
+    except ValueError:
+        return None # Fractions, "hundred" and the like
+    return int(value) if value.is_integer() else value
+
+# Intents that read a Doc. Both only need the tokenizer: get_quantity matches catalog names on
+# the tokens and set_timer reads like_num, a lexical attribute. Other intents never build a Doc.
+INTENT_PIPES = {
+    "get_quantity": (),
+    "set_timer": (),
+}
+# Components the get_quantity heuristics need (POS tags and entities) when no catalog ingredient matched.
+QUANTITY_FALLBACK_PIPES = ("tok2vec", "tagger", "attribute_ruler", "ner")
+
+# Set by annotate when it had to return a Doc without the components asked for, because the
+# model failed to load or the NLU service couldn't be reached. Answers built from such a Doc
+# are served but not cached, so they stop once the model or the service is back.
+_annotation_state = threading.local()
+
+def annotate(doc, pipes):
+    """Runs the named components of the loaded model, in pipeline order, over a tokenized Doc.
+
+    With the NLU service, the service annotates the Doc's text instead, or the Doc comes back
+    unannotated if it can't be reached.
+    """
+    if not pipes:
+        return doc
+    nlp = get_nlp()
     if nlp is None:
-        return {"response": "My NLU capabilities are offline. Please ensure SpaCy model is installed.", "action": None}
+        _annotation_state.degraded = True
+        return doc
+    if NLU_SERVICE_SOCKET:
+        try:
+            return nlp.pipe([doc.text], pipes)[0]
+        except (OSError, RuntimeError) as e:
+            print(f"NLU service call failed, continuing without {', '.join(pipes)}: {e}")
+            _annotation_state.degraded = True
+            return doc
+    for name, component in nlp.pipeline:
+        if name in pipes:
+            doc = component(doc)
+    return doc
 
-    doc = nlp(command_text)
-    intent = "unknown"
-    action = None
-    response_text = "I'm sorry, I don't understand that command. Could you please rephrase?"
+def parse_command(command_text, intent):
+    """Builds the Doc for a classified command, running only the components its intent needs."""
+    return annotate(get_tokenizer_nlp().make_doc(command_text.lower()), INTENT_PIPES[intent])
+
+# Batches of commands are streamed through Language.pipe. More than one process only pays off
+# for large batches with statistical components enabled, since every call starts the workers.
+NLU_BATCH_SIZE = int(os.environ.get("NLU_BATCH_SIZE", "64"))
+NLU_N_PROCESS = int(os.environ.get("NLU_N_PROCESS", "1"))
+
+def parse_commands(commands):
+    """parse_command for a list of (command_text, intent); returns Docs in order, None where the intent needs none."""
+    docs = [None] * len(commands)
+    pipeline = get_tokenizer_nlp()
+    positions_by_intent = defaultdict(list)
+    for position, (_, intent) in enumerate(commands):
+        if intent in INTENT_PIPES:
+            positions_by_intent[intent].append(position)
+    for intent, positions in positions_by_intent.items():
+        disable = [name for name in pipeline.pipe_names if name not in INTENT_PIPES[intent]]
+        texts = (commands[position][0].lower() for position in positions)
+        parsed = pipeline.pipe(texts, disable=disable, batch_size=NLU_BATCH_SIZE, n_process=NLU_N_PROCESS)
+        for position, doc in zip(positions, parsed):
+            docs[position] = doc
+    return docs
 
-    if "next step" in command_text or "what's next" in command_text or "move on" in command_text:
-        intent = "next_step"
-    elif "repeat" in command_text or "say again" in command_text or "what was that" in command_text:
-        intent = "repeat_step"
-    elif "ingredients" in command_text or "what do i need" in command_text or "list ingredients" in command_text:
-        intent = "list_ingredients"
-    elif "hello" in command_text or "hi" in command_text:
-        intent = "greeting"
-    elif "how much" in command_text or "how many" in command_text:
-        intent = "get_quantity"
-    elif "set timer" in command_text or "start timer" in command_text:
-        intent = "set_timer"
-    elif "recipe" in command_text and ("load" in command_text or "switch to" in command_text):
-        intent = "load_recipe"
-    elif "go back" in command_text or "back to recipes" in command_text:
-        intent = "back_to_list"
-    elif "show all" in command_text or "show all recipes" in command_text or "all recipes" in command_text:
-        intent = "show_all_recipes"
-    elif "show vegetarian" in command_text or "vegetarian recipes" in command_text:
-        intent = "show_vegetarian"
-    elif "show non-vegetarian" in command_text or "non-vegetarian recipes" in command_text:
-        intent = "show_non_vegetarian"
-    elif "show sweet" in command_text or "sweet recipes" in command_text or "dessert recipes" in command_text:
-        intent = "show_sweet"
+# Answers for repeated commands ("next step", "how much salt"). Keys are the normalized command
+# plus whatever else its intent reads, so one entry serves every user in the same state; the
+# cache is tagged with the catalog version, so catalog edits drop all of it.
+NLU_CACHE_SIZE = int(os.environ.get("NLU_CACHE_SIZE", "4096"))
+nlu_cache = LRUCache(NLU_CACHE_SIZE)
+STEP_INTENTS = frozenset(["next_step", "repeat_step"]) # read the recipe and the current step
+RECIPE_INTENTS = frozenset(["list_ingredients", "get_quantity"]) # read the recipe only
 
+def normalize_command(command_text):
+    """Lowercases and collapses whitespace and surrounding punctuation, so "Next step." and "next step" share an entry."""
+    return " ".join(command_text.lower().split()).strip(" .,!?")
+
+def process_with_nlu(command_text, current_step_index, recipe):
+    """Returns the NLU answer for a command, from nlu_cache when the same state was seen before.
+
+    The returned dict is shared through the cache and must not be mutated.
+    """
+    command_text = normalize_command(command_text)
+    intent = classify_intent(command_text)
+    key = _nlu_cache_key(command_text, intent, current_step_index, recipe)
+    version = catalog_version()
+    result = nlu_cache.get(key, version)
+    if result is None:
+        result, degraded = _interpret_uncached(command_text, intent, current_step_index, recipe)
+        if not degraded:
+            nlu_cache.put(key, result, version)
+    return result
+
+def _interpret_uncached(command_text, intent, current_step_index, recipe, doc=None):
+    """(interpret_command's answer, whether it was built without NLU components it asked for)."""
+    _annotation_state.degraded = False
+    result = interpret_command(command_text, intent, current_step_index, recipe, doc)
+    return result, _annotation_state.degraded
+
+def _nlu_cache_key(command_text, intent, current_step_index, recipe):
+    recipe_id = recipe['id'] if recipe else None
+    if intent in STEP_INTENTS:
+        return (command_text, recipe_id, current_step_index)
+    if intent in RECIPE_INTENTS:
+        return (command_text, recipe_id)
+    return (command_text,)
+
+def process_batch_with_nlu(commands):
+    """process_with_nlu for a list of (command_text, current_step_index, recipe), answers in order.
+
+    Only cache misses are interpreted, each distinct key once, and their Docs are built together
+    by parse_commands.
+    """
+    version = catalog_version()
+    results = [None] * len(commands)
+    pending = {} # cache key -> (command_text, intent, current_step_index, recipe, positions)
+    for position, (command_text, current_step_index, recipe) in enumerate(commands):
+        command_text = normalize_command(command_text)
+        intent = classify_intent(command_text)
+        key = _nlu_cache_key(command_text, intent, current_step_index, recipe)
+        if key in pending:
+            pending[key][4].append(position)
+            continue
+        results[position] = nlu_cache.get(key, version)
+        if results[position] is None:
+            pending[key] = (command_text, intent, current_step_index, recipe, [position])
+
+    docs = parse_commands([(command_text, intent) for command_text, intent, _, _, _ in pending.values()])
+    for (key, (command_text, intent, current_step_index, recipe, positions)), doc in zip(pending.items(), docs):
+        result, degraded = _interpret_uncached(command_text, intent, current_step_index, recipe, doc)
+        if not degraded:
+            nlu_cache.put(key, result, version)
+        for position in positions:
+            results[position] = result
+    return results
+
+def nlu_resolved(result):
+    """Whether an NLU answer stands on its own; otherwise the command goes to the LLM."""
+    return bool(result.get("action")) or result.get("intent") != "unknown"
+
+def interpret_command(command_text, intent, current_step_index, recipe, doc=None):
+    """Answers a classified command from the recipe state, or reports intent "unknown" for the LLM to handle.
+
+    `doc` may be passed in when it was already built by parse_commands.
+    """
+    if doc is None and intent in INTENT_PIPES:
+        doc = parse_command(command_text, intent)
+    action = None
+    response_text = "I'm sorry, I don't understand that command. Could you please rephrase?"
 
     if intent == "next_step":
         if recipe and current_step_index < len(recipe['instructions']) - 1:
@@ -2143,31 +1414,51 @@ def process_with_nlu(command_text, current_step_index, recipe):
     elif intent == "greeting":
         response_text = "Hello there! How can I help you with your cooking today?"
     elif intent == "get_quantity":
-        ingredient_name = ""
-        for token in doc:
-            if token.pos_ == "NOUN" and (token.text.lower() in command_text or any(char.isalpha() for char in token.text)):
-                ingredient_name = token.text.lower()
-                break
+        matcher = catalog_matcher()
+        mentioned = []
+        free_text = command_text
+        for label, phrase in matcher.match(doc):
+            if label == "RECIPE" and phrase in matcher.recipes:
+                recipe = fetch_recipe(matcher.recipes[phrase]) or recipe # "how much flour for banana pancakes"
+                free_text = free_text.replace(phrase, " ")
+            elif label == "INGREDIENT":
+                mentioned.append(phrase)
 
-        for ent in doc.ents:
-            if ent.label_ in ["PRODUCT", "FOOD", "GPE", "ORG"] or any(term in ent.text.lower() for term in ['sugar', 'salt', 'flour', 'milk', 'water', 'butter', 'eggs', 'chicken', 'rice', 'carrots', 'peas', 'beans', 'pasta', 'peppers', 'zucchini', 'broccoli', 'tomatoes', 'pesto']):
-                ingredient_name = ent.text.lower()
-                break
-
-        if ingredient_name and recipe and recipe['ingredients']:
-            found_ingredient = next((ing for ing in recipe['ingredients'] if ingredient_name in ing['name'].lower()), None)
-            if found_ingredient:
-                response_text = f"You need {found_ingredient['quantity']} {found_ingredient['unit'] or ''} of {found_ingredient['name']} for {recipe['name']}."
+        if not (recipe and recipe['ingredients']):
+            response_text = "Which ingredient are you asking about?"
+        else:
+            index = ingredient_index(recipe)
+            if mentioned:
+                entry = next((found for found in map(index.find, mentioned) if found), None)
+                ingredient_name = mentioned[0]
             else:
+                # Catches names the catalog spells differently ("egg" for "large eggs")
+                entry = index.mentioned_in(free_text)
+                ingredient_name = ""
+                if entry is None:
+                    doc = annotate(doc, QUANTITY_FALLBACK_PIPES) # Unannotated if the model is unavailable
+                    ingredient_name = next((token.text.lower() for token in doc if token.pos_ == "NOUN"), "")
+                    ingredient_name = next((ent.text.lower() for ent in doc.ents if ent.label_ in ["PRODUCT", "FOOD", "GPE", "ORG"]), ingredient_name)
+                    entry = index.find(ingredient_name) if ingredient_name else None
+            if entry is not None:
+                response_text = entry[1]
+            elif ingredient_name:
                 response_text = f"I don't see {ingredient_name} listed in this recipe."
-        else:
-            response_text = "Which ingredient are you asking about?"
+            else:
+                response_text = "Which ingredient are you asking about?"
     elif intent == "set_timer":
         time_value = None
         time_unit = ""
+        previous_value = None
         for token in doc:
-            if token.like_num:
-                time_value = int(token.text)
+            if token.text == "-":
+                continue # "twenty-five"
+            value = parse_number(token.text) if token.like_num else None
+            if value is not None:
+                if previous_value in NUMBER_TENS and 0 < value < 10 and token.lower_ in NUMBER_WORDS:
+                    value += previous_value # "twenty five"
+                time_value = value
+            previous_value = value
             if "minute" in token.text.lower():
                 time_unit = "minutes"
             elif "second" in token.text.lower():
@@ -2180,36 +1471,24 @@ def process_with_nlu(command_text, current_step_index, recipe):
         else:
             response_text = "For how long should I set the timer?"
     elif intent == "load_recipe":
-        recipe_name_found = None
-        # Extract full recipe name from command if possible
-        for token in doc:
-            if token.text.lower() == "recipe" and token.head.text.lower() == "load":
-                # Look for named entities or subsequent words as recipe name
-                start_index = token.i + 1
-                if start_index < len(doc):
-                    recipe_name_found = " ".join([t.text for t in doc[start_index:] if not t.is_punct and t.text.lower() not in ["please", "assistant", "for", "me"]]).strip()
-                    if recipe_name_found:
-                        break
-        if not recipe_name_found:
-            for ent in doc.ents:
-                # Try to capture more general entities or common recipe names
-                if ent.label_ in ["PRODUCT", "FOOD", "WORK_OF_ART", "EVENT"] or any(name.lower() in ent.text.lower() for name in ["scrambled eggs", "chicken curry", "vegetable pulao", "pasta primavera", "tomato soup", "guacamole", "stir fry", "lentil soup", "baked salmon", "pancakes", "vegetarian chili", "caprese salad", "garlic shrimp", "quinoa salad", "chocolate chip cookies", "beef tacos", "mushroom risotto", "french toast", "chicken noodle soup", "spaghetti carbonara", "oatmeal", "homemade pizza", "roasted chicken", "black bean burgers", "greek salad", "beef and broccoli", "minestrone soup", "crispy chicken thighs", "pesto chicken sandwich", "avocado toast", "beef stew", "chicken quesadillas", "vegetable frittata", "garden salad", "grilled cheese", "hummus wraps", "tuna sandwich", "chicken skewers", "black bean soup", "spinach omelette", "teriyaki chicken", "lentil pie", "chicken caesar salad", "green curry", "mac and cheese", "chicken fajitas", "tomato pasta", "chicken and rice soup", "pot roast", "chicken pad thai", "veggie burgers", "chicken lettuce wraps", "creamy tomato soup", "chicken enchiladas", "spinach salad", "stuffed bell peppers", "baked ziti", "chicken tenders", "shrimp scampi", "tomato cucumber salad", "breakfast burritos", "fried rice", "cream of mushroom soup", "chicken blt", "roasted vegetable medley", "coleslaw", "chicken alfredo", "spicy black bean tacos", "breakfast smoothie", "bruschetta", "chicken soup with vegetables"]):
-                    recipe_name_found = ent.text.lower()
-                    break
-
+        # "load" and "switch to" are everyday words too ("switch to low heat", "load the dishwasher").
+        # Without the word "recipe" the command only loads a recipe if the rest of it clearly names
+        # one; otherwise it is left to the LLM.
+        asked_for_recipe = re.search(r"\brecipes?\b", command_text) is not None
+        recipe_name_found = extract_recipe_name(command_text)
+        matches = []
         if recipe_name_found:
-            conn = get_db()
-            cursor = conn.cursor()
-            # Use LIKE for partial matching
-            found_db_recipe = cursor.execute("SELECT id, name FROM recipes WHERE LOWER(name) LIKE ?", (f"%{recipe_name_found}%",)).fetchone()
-            conn.close()
-            
-            if found_db_recipe:
-                action = "load_recipe_id"
-                response_text = f"Switching to {found_db_recipe['name']} recipe."
-                return {"response": response_text, "action": action, "recipe_id": found_db_recipe['id']}
-            else:
-                response_text = f"I can't find a recipe called {recipe_name_found}. Please try a different recipe name."
+            min_score = 0.35 if asked_for_recipe else LOAD_WITHOUT_RECIPE_CUE_MIN_SCORE
+            matches = recipe_name_index().search(recipe_name_found, limit=1, min_score=min_score)
+        if matches:
+            score, found_recipe_id, found_recipe_name = matches[0]
+            action = "load_recipe_id"
+            response_text = f"Switching to {found_recipe_name} recipe."
+            return {"response": response_text, "action": action, "recipe_id": found_recipe_id}
+        elif not asked_for_recipe:
+            intent = "unknown"
+        elif recipe_name_found:
+            response_text = f"I can't find a recipe called {recipe_name_found}. Please try a different recipe name."
         else:
             response_text = "Which recipe would you like to load? Say 'Load recipe [name]'."
     elif intent == "back_to_list":
@@ -2224,7 +1503,7 @@ def process_with_nlu(command_text, current_step_index, recipe):
         action = "filter_recipes"
         response_text = "Showing vegetarian recipes."
         return {"response": response_text, "action": action, "category": "Vegetarian"}
-    elif intent == "show non-vegetarian" in command_text or "non-vegetarian recipes" in command_text:
+    elif intent == "show_non_vegetarian":
         action = "filter_recipes"
         response_text = "Showing non-vegetarian recipes."
         return {"response": response_text, "action": action, "category": "Non-Vegetarian"}
@@ -2235,11 +1514,544 @@ def process_with_nlu(command_text, current_step_index, recipe):
 
     return {"response": response_text, "action": action, "intent": intent}
 
-# --- LLM Response Function (OpenAI API based) ---
-def get_ai_response_llm(command_text, current_step_index, recipe):
-    if not openai_api_key:
-        return {"response": "My advanced AI brain is offline due to missing API key.", "action": None}
+# --- LLM Answer Cache ---
+LLM_MODEL = os.environ.get("LLM_MODEL", "gpt-3.5-turbo")
+LLM_TEMPERATURE = float(os.environ.get("LLM_TEMPERATURE", "0.7"))
+LLM_MAX_TOKENS = int(os.environ.get("LLM_MAX_TOKENS", "150"))
+
+# Answers to questions the NLU can't handle, shared by everyone asking the same question in the
+# same recipe context. The on-disk tier lives in its own file so the catalog database can stay
+# read-only (snapshot mode) and its version isn't bumped by cache writes.
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "1") == "1"
+LLM_CACHE_DATABASE = os.environ.get("LLM_CACHE_DATABASE", "llm_cache.db")
+LLM_CACHE_MEMORY_SIZE = int(os.environ.get("LLM_CACHE_MEMORY_SIZE", "1024"))
+LLM_CACHE_MAX_ROWS = int(os.environ.get("LLM_CACHE_MAX_ROWS", "100000"))
+LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_EVICT_EVERY = 100 # stores between two eviction passes over the table
+# Idle connections to the cache file kept per process, shared by all request threads
+LLM_CACHE_POOL_SIZE = int(os.environ.get("LLM_CACHE_POOL_SIZE", "4"))
+# A disk hit only rewrites the row's last use once it is older than this share of the TTL, so
+# repeated reads of the same answer don't each turn into a write.
+LLM_CACHE_TOUCH_FRACTION = 0.05
+
+LLM_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_answers (
+    key TEXT PRIMARY KEY,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_answers_created_at ON llm_answers (created_at);
+CREATE INDEX IF NOT EXISTS idx_llm_answers_last_used_at ON llm_answers (last_used_at);
+"""
+
+class LLMAnswerCache:
+    """Two-tier answer cache: an in-process LRU in front of an SQLite table shared by all workers.
+
+    Entries expire `ttl` seconds after they were stored. The table is kept to `max_rows` by
+    dropping the least recently used rows. To keep reads from turning into writes, hits served
+    from memory don't count as uses on disk, and a disk hit only records its use when the last
+    recorded one is older than LLM_CACHE_TOUCH_FRACTION of the TTL.
+    """
+
+    def __init__(self, path, memory_size, max_rows, ttl):
+        self.path = path
+        self.max_rows = max_rows
+        self.ttl = ttl
+        self.memory = LRUCache(memory_size)
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0, "stores": 0, "errors": 0}
+        self._stores_since_evict = 0
+        self._pool = queue.LifoQueue(maxsize=max(LLM_CACHE_POOL_SIZE, 1))
+        self._schema_ready = False
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_connections)
+
+    def _reset_connections(self):
+        """Drops pooled connections; they must never be shared across a fork."""
+        self._pool = queue.LifoQueue(maxsize=max(LLM_CACHE_POOL_SIZE, 1))
+
+    def _acquire(self):
+        """Takes an idle connection from the pool, or opens a new one if none is available."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        conn = sqlite3.connect(self.path, timeout=DB_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            # WAL mode is stored in the file, so it is set along with the schema, once per process
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(LLM_CACHE_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def _release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    @staticmethod
+    def make_key(messages):
+        payload = {"model": LLM_MODEL, "temperature": LLM_TEMPERATURE, "max_tokens": LLM_MAX_TOKENS, "messages": messages}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        now = time.time()
+        entry = self.memory.get(key)
+        if entry is not None and now - entry[1] < self.ttl:
+            self._count("memory_hits")
+            return entry[0]
+        try:
+            conn = self._acquire()
+            try:
+                row = conn.execute("SELECT answer, created_at, last_used_at FROM llm_answers WHERE key = ? AND created_at > ?",
+                                   (key, now - self.ttl)).fetchone()
+                if row is not None and now - row[2] > self.ttl * LLM_CACHE_TOUCH_FRACTION:
+                    conn.execute("UPDATE llm_answers SET last_used_at = ? WHERE key = ?", (now, key))
+                    conn.commit()
+            finally:
+                self._release(conn)
+        except sqlite3.Error as e:
+            print(f"LLM cache read failed: {e}")
+            self._count("errors")
+            row = None
+        if row is None:
+            self._count("misses")
+            return None
+        self.memory.put(key, (row[0], row[1]))
+        self._count("disk_hits")
+        return row[0]
+
+    def put(self, key, answer):
+        now = time.time()
+        self.memory.put(key, (answer, now))
+        try:
+            conn = self._acquire()
+            try:
+                conn.execute("INSERT OR REPLACE INTO llm_answers (key, answer, created_at, last_used_at) VALUES (?, ?, ?, ?)", (key, answer, now, now))
+                with self._lock:
+                    self.counters["stores"] += 1
+                    self._stores_since_evict += 1
+                    evict = self._stores_since_evict >= LLM_CACHE_EVICT_EVERY
+                    if evict:
+                        self._stores_since_evict = 0
+                if evict:
+                    self._evict(conn, now)
+                conn.commit()
+            finally:
+                self._release(conn)
+        except sqlite3.Error as e:
+            print(f"LLM cache write failed: {e}")
+            self._count("errors")
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM llm_answers WHERE created_at <= ?", (now - self.ttl,))
+        conn.execute("DELETE FROM llm_answers WHERE key IN (SELECT key FROM llm_answers ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)", (self.max_rows,))
+
+    def stats(self):
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["memory_hits"] + counters["disk_hits"] + counters["misses"]
+        counters["hit_rate"] = round((counters["memory_hits"] + counters["disk_hits"]) / lookups, 4) if lookups else 0.0
+        counters["memory"] = self.memory.stats()
+        try:
+            conn = self._acquire()
+            try:
+                counters["disk_rows"] = conn.execute("SELECT count(*) FROM llm_answers").fetchone()[0]
+            finally:
+                self._release(conn)
+        except sqlite3.Error:
+            counters["disk_rows"] = None
+        return counters
+
+llm_cache = LLMAnswerCache(LLM_CACHE_DATABASE, LLM_CACHE_MEMORY_SIZE, LLM_CACHE_MAX_ROWS, LLM_CACHE_TTL)
+
+# --- LLM Admission Control ---
+# Each worker process admits at most LLM_MAX_CONCURRENT API calls at once and lets up to
+# LLM_MAX_QUEUE more wait LLM_QUEUE_TIMEOUT seconds for a slot. Everything beyond that is turned
+# away at once, so a burst of questions can't tie up every request thread; keep the two together
+# below GUNICORN_THREADS so NLU commands always find a free thread. On top of that each address
+# gets a token bucket of LLM_ADDRESS_BURST calls, refilled at LLM_ADDRESS_RATE calls per second,
+# and within it each session (X-Session-Id) one of LLM_CLIENT_BURST, refilled at LLM_CLIENT_RATE.
+# The session id is chosen by the client, so it only splits an address's budget between the
+# people behind it (a household on one connection) and never adds to it.
+LLM_MAX_CONCURRENT = int(os.environ.get("LLM_MAX_CONCURRENT", "4"))
+LLM_MAX_QUEUE = int(os.environ.get("LLM_MAX_QUEUE", "3"))
+LLM_QUEUE_TIMEOUT = float(os.environ.get("LLM_QUEUE_TIMEOUT", "3"))
+LLM_CLIENT_RATE = float(os.environ.get("LLM_CLIENT_RATE", "0.5"))
+LLM_CLIENT_BURST = float(os.environ.get("LLM_CLIENT_BURST", "5"))
+LLM_ADDRESS_RATE = float(os.environ.get("LLM_ADDRESS_RATE", "2"))
+LLM_ADDRESS_BURST = float(os.environ.get("LLM_ADDRESS_BURST", "20"))
+LLM_OVERLOAD_RETRY_AFTER = int(os.environ.get("LLM_OVERLOAD_RETRY_AFTER", "2"))
+LLM_MAX_TRACKED_CLIENTS = 10000
+LLM_OVERLOAD_RESPONSES = {
+    "rate_limited": "You're asking questions faster than I can think. Please wait a moment and ask again.",
+    "queue_full": "I'm getting a lot of questions right now. Please ask again in a few seconds.",
+    "queue_timeout": "I'm getting a lot of questions right now. Please ask again in a few seconds.",
+}
+
+class LLMOverloaded(Exception):
+    """An LLM call turned away by admission control; `reason` keys LLM_OVERLOAD_RESPONSES."""
+
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+        self.status = 429 if reason == "rate_limited" else 503
+
+    def result(self):
+        return {"response": LLM_OVERLOAD_RESPONSES[self.reason], "action": None, "overloaded": self.reason}
+
+class LLMAdmission:
+    """Global concurrency limit with a bounded wait queue, plus token buckets per address and session.
+
+    Every question asked is charged to its client with check_rate; only calls that really go
+    upstream take a slot with acquire, so requests sharing one call (see llm_flights) don't.
+    """
+
+    def __init__(self, max_concurrent, max_queue, queue_timeout, client_rate, client_burst, address_rate, address_burst):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.address_rate = address_rate
+        self.address_burst = address_burst
+        self.in_flight = 0
+        self.waiting = 0
+        self.counters = {"admitted": 0, "rate_limited": 0, "queue_full": 0, "queue_timeout": 0, "max_waiting": 0}
+        self._buckets = OrderedDict() # address or (address, session) -> (tokens, last refill), least recently seen first
+        self._slot_freed = threading.Condition()
+
+    def _refill(self, key, rate, burst, now):
+        """Tokens in a bucket now, marking it most recently seen. Needs _slot_freed held."""
+        tokens, last = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - last) * rate)
+        self._buckets[key] = (tokens, now)
+        return tokens
+
+    def check_rate(self, client):
+        """Charges the client, (address, session id), one call from both its buckets.
+
+        Raises LLMOverloaded, charging neither, when either is empty.
+        """
+        if client is None:
+            return
+        address, session = client
+        buckets = [(address, self.address_rate, self.address_burst), ((address, session), self.client_rate, self.client_burst)]
+        with self._slot_freed:
+            now = time.monotonic()
+            levels = [(key, rate, self._refill(key, rate, burst, now)) for key, rate, burst in buckets]
+            waits = [(1 - tokens) / rate if rate > 0 else float(LLM_OVERLOAD_RETRY_AFTER) for _, rate, tokens in levels if tokens < 1]
+            if not waits:
+                for key, _, tokens in levels:
+                    self._buckets[key] = (tokens - 1, now)
+            while len(self._buckets) > LLM_MAX_TRACKED_CLIENTS:
+                self._buckets.popitem(last=False)
+            if waits:
+                self.counters["rate_limited"] += 1
+                raise LLMOverloaded("rate_limited", max(1, int(max(waits) + 0.999)))
+
+    def acquire(self):
+        """Takes a call slot, waiting in the queue if needed; raises LLMOverloaded."""
+        with self._slot_freed:
+            if self.in_flight >= self.max_concurrent:
+                if self.waiting >= self.max_queue:
+                    self.counters["queue_full"] += 1
+                    raise LLMOverloaded("queue_full", LLM_OVERLOAD_RETRY_AFTER)
+                self.waiting += 1
+                self.counters["max_waiting"] = max(self.counters["max_waiting"], self.waiting)
+                try:
+                    admitted = self._slot_freed.wait_for(lambda: self.in_flight < self.max_concurrent, self.queue_timeout)
+                finally:
+                    self.waiting -= 1
+                if not admitted:
+                    self.counters["queue_timeout"] += 1
+                    raise LLMOverloaded("queue_timeout", LLM_OVERLOAD_RETRY_AFTER)
+            self.in_flight += 1
+            self.counters["admitted"] += 1
+
+    def release(self):
+        with self._slot_freed:
+            self.in_flight -= 1
+            self._slot_freed.notify()
+
+    def stats(self):
+        with self._slot_freed:
+            return dict(self.counters, in_flight=self.in_flight, waiting=self.waiting, max_concurrent=self.max_concurrent,
+                        max_queue=self.max_queue, tracked_clients=len(self._buckets))
+
+llm_admission = LLMAdmission(LLM_MAX_CONCURRENT, LLM_MAX_QUEUE, LLM_QUEUE_TIMEOUT, LLM_CLIENT_RATE, LLM_CLIENT_BURST,
+                             LLM_ADDRESS_RATE, LLM_ADDRESS_BURST)
+
+# Behind a reverse proxy (Render, nginx) remote_addr is the proxy's address, so every user would
+# share one address budget. TRUSTED_PROXY_HOPS sets how many proxies in front of the app append
+# to X-Forwarded-For; remote_addr is then the address the outermost of them saw.
+TRUSTED_PROXY_HOPS = int(os.environ.get("TRUSTED_PROXY_HOPS", "0"))
+if TRUSTED_PROXY_HOPS:
+    from werkzeug.middleware.proxy_fix import ProxyFix
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS)
+
+def request_client_id():
+    """Who a request's LLM calls are rate limited as: (remote address, the page's session id or "")."""
+    return request.remote_addr, request.headers.get('X-Session-Id', '')
+
+# --- LLM Upstream Calls ---
+# Transient failures (connection errors, timeouts, 429 and 5xx answers) are retried up to
+# OPENAI_MAX_RETRIES times, waiting a random time up to OPENAI_RETRY_BASE_DELAY * 2**attempt
+# (at most OPENAI_RETRY_MAX_DELAY), and at least as long as a Retry-After header asks. An answer
+# asking for a longer pause than OPENAI_RETRY_MAX_DELAY isn't retried: the user would rather get
+# the offline answer now. A call that still fails counts toward the circuit breaker:
+# after LLM_BREAKER_FAILURES failed calls in a row it opens, and for LLM_BREAKER_RESET_SECONDS
+# every call is answered offline without touching the network. Then a single trial call decides
+# whether it closes again.
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", "2"))
+OPENAI_RETRY_BASE_DELAY = float(os.environ.get("OPENAI_RETRY_BASE_DELAY", "0.25"))
+OPENAI_RETRY_MAX_DELAY = float(os.environ.get("OPENAI_RETRY_MAX_DELAY", "2"))
+LLM_BREAKER_FAILURES = int(os.environ.get("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_RESET_SECONDS = float(os.environ.get("LLM_BREAKER_RESET_SECONDS", "30"))
+LLM_UNAVAILABLE_RESPONSE = "My advanced AI brain is offline right now. I can still help with the recipe steps, ingredients and timers."
+
+class LLMUnavailable(Exception):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker: closed -> open -> half open (one trial call) -> closed."""
+
+    def __init__(self, failure_threshold, reset_seconds):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.counters = {"opened": 0, "short_circuited": 0, "retries": 0, "failures": 0}
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Whether a call may go out now; in half open state only the one trial call may."""
+        with self._lock:
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = "half_open"
+            if self.state == "closed" or (self.state == "half_open" and not self._trial_running):
+                self._trial_running = self.state == "half_open"
+                return True
+            self.counters["short_circuited"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.counters["failures"] += 1
+            self._trial_running = False
+            if self.state == "half_open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.counters["opened"] += 1
+                print(f"OpenAI API unhealthy after {self.failures} failed calls; answering offline for {self.reset_seconds:g}s.")
+
+    def record_other(self):
+        """A call ended with an error that says nothing about upstream health (e.g. a bad request)."""
+        with self._lock:
+            self._trial_running = False
+
+    def count_retry(self):
+        with self._lock:
+            self.counters["retries"] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, state=self.state, consecutive_failures=self.failures)
+
+llm_breaker = CircuitBreaker(LLM_BREAKER_FAILURES, LLM_BREAKER_RESET_SECONDS)
+
+def is_transient_llm_error(error):
+    import openai
+    return isinstance(error, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError))
+
+def _retry_delay(error, attempt):
+    """Seconds to wait before retrying, or None when upstream asked for a longer pause than we wait."""
+    delay = random.uniform(0, min(OPENAI_RETRY_MAX_DELAY, OPENAI_RETRY_BASE_DELAY * 2 ** attempt))
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after and retry_after.replace(".", "", 1).isdigit():
+        if float(retry_after) > OPENAI_RETRY_MAX_DELAY:
+            return None
+        delay = max(delay, float(retry_after))
+    return delay
+
+def create_chat_completion(messages, stream=False):
+    """chat.completions.create with the app's model settings, retries and circuit breaker.
+
+    Raises LLMUnavailable while the breaker is open. A stream is only retried while it is being
+    opened; errors while reading it are left to the caller.
+    """
+    if not llm_breaker.allow():
+        raise LLMUnavailable()
+    attempt = 0
+    while True:
+        try:
+            result = get_openai_client().chat.completions.create(
+                model=LLM_MODEL,
+                messages=messages,
+                temperature=LLM_TEMPERATURE,
+                max_tokens=LLM_MAX_TOKENS,
+                stream=stream
+            )
+        except Exception as e:
+            if not is_transient_llm_error(e):
+                llm_breaker.record_other()
+                raise
+            delay = _retry_delay(e, attempt) if attempt < OPENAI_MAX_RETRIES else None
+            if delay is None:
+                llm_breaker.record_failure()
+                raise
+            llm_breaker.count_retry()
+            time.sleep(delay)
+            attempt += 1
+            continue
+        llm_breaker.record_success()
+        return result
+
+# --- LLM Request Coalescing ---
+class _Flight:
+    def __init__(self):
+        self.chunks = [] # Sentences so far, for streamed calls
+        self.result = None
+        self.error = None
+        self.finished = False
+        self.followers = 0
+        self.changed = threading.Condition()
+
+class SingleFlight:
+    """Coalesces concurrent identical calls: the first caller for a key (the leader) makes the
+    call and every caller arriving before it finishes shares its outcome, result or exception.
+
+    Streamed calls publish each sentence as it arrives, so followers can speak along. Errors in
+    `retry_on` mean the leader never got to make the call (it was turned away by admission
+    control); they aren't shared, its followers join again and one of them leads instead.
+    saved_calls counts followers that got a complete result.
+    """
+
+    def __init__(self, retry_on=()):
+        self.retry_on = retry_on
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.counters = {"upstream_calls": 0, "saved_calls": 0}
+
+    def join(self, key):
+        """(flight, is_leader); the leader must end the flight with finish()."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.followers += 1
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def publish(self, flight, chunk):
+        with flight.changed:
+            flight.chunks.append(chunk)
+            flight.changed.notify_all()
+
+    def finish(self, key, flight, result=None, error=None):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key] # Callers arriving from now on start a new call
+            if not isinstance(error, self.retry_on):
+                self.counters["upstream_calls"] += 1
+        with flight.changed:
+            flight.result, flight.error, flight.finished = result, error, True
+            flight.changed.notify_all()
+
+    def abandon(self, key, flight):
+        """Ends a flight whose leader went away, unless it has followers; returns whether it did."""
+        with self._lock:
+            if flight.followers:
+                return False
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            self.counters["upstream_calls"] += 1
+        with flight.changed:
+            flight.error, flight.finished = ConnectionAbortedError("The request making this call went away"), True
+            flight.changed.notify_all()
+        return True
+
+    def follow(self, flight):
+        """Yields the flight's chunks as they are published, or its whole result if it had none."""
+        position = 0
+        while True:
+            with flight.changed:
+                flight.changed.wait_for(lambda: flight.finished or len(flight.chunks) > position)
+                chunks, finished = flight.chunks[position:], flight.finished
+            position += len(chunks)
+            yield from chunks
+            if finished:
+                break
+        if flight.error is None:
+            with self._lock:
+                self.counters["saved_calls"] += 1
+        if flight.error is not None:
+            raise flight.error
+        if not position and flight.result:
+            yield flight.result
+
+    def stream(self, key, lead):
+        """Yields the chunks of the call for key: lead(flight) makes it if no identical call is in flight."""
+        while True:
+            flight, leader = self.join(key)
+            if leader:
+                yield from lead(flight)
+                return
+            try:
+                yield from self.follow(flight)
+                return
+            except self.retry_on:
+                if flight.chunks:
+                    raise
 
+    def do(self, key, call):
+        """call()'s result, made by this caller or shared with the one already making it."""
+        while True:
+            flight, leader = self.join(key)
+            if leader:
+                try:
+                    result = call()
+                except Exception as e:
+                    self.finish(key, flight, error=e)
+                    raise
+                self.finish(key, flight, result=result)
+                return result
+            try:
+                for _ in self.follow(flight):
+                    pass
+            except self.retry_on:
+                continue
+            return flight.result
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, in_flight=len(self._flights))
+
+llm_flights = SingleFlight(retry_on=(LLMOverloaded,))
+
+# --- LLM Response Function (OpenAI API based) ---
+def build_llm_messages(command_text, current_step_index, recipe):
+    """The chat messages sent for a command: system prompt, recipe context and the question."""
     context_messages = [
         {"role": "system", "content": "You are a helpful and friendly voice-controlled cooking assistant. Provide concise, helpful answers. Keep cooking safety in mind. If the user asks about a step or ingredient, refer to the current recipe details provided. Do not invent recipe steps or ingredients."},
     ]
@@ -2255,21 +2067,179 @@ def get_ai_response_llm(command_text, current_step_index, recipe):
     else:
         context_messages.append({"role": "system", "content": "No specific recipe is currently loaded. You can ask general cooking questions or ask to 'load recipe [name]'."})
 
+    context_messages.append({"role": "user", "content": normalize_command(command_text)})
+    return context_messages
+
+LLM_OFFLINE_RESPONSE = "My advanced AI brain is offline due to missing API key."
+LLM_ERROR_RESPONSE = "I'm sorry, I'm having trouble thinking right now. Please try again or rephrase your question."
+
+def _llm_cache_lookup(messages, bypass_cache):
+    """(cache key, cached answer) for the messages; the key is None when the cache is off."""
+    if not LLM_CACHE_ENABLED:
+        return None, None
+    cache_key = LLMAnswerCache.make_key(messages)
+    if bypass_cache:
+        llm_cache._count("bypassed")
+        return cache_key, None
+    return cache_key, llm_cache.get(cache_key)
 
-    context_messages.append({"role": "user", "content": command_text})
+def get_ai_response_llm(command_text, current_step_index, recipe, bypass_cache=False, client=None):
+    """Answers a command with the LLM, reusing a cached answer for the same question and context.
 
+    With bypass_cache the cache isn't read, but the fresh answer still replaces the cached one.
+    Calls that do reach the API go through llm_admission, which may raise LLMOverloaded.
+    """
+    if not openai_api_key:
+        return {"response": LLM_OFFLINE_RESPONSE, "action": None}
+
+    messages = build_llm_messages(command_text, current_step_index, recipe)
+    cache_key, cached = _llm_cache_lookup(messages, bypass_cache)
+    if cached is not None:
+        return {"response": cached, "action": None}
+
+    llm_admission.check_rate(client)
     try:
-        chat_completion = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=context_messages,
-            temperature=0.7,
-            max_tokens=150
-        )
-        response_content = chat_completion.choices[0].message.content.strip()
-        return {"response": response_content, "action": None}
+        # Identical questions asked at the same moment share one upstream call
+        response_content = llm_flights.do(cache_key or LLMAnswerCache.make_key(messages), lambda: _complete(messages, cache_key))
+    except LLMUnavailable:
+        return {"response": LLM_UNAVAILABLE_RESPONSE, "action": None}
+    except LLMOverloaded:
+        raise
     except Exception as e:
         print(f"Error calling OpenAI API: {e}")
-        return {"response": "I'm sorry, I'm having trouble thinking right now. Please try again or rephrase your question.", "action": None}
+        return {"response": LLM_ERROR_RESPONSE, "action": None}
+    return {"response": response_content, "action": None}
+
+def _complete(messages, cache_key):
+    """One upstream call for get_ai_response_llm, cached when it succeeds."""
+    llm_admission.acquire()
+    try:
+        response_content = create_chat_completion(messages).choices[0].message.content.strip()
+    finally:
+        llm_admission.release()
+    if cache_key is not None and response_content:
+        llm_cache.put(cache_key, response_content)
+    return response_content
+
+# A sentence ends at ., ! or ? followed by whitespace; decimals like "1.5" don't split
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+def split_sentences(buffer):
+    """(complete sentences, rest) for streamed text; the rest may still grow into a sentence."""
+    parts = _SENTENCE_END.split(buffer)
+    return [part.strip() for part in parts[:-1] if part.strip()], parts[-1]
+
+def stream_ai_response_llm(command_text, current_step_index, recipe, bypass_cache=False, client=None):
+    """Like get_ai_response_llm, but yields the answer sentence by sentence as it is generated.
+
+    Yields ("chunk", sentence) events and then one ("done", result) with the whole answer. A
+    cached answer or an error comes as a single chunk. Only complete answers are cached.
+    LLMOverloaded is raised from the first next(), before anything is yielded.
+    """
+    if not openai_api_key:
+        yield "chunk", LLM_OFFLINE_RESPONSE
+        yield "done", {"response": LLM_OFFLINE_RESPONSE, "action": None}
+        return
+
+    messages = build_llm_messages(command_text, current_step_index, recipe)
+    cache_key, cached = _llm_cache_lookup(messages, bypass_cache)
+    if cached is not None:
+        yield "chunk", cached
+        yield "done", {"response": cached, "action": None}
+        return
+
+    llm_admission.check_rate(client)
+    flight_key = cache_key or LLMAnswerCache.make_key(messages)
+    source = llm_flights.stream(flight_key, lambda flight: _lead_stream(flight_key, flight, messages, cache_key))
+    sentences, failure = [], None
+    try:
+        for sentence in source:
+            sentences.append(sentence)
+            yield "chunk", sentence
+    except LLMOverloaded:
+        raise # Only ever before the first sentence
+    except LLMUnavailable:
+        failure = LLM_UNAVAILABLE_RESPONSE
+    except Exception as e:
+        print(f"Error streaming from OpenAI API: {e}")
+        failure = LLM_ERROR_RESPONSE
+    if failure and not sentences:
+        yield "chunk", failure
+        yield "done", {"response": failure, "action": None}
+        return
+    # After a failure part of the answer was already spoken; finish with what we have
+    yield "done", {"response": " ".join(sentences), "action": None}
+
+def _stream_sentences(messages):
+    """Sentences of a streamed completion as each one is complete."""
+    buffer = ""
+    for event in create_chat_completion(messages, stream=True):
+        if not event.choices:
+            continue
+        buffer += event.choices[0].delta.content or ""
+        complete, buffer = split_sentences(buffer)
+        yield from complete
+    if buffer.strip():
+        yield buffer.strip()
+
+def _lead_stream(flight_key, flight, messages, cache_key):
+    """The upstream stream for a flight's leader, publishing every sentence to its followers.
+
+    If the leader's client goes away while others follow the flight, a thread reads the rest
+    of the answer for them.
+    """
+    try:
+        llm_admission.acquire()
+    except LLMOverloaded as e:
+        llm_flights.finish(flight_key, flight, error=e)
+        raise
+    upstream, sentences, handed_over = _stream_sentences(messages), [], False
+    try:
+        for sentence in upstream:
+            sentences.append(sentence)
+            llm_flights.publish(flight, sentence)
+            yield sentence
+    except Exception as e:
+        _end_stream(flight_key, flight, sentences, cache_key, error=e)
+        raise
+    except GeneratorExit:
+        handed_over = not llm_flights.abandon(flight_key, flight)
+        if handed_over:
+            threading.Thread(target=_read_on, args=(flight_key, flight, upstream, sentences, cache_key),
+                             name="llm-stream", daemon=True).start()
+        else:
+            upstream.close()
+        raise
+    else:
+        _end_stream(flight_key, flight, sentences, cache_key)
+    finally:
+        if not handed_over:
+            llm_admission.release()
+
+def _read_on(flight_key, flight, upstream, sentences, cache_key):
+    """Reads the rest of a streamed answer for the followers of a leader that went away."""
+    try:
+        for sentence in upstream:
+            sentences.append(sentence)
+            llm_flights.publish(flight, sentence)
+    except Exception as e:
+        _end_stream(flight_key, flight, sentences, cache_key, error=e)
+    else:
+        _end_stream(flight_key, flight, sentences, cache_key)
+    finally:
+        llm_admission.release()
+
+def _end_stream(flight_key, flight, sentences, cache_key, error=None):
+    """Finishes a streamed flight; only a complete answer is cached."""
+    if error is not None:
+        if sentences and is_transient_llm_error(error):
+            llm_breaker.record_failure() # Broke off mid-answer, after the call had counted as a success
+        llm_flights.finish(flight_key, flight, error=error)
+        return
+    response_content = " ".join(sentences)
+    if cache_key is not None and response_content:
+        llm_cache.put(cache_key, response_content)
+    llm_flights.finish(flight_key, flight, result=response_content)
 
 # --- Flask Routes ---
 @app.route('/')
@@ -2280,49 +2250,100 @@ def index():
 @app.route('/api/recipe/<int:recipe_id>')
 def get_recipe(recipe_id):
     """Fetches a specific recipe from the database by ID."""
-    conn = get_db()
-    cursor = conn.cursor()
-    recipe = cursor.execute("SELECT * FROM recipes WHERE id = ?", (recipe_id,)).fetchone()
-    conn.close()
+    def build():
+        recipe = fetch_recipe(recipe_id)
+        if recipe:
+            return jsonify(recipe)
+        return jsonify({"error": "Recipe not found"}), 404
+    return cached_json_response(('recipe', recipe_id), build)
 
-    if recipe:
-        recipe_dict = dict(recipe)
-        if recipe_dict.get('instructions'):
-            recipe_dict['instructions'] = json.loads(recipe_dict['instructions'])
-        if recipe_dict.get('ingredients'):
-            recipe_dict['ingredients'] = json.loads(recipe_dict['ingredients'])
-        return jsonify(recipe_dict)
-    return jsonify({"error": "Recipe not found"}), 404
+# Columns a recipe list may select with ?fields=; also the default when fields is omitted.
+LIST_FIELDS = ("id", "name", "cuisine", "category", "prep_time", "cook_time", "servings", "image_url")
+LIST_MAX_LIMIT = 100
+
+def _encode_cursor(row):
+    """Opaque continuation token holding the (name, id) of the last row on a page."""
+    return base64.urlsafe_b64encode(json.dumps([row['name'], row['id']]).encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    name, recipe_id = json.loads(base64.urlsafe_b64decode(padded))
+    if not isinstance(name, str) or not isinstance(recipe_id, int):
+        raise ValueError("malformed cursor")
+    return name, recipe_id
+
+def list_recipes(category=None):
+    """Shared body of the list endpoints.
+
+    Without limit/cursor the whole (optionally filtered) list is returned as a JSON array,
+    as before. With either, a page of at most `limit` rows is returned together with a
+    next_cursor; pages are fetched by keyset on (name, id), so each costs the same no matter
+    how deep into the catalog it is.
+    """
+    fields = LIST_FIELDS
+    if request.args.get('fields'):
+        fields = tuple(f.strip() for f in request.args['fields'].split(',') if f.strip())
+        unknown = [f for f in fields if f not in LIST_FIELDS]
+        if unknown or not fields:
+            return jsonify({"error": f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(LIST_FIELDS)}"}), 400
+
+    cursor = request.args.get('cursor')
+    paged = cursor is not None or 'limit' in request.args
+    limit = min(max(request.args.get('limit', LIST_MAX_LIMIT, type=int), 1), LIST_MAX_LIMIT)
+
+    # name and id are always read because the cursor is built from them.
+    columns = ", ".join(dict.fromkeys(("id", "name") + fields))
+    where, params = [], []
+    if category and category.lower() != 'all':
+        where.append("LOWER(category) = ?")
+        params.append(category.lower())
+    if cursor:
+        try:
+            after_name, after_id = _decode_cursor(cursor)
+        except (ValueError, TypeError):
+            return jsonify({"error": "Invalid cursor"}), 400
+        where.append("(name, id) > (?, ?)")
+        params.extend((after_name, after_id))
+    sql = f"SELECT {columns} FROM recipes"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY name ASC, id ASC"
+    if paged:
+        sql += " LIMIT ?"
+        params.append(limit + 1) # One extra row tells us whether another page exists
+
+    rows = get_db().execute(sql, params).fetchall()
+    if not paged:
+        return jsonify([{f: r[f] for f in fields} for r in rows])
+    recipe_list = [{f: r[f] for f in fields} for r in rows[:limit]]
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return jsonify({"recipes": recipe_list, "next_cursor": next_cursor})
 
 @app.route('/api/recipes')
 def get_all_recipes():
-    """Fetches a list of all recipe names and their IDs."""
-    conn = get_db()
-    cursor = conn.cursor()
-    # Select all fields needed for listing and filtering
-    recipes = cursor.execute("SELECT id, name, cuisine, category, prep_time, cook_time, servings, image_url FROM recipes ORDER BY name ASC").fetchall()
-    conn.close()
-    
-    recipe_list = [dict(r) for r in recipes]
-    return jsonify(recipe_list)
+    """Fetches the list of all recipes (summary fields only), optionally paginated."""
+    return cached_json_response(_request_cache_key(), list_recipes)
 
 @app.route('/api/recipes_by_category')
 def get_recipes_by_category():
-    """Fetches recipes filtered by category."""
+    """Fetches recipes filtered by category, optionally paginated."""
     category = request.args.get('category') # Get category from query parameter
-    conn = get_db()
-    cursor = conn.cursor()
+    return cached_json_response(_request_cache_key(), lambda: list_recipes(category))
 
-    if category and category.lower() != 'all':
-        recipes = cursor.execute("SELECT id, name, cuisine, category, prep_time, cook_time, servings, image_url FROM recipes WHERE LOWER(category) = ? ORDER BY name ASC", (category.lower(),)).fetchall()
-    else:
-        # If no category or "All", return all recipes
-        recipes = cursor.execute("SELECT id, name, cuisine, category, prep_time, cook_time, servings, image_url FROM recipes ORDER BY name ASC").fetchall()
-    
-    conn.close()
-    recipe_list = [dict(r) for r in recipes]
-    return jsonify(recipe_list)
 
+def overloaded_response(error):
+    """The canned answer for a turned-away LLM call: 429 when rate limited, 503 when overloaded."""
+    response = jsonify(error.result())
+    response.status_code = error.status
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def llm_answer_or_overloaded(*args, **kwargs):
+    """get_ai_response_llm for batches: a turned-away command gets its canned answer in place."""
+    try:
+        return get_ai_response_llm(*args, **kwargs)
+    except LLMOverloaded as e:
+        return dict(e.result(), retry_after=e.retry_after)
 
 @app.route('/api/process_command', methods=['POST'])
 def process_command_route():
@@ -2333,26 +2354,274 @@ def process_command_route():
 
     recipe = None
     if recipe_id:
-        conn = get_db()
-        cursor = conn.cursor()
-        fetched_recipe = cursor.execute("SELECT * FROM recipes WHERE id = ?", (recipe_id,)).fetchone()
-        conn.close()
-        if fetched_recipe:
-            recipe = dict(fetched_recipe)
-            if recipe.get('instructions'):
-                recipe['instructions'] = json.loads(recipe['instructions'])
-            if recipe.get('ingredients'):
-                recipe['ingredients'] = json.loads(recipe['ingredients'])
+        recipe = fetch_recipe(recipe_id)
 
     nlu_result = process_with_nlu(command, current_step_index, recipe)
 
-    if nlu_result.get("action") or nlu_result.get("intent") != "unknown":
+    if nlu_resolved(nlu_result):
         return jsonify(nlu_result)
     else:
-        llm_result = get_ai_response_llm(command, current_step_index, recipe)
+        try:
+            llm_result = get_ai_response_llm(command, current_step_index, recipe, bypass_cache=bool(data.get('bypass_cache')),
+                                             client=request_client_id())
+        except LLMOverloaded as e:
+            return overloaded_response(e)
         return jsonify(llm_result)
 
+BATCH_MAX_COMMANDS = int(os.environ.get("BATCH_MAX_COMMANDS", "100"))
+# Upper bound on LLM calls one batch request makes at the same time.
+LLM_BATCH_CONCURRENCY = int(os.environ.get("LLM_BATCH_CONCURRENCY", "4"))
+
+def _sse_event(name, data):
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+@app.route('/api/process_command_stream', methods=['POST'])
+def process_command_stream_route():
+    """Same input and answers as /api/process_command, as Server-Sent Events.
+
+    LLM answers arrive as "chunk" events of one or more whole sentences, so speech can start
+    on the first one. Every stream ends with a "done" event carrying the full result, which
+    is all an NLU-handled command sends.
+    """
+    data = request.json
+    command = data.get('command', '').lower()
+    current_step_index = data.get('current_step', 0)
+    recipe_id = data.get('recipe_id')
+
+    recipe = fetch_recipe(recipe_id) if recipe_id else None
+    nlu_result = process_with_nlu(command, current_step_index, recipe)
+
+    if nlu_resolved(nlu_result):
+        events = iter([("done", nlu_result)])
+    else:
+        events = stream_ai_response_llm(command, current_step_index, recipe, bypass_cache=bool(data.get('bypass_cache')),
+                                        client=request_client_id())
+        try:
+            first = next(events) # Admission happens here, while a plain error response can still be sent
+        except LLMOverloaded as e:
+            return overloaded_response(e)
+        events = itertools.chain([first], events)
+
+    def generate():
+        for name, payload in events:
+            yield _sse_event(name, {"text": payload} if name == "chunk" else payload)
+
+    response = app.response_class(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no' # Keep proxies like nginx from buffering the stream
+    return response
+
+@app.route('/api/process_commands', methods=['POST'])
+def process_commands_route():
+    """Answers a list of {command, recipe_id, current_step} objects, in order.
+
+    Accepts the list itself or {"commands": [...]}. Recipes are fetched once per distinct id,
+    NLU runs over the whole batch, and only unresolved commands go to the LLM, concurrently.
+    """
+    data = request.get_json(silent=True)
+    items = data.get('commands') if isinstance(data, dict) else data
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return jsonify({"error": "Expected a list of {command, recipe_id, current_step} objects"}), 400
+    if len(items) > BATCH_MAX_COMMANDS:
+        return jsonify({"error": f"At most {BATCH_MAX_COMMANDS} commands per request"}), 400
+
+    commands = [str(item.get('command', '')).lower() for item in items]
+    recipe_ids, steps = [], []
+    for position, item in enumerate(items):
+        # Recipes are looked up by their integer id, so "1" must find the same recipe as 1
+        try:
+            recipe_ids.append(int(item['recipe_id']) if item.get('recipe_id') else None)
+            steps.append(int(item.get('current_step') or 0))
+        except (TypeError, ValueError):
+            return jsonify({"error": f"Command {position}: recipe_id and current_step must be integers"}), 400
+    recipes = fetch_recipes(recipe_id for recipe_id in recipe_ids if recipe_id)
+    item_recipes = [recipes.get(recipe_id) for recipe_id in recipe_ids]
+
+    results = process_batch_with_nlu(list(zip(commands, steps, item_recipes)))
+
+    unresolved = [position for position, result in enumerate(results) if not nlu_resolved(result)]
+    client = request_client_id()
+    if unresolved:
+        with ThreadPoolExecutor(max_workers=min(LLM_BATCH_CONCURRENCY, len(unresolved))) as executor:
+            answers = executor.map(lambda position: llm_answer_or_overloaded(
+                commands[position], steps[position], item_recipes[position], bypass_cache=bool(items[position].get('bypass_cache')),
+                client=client), unresolved)
+            for position, answer in zip(unresolved, answers):
+                results[position] = answer
+    return jsonify({"results": results})
+
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+
+def _fts_match_expression(text):
+    """Turns free text into a safe FTS5 query: every word quoted and required, the last one as a prefix."""
+    terms = re.findall(r"\w+", text.lower())
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*" # Lets partially typed or spoken words still match
+    return " ".join(quoted)
+
+@app.route('/api/search')
+def search_recipes():
+    """Full-text recipe search over names, cuisines, ingredients and instructions, best matches first."""
+    db = get_db() # Connecting first makes sure init_schema has had a chance to build the index
+    if not fts_enabled:
+        return jsonify({"error": "Search is not available on this server"}), 503
+    query = request.args.get('q', '')
+    match = _fts_match_expression(query)
+    if match is None:
+        return jsonify({"error": "Query parameter 'q' is required"}), 400
+    limit = min(max(request.args.get('limit', SEARCH_DEFAULT_LIMIT, type=int), 1), SEARCH_MAX_LIMIT)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+
+    # FTS5 satisfies ORDER BY rank itself, so the LIMIT stops the scan early and
+    # snippet() only runs for the rows on this page. One extra row tells us if there is a next page.
+    rows = db.execute('''
+        SELECT r.id, r.name, r.cuisine, r.category, r.image_url, f.score, f.snippet
+        FROM (
+            SELECT rowid, rank AS score, snippet(recipes_fts, -1, '<mark>', '</mark>', '…', 12) AS snippet
+            FROM recipes_fts WHERE recipes_fts MATCH ? ORDER BY rank LIMIT ? OFFSET ?
+        ) AS f
+        JOIN recipes r ON r.id = f.rowid
+        ORDER BY f.score
+    ''', (match, limit + 1, offset)).fetchall()
+
+    results = [dict(r) for r in rows[:limit]]
+    return jsonify({
+        "query": query,
+        "results": results,
+        "limit": limit,
+        "offset": offset,
+        "next_offset": offset + limit if len(rows) > limit else None,
+    })
+
+@app.route('/api/metrics')
+def get_metrics():
+    """Reports in-process cache counters for this worker."""
+    return jsonify({
+        "database": {
+            "mode": "snapshot" if DB_SNAPSHOT else "file",
+            "catalog_version": catalog_version(),
+            "snapshot_loaded_at": _snapshot["loaded_at"] if _snapshot else None,
+        },
+        "recipe_cache": recipe_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "ingredient_index_cache": ingredient_index_cache.stats(),
+        "nlu_cache": nlu_cache.stats(),
+        "llm_cache": llm_cache.stats() if LLM_CACHE_ENABLED else None,
+        "llm_admission": llm_admission.stats(),
+        "llm_upstream": llm_breaker.stats(),
+        "llm_coalescing": llm_flights.stats(),
+    })
+
+# --- Startup and Health ---
+warmup_state = {"started_at": None, "finished_at": None, "error": None}
+WARMUP_RETRY_SECONDS = 5
+WARMUP_FORK_WAIT_SECONDS = 60
+_warmup_idle = threading.Event() # Clear while a warm-up attempt is importing and loading
+_warmup_idle.set()
+
+def warm_up():
+    """Loads the spaCy model and the OpenAI client and builds the catalog indexes, retrying until it works."""
+    warmup_state["started_at"] = time.time()
+    while True:
+        _warmup_idle.clear()
+        try:
+            get_nlp()
+            get_openai_client()
+            with app.app_context():
+                recipe_name_index()
+                catalog_matcher()
+            break
+        except Exception as e:
+            warmup_state["error"] = str(e)
+            print(f"Warm-up failed, retrying in {WARMUP_RETRY_SECONDS}s: {e}")
+        finally:
+            _warmup_idle.set()
+        time.sleep(WARMUP_RETRY_SECONDS)
+    warmup_state["error"] = None
+    warmup_state["finished_at"] = time.time()
+    print(f"Warm-up finished in {warmup_state['finished_at'] - warmup_state['started_at']:.2f}s.")
+
+def start_warm_up():
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+
+_startup_begun = False
+_startup_lock = threading.Lock()
+
+def start_up():
+    """Applies STARTUP_MODE, once per process: warm up now (eager), in a thread (background) or not at all (lazy).
+
+    Called by the server entry points and before the first request, never at import, so CLI
+    commands and scripts importing this module don't load models.
+    """
+    global _startup_begun
+    if _startup_begun:
+        return
+    with _startup_lock:
+        if _startup_begun:
+            return
+        _startup_begun = True
+        if STARTUP_MODE == "eager":
+            warm_up()
+        elif STARTUP_MODE == "background":
+            start_warm_up()
+
+@app.before_request
+def _start_up_on_first_request():
+    # Servers that import the app without calling start_up (flask run, gunicorn app:app) start
+    # warming up on their first request, typically the first readiness probe.
+    start_up()
+
+def _wait_for_warm_up_before_fork():
+    # Forking in the middle of an import (spaCy takes about a second) would leave the child a
+    # half-initialized module it can never finish importing, so a fork waits for the attempt.
+    if not _warmup_idle.wait(WARMUP_FORK_WAIT_SECONDS):
+        print("WARNING: forking while warm-up is still running; the child will load its resources itself.")
+
+def _reset_resources_after_fork():
+    # A forked child only has the thread that forked: a warm-up running in the parent is gone,
+    # and any lock it held would never be released.
+    global _name_index_lock, _catalog_matcher_lock, _openai_client
+    for resource in (_spacy_model, _blank_nlp, _openai_client):
+        resource.reset_lock()
+    _name_index_lock = threading.Lock()
+    _catalog_matcher_lock = threading.Lock()
+    if _openai_client.loaded:
+        # Never share the HTTP connection pool with the parent; the SDK is already imported,
+        # so building a new client on first use is cheap.
+        _openai_client = LazyResource("openai_client", _load_openai_client)
+    if STARTUP_MODE == "background" and _startup_begun and warmup_state["finished_at"] is None:
+        start_warm_up()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_wait_for_warm_up_before_fork, after_in_child=_reset_resources_after_fork)
+
+def is_ready():
+    # In lazy mode there is nothing to wait for: the first requests load what they need.
+    return STARTUP_MODE == "lazy" or warmup_state["finished_at"] is not None
+
+@app.route('/healthz')
+def healthz():
+    """Liveness: the process is up and serving requests, warm or not."""
+    return jsonify({"status": "ok"})
+
+@app.route('/readyz')
+def readyz():
+    """Readiness: 200 once the models, clients and catalog indexes are loaded, 503 while warming up."""
+    ready = is_ready()
+    body = {
+        "status": "ready" if ready else "warming_up",
+        "startup_mode": STARTUP_MODE,
+        "resources": {resource.name: resource.status() for resource in (_spacy_model, _openai_client)},
+        "warmup": warmup_state,
+    }
+    return jsonify(body), 200 if ready else 503
+
 # --- Application Entry Point ---
 if __name__ == '__main__':
     init_db()
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_up() # Only in the reloader's serving process, not in the one watching for changes
     app.run(debug=True)
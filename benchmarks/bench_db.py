@@ -0,0 +1,51 @@
+"""Per-request latency of the catalog routes under each database serving configuration.
+
+Runs each configuration in a fresh interpreter (the DB_* settings are read at import time)
+and drives the routes through Flask's test client, so only app + SQLite time is measured.
+
+Usage: python benchmarks/bench_db.py [iterations]
+"""
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUTES = ["/api/recipe/1", "/api/recipes", "/api/recipes_by_category?category=Vegetarian"]
+
+
+def run_child(iterations):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    import app as cooking_app
+
+    client = cooking_app.app.test_client()
+    for route in ROUTES:
+        client.get(route) # warm up imports, page cache and statement cache
+        start = time.perf_counter()
+        for _ in range(iterations):
+            client.get(route)
+        elapsed = time.perf_counter() - start
+        print(f"  {route:<50} {elapsed / iterations * 1e6:9.1f} us/request")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    configs = [
+        ("connect per request", {"DB_POOL_SIZE": "0"}),
+        ("pooled (DB_POOL_SIZE=8)", {"DB_POOL_SIZE": "8"}),
+        ("pooled, in-memory snapshot (DB_SNAPSHOT=1)", {"DB_POOL_SIZE": "8", "DB_SNAPSHOT": "1"}),
+    ]
+    for label, overrides in configs:
+        print(label)
+        env = dict(os.environ, BENCH_CHILD="1", **overrides)
+        env.setdefault("OPENAI_API_KEY", "sk-benchmark")
+        env.setdefault("STARTUP_MODE", "lazy") # no background model loading competing with the timed requests
+        subprocess.run([sys.executable, __file__, str(iterations)], env=env, check=True)
+
+
+if __name__ == "__main__":
+    if os.environ.get("BENCH_CHILD"):
+        run_child(int(sys.argv[1]))
+    else:
+        main()
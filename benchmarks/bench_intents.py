@@ -0,0 +1,87 @@
+"""Accuracy and per-command latency of the intent matcher against the legacy if/elif chain.
+
+The legacy chain is copied here verbatim (with its broken non-vegetarian branch made
+reachable) so both classifiers run on the same labelled corpus, intent_corpus.json.
+
+The matcher's "load" and "switch to" triggers are confirmed by interpret_command, which
+hands commands that don't name a recipe ("switch to low heat") back to the LLM, so the
+corpus is also scored on that final intent.
+
+Usage: python benchmarks/bench_intents.py [iterations]
+"""
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_corpus.json")
+
+
+def legacy_classify_intent(command_text):
+    intent = "unknown"
+    if "next step" in command_text or "what's next" in command_text or "move on" in command_text:
+        intent = "next_step"
+    elif "repeat" in command_text or "say again" in command_text or "what was that" in command_text:
+        intent = "repeat_step"
+    elif "ingredients" in command_text or "what do i need" in command_text or "list ingredients" in command_text:
+        intent = "list_ingredients"
+    elif "hello" in command_text or "hi" in command_text:
+        intent = "greeting"
+    elif "how much" in command_text or "how many" in command_text:
+        intent = "get_quantity"
+    elif "set timer" in command_text or "start timer" in command_text:
+        intent = "set_timer"
+    elif "recipe" in command_text and ("load" in command_text or "switch to" in command_text):
+        intent = "load_recipe"
+    elif "go back" in command_text or "back to recipes" in command_text:
+        intent = "back_to_list"
+    elif "show all" in command_text or "show all recipes" in command_text or "all recipes" in command_text:
+        intent = "show_all_recipes"
+    elif "show vegetarian" in command_text or "vegetarian recipes" in command_text:
+        intent = "show_vegetarian"
+    elif "show non-vegetarian" in command_text or "non-vegetarian recipes" in command_text:
+        intent = "show_non_vegetarian"
+    elif "show sweet" in command_text or "sweet recipes" in command_text or "dessert recipes" in command_text:
+        intent = "show_sweet"
+    return intent
+
+
+def evaluate(label, classify, corpus, iterations):
+    misses = [(text, expected, classify(text)) for text, expected in corpus if classify(text) != expected]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text, _ in corpus:
+            classify(text)
+    elapsed = time.perf_counter() - start
+    correct = len(corpus) - len(misses)
+    print(f"{label}: {correct}/{len(corpus)} correct, {elapsed / (iterations * len(corpus)) * 1e6:.2f} us/command")
+    for text, expected, got in misses:
+        print(f"  {text!r}: expected {expected}, got {got}")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    os.environ.setdefault("STARTUP_MODE", "lazy") # classify_intent needs no models
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    import app as cooking_app
+
+    with open(CORPUS) as f:
+        corpus = [(text, intent) for text, intent in json.load(f)]
+    evaluate("legacy if/elif chain", legacy_classify_intent, corpus, iterations)
+    evaluate("compiled matcher", cooking_app.classify_intent, corpus, iterations)
+
+    def nlu_intent(text):
+        intent = cooking_app.classify_intent(text)
+        if intent == "load_recipe" and cooking_app.interpret_command(text, intent, 0, None).get("intent") == "unknown":
+            return "unknown"
+        return intent
+
+    with cooking_app.app.app_context():
+        evaluate("compiled matcher, load commands confirmed", nlu_intent, corpus, max(1, iterations // 20))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Memory footprint, per-command NLU latency and result regression for each spaCy pipeline setting.
+
+Every configuration runs in a fresh interpreter (SPACY_* is read at import time). The child
+reports the resident set size of the whole worker after loading the model, and the answers of
+interpret_command for every command of intent_corpus.json plus QUANTITY_PROBES against a few
+recipes. QUANTITY_PROBES name no catalog ingredient, so they take the get_quantity fallback
+that runs the tagger and NER. The parent compares each configuration's answers with those of
+the full pipeline (the default) and exits with status 1 if excluding the components the NLU
+never reads changes any. Excluding ner as well is reported for information only, since it is
+expected to change answers.
+
+The numbers only mean something with the real model installed (python -m spacy download
+en_core_web_sm); the run stops if it finds a pipeline without components.
+
+Usage: python benchmarks/bench_spacy_pipeline.py [iterations]
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_corpus.json")
+RECIPE_IDS = [1, 2, 20]
+QUANTITY_PROBES = [
+    "how much of the green stuff do i add",
+    "how many of those little tomatoes",
+    "how much italian cheese",
+    "how much water from the pasta pot",
+    "how many cloves go in",
+    "how much of it",
+]
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run_child(iterations):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    import app as cooking_app
+    cooking_app.start_up() # STARTUP_MODE=eager: the reported RSS includes the loaded model
+
+    with open(CORPUS) as f:
+        commands = [text for text, _ in json.load(f)] + QUANTITY_PROBES
+    intents = [cooking_app.classify_intent(command) for command in commands]
+    with cooking_app.app.app_context():
+        recipes = [cooking_app.fetch_recipe(recipe_id) for recipe_id in RECIPE_IDS]
+        # interpret_command bypasses nlu_cache, so every call below parses its command
+        results = [cooking_app.interpret_command(command, intent, 0, recipe)
+                   for recipe in recipes for command, intent in zip(commands, intents)]
+        timings = {}
+        for label in ("get_quantity", "set_timer", "all commands"):
+            selected = [(c, i) for c, i in zip(commands, intents) if label == "all commands" or i == label]
+            start = time.perf_counter()
+            for _ in range(iterations):
+                for command, intent in selected:
+                    cooking_app.interpret_command(command, intent, 0, recipes[0])
+            timings[label] = (time.perf_counter() - start) / (iterations * len(selected)) * 1e6
+    nlp = cooking_app.get_nlp()
+    pipes = nlp.pipe_names if nlp else []
+    print(json.dumps({"rss_mb": rss_mb(), "pipes": pipes, "timings": timings, "commands": len(commands), "results": results}))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    configs = [
+        ("full pipeline (default)", {"SPACY_EXCLUDE": ""}),
+        ("exclude parser, senter, lemmatizer", {"SPACY_EXCLUDE": "parser,senter,lemmatizer"}),
+        ("also exclude ner", {"SPACY_EXCLUDE": "parser,senter,lemmatizer,ner"}),
+    ]
+    baseline = None
+    regressions = []
+    for label, overrides in configs:
+        env = dict(os.environ, BENCH_CHILD="1", **overrides)
+        env.setdefault("OPENAI_API_KEY", "sk-benchmark")
+        env.setdefault("STARTUP_MODE", "eager")
+        output = subprocess.run([sys.executable, __file__, str(iterations)], env=env, check=True,
+                                capture_output=True, text=True).stdout
+        report = json.loads(output.strip().splitlines()[-1])
+        if baseline is None:
+            if not report["pipes"]:
+                raise SystemExit("The full pipeline has no components: install en_core_web_sm (or set SPACY_MODEL) first.")
+            baseline = report["results"]
+        changed = [(old, new) for old, new in zip(baseline, report["results"]) if old != new]
+        print(label)
+        print(f"  components: {', '.join(report['pipes']) or '(none)'}")
+        print(f"  worker RSS: {report['rss_mb']:.1f} MB")
+        for intent, micros in report["timings"].items():
+            print(f"  {intent:<14} {micros:9.1f} us/command")
+        print(f"  regression: {len(changed)} of {len(baseline)} NLU answers ({report['commands']} commands x {len(RECIPE_IDS)} recipes) "
+              f"differ from the full pipeline")
+        for old, new in changed[:5]:
+            print(f"    {old['response']!r} -> {new['response']!r}")
+        if changed and label.startswith("exclude parser"):
+            regressions.append(label) # "also exclude ner" is informational: it is expected to change answers
+    if regressions:
+        raise SystemExit(f"NLU answers changed with: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    if os.environ.get("BENCH_CHILD"):
+        run_child(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,76 @@
+"""Time to first spoken chunk with /api/process_command_stream against /api/process_command.
+
+Runs the app on a local port against benchmarks/fake_openai.py (so the numbers reflect the
+fake's token rate, not the network) with the LLM answer cache off. For the blocking endpoint
+the first word can only be spoken once the whole JSON answer has arrived; for the streaming
+one it can be spoken as soon as the first "chunk" event arrives.
+
+Usage: python benchmarks/bench_streaming.py [requests]
+"""
+import http.client
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import fake_openai
+
+QUESTION = {"command": "why is my sauce lumpy", "recipe_id": 1, "current_step": 0}
+
+
+def post(port, path):
+    """(seconds to first chunk, seconds to complete answer) for one request."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    start = time.perf_counter()
+    conn.request("POST", path, body=json.dumps(QUESTION), headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    first = None
+    if response.getheader("Content-Type", "").startswith("text/event-stream"):
+        for line in response:
+            if line.startswith(b"event: chunk") and first is None:
+                first = time.perf_counter() - start
+    else:
+        response.read()
+    total = time.perf_counter() - start
+    conn.close()
+    return (first if first is not None else total), total
+
+
+def main(requests):
+    fake = fake_openai.start()
+    os.environ.update({
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{fake.server_port}/v1",
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-fake"),
+        "LLM_CACHE_ENABLED": "0",
+        "STARTUP_MODE": "eager",
+    })
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    from werkzeug.serving import make_server
+    import app as cooking_app
+    cooking_app.init_db()
+    cooking_app.start_up() # Loads the model and the client before anything is timed
+    logging.getLogger("werkzeug").setLevel(logging.WARNING) # No per-request log lines
+
+    server = make_server("127.0.0.1", 0, cooking_app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_port
+    config = fake.config
+    print(f"Fake API: first token after {config['first_token_delay'] * 1000:.0f} ms, then {config['token_delay'] * 1000:.0f} ms per token")
+    for path in ("/api/process_command", "/api/process_command_stream"):
+        post(port, path) # Warm up connections
+        timings = [post(port, path) for _ in range(requests)]
+        first = statistics.median(t[0] for t in timings) * 1000
+        total = statistics.median(t[1] for t in timings) * 1000
+        print(f"{path:<30} first chunk {first:8.1f} ms   complete {total:8.1f} ms   (median of {requests})")
+    server.shutdown()
+    fake.shutdown()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
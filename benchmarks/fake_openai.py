@@ -0,0 +1,129 @@
+"""Local stand-in for the OpenAI chat completions API, with a realistic token rate.
+
+Answers every POST /v1/chat/completions with the same canned answer, either in one piece or
+streamed token by token (stream=true), after a first-token delay and a per-token delay. Point
+the app at it with:
+
+    python benchmarks/fake_openai.py --port 8799
+    export OPENAI_BASE_URL=http://127.0.0.1:8799/v1 OPENAI_API_KEY=sk-fake
+
+To see how the app copes with an unhealthy upstream, --fail-status makes it answer the first
+--fail-count requests (all of them with -1) with that HTTP status instead, optionally with a
+--retry-after header, and --first-token-ms
+larger than OPENAI_READ_TIMEOUT makes it time out. It can also be started in-process from a
+benchmark with start(); server.config can be changed while it runs.
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ANSWER = ("Lumps usually mean the flour went in too fast. Whisk the sauce hard off the heat for a minute. "
+          "If lumps remain, pass it through a fine sieve and return it to a low heat. "
+          "Next time, add the liquid gradually while whisking.")
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeOpenAI/1.0"
+
+    def log_message(self, format, *args):
+        pass # Keep benchmark output readable
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            pass # The client gave up on us, e.g. after its read timeout
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        config = self.server.config
+        with self.server.lock:
+            self.server.requests += 1
+            failing = config["fail_count"] != 0 and config["fail_status"]
+            if failing and config["fail_count"] > 0:
+                config["fail_count"] -= 1
+        if failing:
+            headers = {"Retry-After": str(config["retry_after"])} if config["retry_after"] is not None else {}
+            self._send_json({"error": {"message": "Injected failure", "type": "server_error", "code": None}}, status=failing,
+                            headers=headers)
+            return
+        tokens = [word + " " for word in config["answer"].split(" ")]
+        time.sleep(config["first_token_delay"])
+        if body.get("stream"):
+            self._stream(body.get("model", "gpt-3.5-turbo"), tokens, config["token_delay"])
+        else:
+            time.sleep(config["token_delay"] * (len(tokens) - 1))
+            self._send_json({
+                "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()),
+                "model": body.get("model", "gpt-3.5-turbo"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": config["answer"]}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+            })
+
+    def _send_json(self, payload, status=200, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, model, tokens, token_delay):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for position, token in enumerate(tokens):
+            if position:
+                time.sleep(token_delay)
+            chunk = {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                     "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n")
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+def start(port=0, answer=ANSWER, first_token_delay=0.3, token_delay=0.02, fail_status=0, fail_count=0, retry_after=None):
+    """Serves in a background thread; returns the server (server.server_port has the port).
+
+    server.requests counts the requests received, including failed ones.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), FakeOpenAIHandler)
+    server.daemon_threads = True
+    server.config = {"answer": answer, "first_token_delay": first_token_delay, "token_delay": token_delay,
+                     "fail_status": fail_status, "fail_count": fail_count, "retry_after": retry_after}
+    server.requests = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--first-token-ms", type=float, default=300.0, help="Delay before the first token.")
+    parser.add_argument("--token-ms", type=float, default=20.0, help="Delay between tokens.")
+    parser.add_argument("--fail-status", type=int, default=0, help="Answer with this HTTP status instead, e.g. 500 or 429.")
+    parser.add_argument("--fail-count", type=int, default=-1, help="How many requests fail before it recovers; -1 for all.")
+    parser.add_argument("--retry-after", help="Retry-After header sent with the failures, in seconds.")
+    args = parser.parse_args()
+    server = start(args.port, first_token_delay=args.first_token_ms / 1000, token_delay=args.token_ms / 1000,
+                   fail_status=args.fail_status, fail_count=args.fail_count if args.fail_status else 0, retry_after=args.retry_after)
+    print(f"Fake OpenAI API on http://127.0.0.1:{server.server_port}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,95 @@
+"""Memory of each gunicorn worker, split into pages shared with the master and private ones.
+
+Reads /proc/<pid>/smaps_rollup (Linux 4.14+). PSS divides each shared page among the processes
+mapping it, so the PSS total is what the whole server really costs; compare it with RSS x
+workers to see what preloading saves.
+
+Usage:
+    python benchmarks/measure_worker_memory.py MASTER_PID
+    python benchmarks/measure_worker_memory.py --start [requests]
+The second form starts gunicorn -c gunicorn.conf.py, waits for /readyz, sends the given number
+of requests (default 200) so the workers touch their memory, measures, and stops it again.
+"""
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIELDS = ["Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty"]
+PORT = os.environ.get("PORT", "8765")
+
+
+def smaps_rollup(pid):
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            if name in FIELDS:
+                values[name] = int(rest.split()[0]) / 1024 # kB -> MB
+    return values
+
+
+def children(pid):
+    found = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    if int(f.read().rsplit(")", 1)[1].split()[1]) == pid:
+                        found.append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue # The process exited while we looked
+    return sorted(found)
+
+
+def report(master):
+    workers = children(master)
+    rows = [("master", smaps_rollup(master))] + [(f"worker {pid}", smaps_rollup(pid)) for pid in workers]
+    print(f"{'process':<16}" + "".join(f"{field:>15}" for field in FIELDS))
+    for label, values in rows:
+        print(f"{label:<16}" + "".join(f"{values.get(field, 0.0):>12.1f} MB" for field in FIELDS))
+    totals = {field: sum(values.get(field, 0.0) for _, values in rows) for field in FIELDS}
+    print(f"{'total':<16}" + "".join(f"{totals[field]:>12.1f} MB" for field in FIELDS))
+    if workers:
+        private = [values.get("Private_Clean", 0.0) + values.get("Private_Dirty", 0.0) for _, values in rows[1:]]
+        print(f"{len(workers)} workers, {sum(private) / len(private):.1f} MB private each on average; "
+              f"whole server {totals['Pss']:.1f} MB PSS")
+
+
+def get(path):
+    with urllib.request.urlopen(f"http://127.0.0.1:{PORT}{path}", timeout=5) as response:
+        return response.status
+
+
+def start_and_measure(requests):
+    env = dict(os.environ, PORT=PORT)
+    server = subprocess.Popen([sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"], cwd=ROOT, env=env)
+    try:
+        deadline = time.monotonic() + 120
+        while True:
+            try:
+                if get("/readyz") == 200:
+                    break
+            except OSError:
+                pass
+            if time.monotonic() > deadline:
+                raise SystemExit("gunicorn did not become ready within 120s")
+            time.sleep(0.5)
+        for i in range(requests):
+            get(["/api/recipes", "/api/recipe/1", "/api/search?q=chicken", "/readyz"][i % 4])
+        report(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--start":
+        start_and_measure(int(sys.argv[2]) if len(sys.argv) > 2 else 200)
+    elif len(sys.argv) > 1:
+        report(int(sys.argv[1]))
+    else:
+        raise SystemExit(__doc__)
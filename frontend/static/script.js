@@ -25,6 +25,13 @@ document.addEventListener('DOMContentLoaded', () => {
     let recognition;
     let isSpeaking = false;
     let currentFilterCategory = 'all'; // Default filter category
+    let nextRecipesCursor = null; // Cursor for the next page of the recipe list, null when on the last page
+    // Identifies this page to the server's per-session rate limit for AI answers
+    const sessionId = window.crypto && crypto.randomUUID ? crypto.randomUUID() : `${Date.now()}-${Math.random().toString(16).slice(2)}`;
+
+    // The list is fetched a page at a time, asking only for the fields the cards render.
+    const RECIPES_PAGE_SIZE = 24;
+    const RECIPE_CARD_FIELDS = 'id,name,cuisine,category,prep_time,cook_time,image_url';
 
     // --- Section Visibility Management ---
     function showRecipeList() {
@@ -50,33 +57,71 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // --- Recipe List Functions ---
-    async function fetchAllRecipes(category = 'all') {
-        recipesGrid.innerHTML = '<p class="text-center text-gray-600 col-span-full">Loading recipes...</p>';
-        
+    async function fetchAllRecipes(category = 'all', cursor = null) {
+        if (!cursor) {
+            recipesGrid.innerHTML = '<p class="text-center text-gray-600 col-span-full">Loading recipes...</p>';
+        }
+
+        const params = new URLSearchParams({ limit: RECIPES_PAGE_SIZE, fields: RECIPE_CARD_FIELDS });
         let url = '/api/recipes';
         if (category && category !== 'all') {
-            url = `/api/recipes_by_category?category=${category}`;
+            url = '/api/recipes_by_category';
+            params.set('category', category);
+        }
+        if (cursor) {
+            params.set('cursor', cursor);
         }
 
         try {
-            const response = await fetch(url);
+            const response = await fetch(`${url}?${params}`);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            const recipes = await response.json();
-            displayRecipeList(recipes);
+            const page = await response.json();
+            nextRecipesCursor = page.next_cursor;
+            displayRecipeList(page.recipes, Boolean(cursor));
         } catch (error) {
             console.error('Error fetching all recipes:', error);
-            recipesGrid.innerHTML = '<p class="text-red-600 text-center col-span-full">Failed to load recipes. Please ensure your backend is running and accessible.</p>';
+            if (cursor) {
+                // Keep the recipes already shown; put the error below them and let "Load more" be retried
+                showLoadMoreError();
+            } else {
+                recipesGrid.innerHTML = '<p class="text-red-600 text-center col-span-full">Failed to load recipes. Please ensure your backend is running and accessible.</p>';
+            }
             speak("Sorry, I could not fetch the list of recipes.");
         }
     }
 
-    function displayRecipeList(recipes) {
-        recipesGrid.innerHTML = ''; // Clear loading message
-        if (recipes.length === 0) {
-            recipesGrid.innerHTML = '<p class="text-center text-gray-600 col-span-full">No recipes available for this category.</p>';
-            return;
+    function showLoadMoreError() {
+        let errorMessage = document.getElementById('load-more-error');
+        if (!errorMessage) {
+            errorMessage = document.createElement('p');
+            errorMessage.id = 'load-more-error';
+            errorMessage.className = 'text-red-600 text-center col-span-full';
+            errorMessage.textContent = 'Failed to load more recipes. Please try again.';
+        }
+        const loadMoreBtn = document.getElementById('load-more-recipes');
+        if (loadMoreBtn) {
+            loadMoreBtn.disabled = false;
+            loadMoreBtn.after(errorMessage);
+        } else {
+            recipesGrid.appendChild(errorMessage);
+        }
+    }
+
+    function displayRecipeList(recipes, append = false) {
+        ['load-more-recipes', 'load-more-error'].forEach(id => {
+            const existing = document.getElementById(id);
+            if (existing) {
+                existing.remove();
+            }
+        });
+        if (!append) {
+            recipesGrid.innerHTML = ''; // Clear loading message
+            if (recipes.length === 0) {
+                recipesGrid.innerHTML = '<p class="text-center text-gray-600 col-span-full">No recipes available for this category.</p>';
+                return;
+            }
         }
 
         recipes.forEach(recipe => {
@@ -105,6 +150,18 @@ document.addEventListener('DOMContentLoaded', () => {
 
             recipesGrid.appendChild(recipeCard);
         });
+
+        if (nextRecipesCursor) {
+            const loadMoreBtn = document.createElement('button');
+            loadMoreBtn.id = 'load-more-recipes';
+            loadMoreBtn.className = 'col-span-full bg-indigo-100 text-indigo-700 py-2 rounded-lg hover:bg-indigo-200 transition-colors duration-200';
+            loadMoreBtn.textContent = 'Load more recipes';
+            loadMoreBtn.addEventListener('click', () => {
+                loadMoreBtn.disabled = true;
+                fetchAllRecipes(currentFilterCategory, nextRecipesCursor);
+            });
+            recipesGrid.appendChild(loadMoreBtn);
+        }
     }
 
     // --- Recipe Display Functions ---
@@ -181,9 +238,10 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // --- Speech Synthesis (Text-to-Speech) Function ---
-    function speak(text) {
+    // With queued set, the text is spoken after whatever is being said instead of interrupting it
+    function speak(text, queued = false) {
         if ('speechSynthesis' in window) {
-            if (speechSynthesis.speaking) {
+            if (speechSynthesis.speaking && !queued) {
                 speechSynthesis.cancel();
             }
 
@@ -191,7 +249,14 @@ document.addEventListener('DOMContentLoaded', () => {
             utterance.lang = 'en-US';
 
             utterance.onstart = () => { isSpeaking = true; startListeningBtn.disabled = true; };
-            utterance.onend = () => { isSpeaking = false; startListeningBtn.disabled = false; statusDiv.textContent = currentRecipe ? "Ready for your command." : "Select a recipe to begin or filter by category."; };
+            utterance.onend = () => {
+                if (speechSynthesis.pending) {
+                    return; // More queued sentences follow
+                }
+                isSpeaking = false;
+                startListeningBtn.disabled = false;
+                statusDiv.textContent = currentRecipe ? "Ready for your command." : "Select a recipe to begin or filter by category.";
+            };
             utterance.onerror = (event) => {
                 console.error('Speech synthesis error:', event.error);
                 isSpeaking = false;
@@ -201,7 +266,7 @@ document.addEventListener('DOMContentLoaded', () => {
             speechSynthesis.speak(utterance);
         } else {
             console.warn("Speech Synthesis not supported in this browser.");
-            responseDiv.textContent = text;
+            responseDiv.textContent = queued ? `${responseDiv.textContent} ${text}` : text;
             statusDiv.textContent = currentRecipe ? "Speech Synthesis not available. Ready for command." : "Select a recipe to begin or filter by category.";
             startListeningBtn.disabled = false;
         }
@@ -263,15 +328,45 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // Reads the Server-Sent Events of /api/process_command_stream, calling onEvent(name, data) for each
+    async function readEventStream(response, onEvent) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) {
+                break;
+            }
+            buffer += decoder.decode(value, { stream: true });
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const rawEvent = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                let name = 'message';
+                let data = '';
+                rawEvent.split('\n').forEach(line => {
+                    if (line.startsWith('event: ')) {
+                        name = line.slice(7);
+                    } else if (line.startsWith('data: ')) {
+                        data += line.slice(6);
+                    }
+                });
+                onEvent(name, JSON.parse(data));
+            }
+        }
+    }
+
     async function processVoiceCommand(command) {
         responseDiv.textContent = `Processing command: "${command}"...`;
         speak("Processing your request.");
 
         try {
-            const backendResponse = await fetch('/api/process_command', {
+            const backendResponse = await fetch('/api/process_command_stream', {
                 method: 'POST',
                 headers: {
-                    'Content-Type': 'application/json'
+                    'Content-Type': 'application/json',
+                    'X-Session-Id': sessionId
                 },
                 body: JSON.stringify({
                     command: command,
@@ -280,18 +375,44 @@ document.addEventListener('DOMContentLoaded', () => {
                 })
             });
 
+            if (backendResponse.status === 429 || backendResponse.status === 503) {
+                // Too many questions at once: the server answers right away with a short message to speak
+                const busy = await backendResponse.json();
+                console.warn(`AI answers are busy (${busy.overloaded}), retry after ${backendResponse.headers.get('Retry-After')}s`);
+                responseDiv.textContent = `Assistant: ${busy.response}`;
+                speak(busy.response);
+                return;
+            }
             if (!backendResponse.ok) {
                 throw new Error(`HTTP error! status: ${backendResponse.status}`);
             }
-            const data = await backendResponse.json();
-            console.log("Backend AI Response:", data);
 
-            if (speechSynthesis.speaking && speechSynthesis.pending) {
-                speechSynthesis.cancel();
+            // LLM answers arrive sentence by sentence: the first one interrupts "Processing your
+            // request." and the rest are queued behind it. The final "done" event has the whole result.
+            let spokenChunks = 0;
+            let data = null;
+            await readEventStream(backendResponse, (name, payload) => {
+                if (name === 'chunk') {
+                    responseDiv.textContent = spokenChunks === 0 ? `Assistant: ${payload.text}` : `${responseDiv.textContent} ${payload.text}`;
+                    speak(payload.text, spokenChunks > 0);
+                    spokenChunks++;
+                } else if (name === 'done') {
+                    data = payload;
+                }
+            });
+            if (!data) {
+                throw new Error("Response stream ended without a result");
             }
+            console.log("Backend AI Response:", data);
 
-            responseDiv.textContent = `Assistant: ${data.response}`;
-            speak(data.response);
+            if (spokenChunks === 0) {
+                if (speechSynthesis.speaking && speechSynthesis.pending) {
+                    speechSynthesis.cancel();
+                }
+
+                responseDiv.textContent = `Assistant: ${data.response}`;
+                speak(data.response);
+            }
 
             // Handle actions returned by the backend
             if (data.action === 'next_step') {
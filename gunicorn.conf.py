@@ -0,0 +1,31 @@
+"""gunicorn settings for production: gunicorn -c gunicorn.conf.py
+
+Every setting can be overridden from the environment, as noted next to it.
+"""
+import multiprocessing
+import os
+
+wsgi_app = "wsgi:app"
+bind = os.environ.get("GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+
+# Load wsgi.py (model, client, catalog indexes) once in the master and fork workers from it.
+preload_app = True
+
+# Requests spend most of their time waiting on the OpenAI API, which releases the GIL, so
+# each worker serves several at once on threads. Processes add CPU parallelism for spaCy;
+# with preloading an extra worker costs little memory.
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# The worker heartbeat runs on its own thread under gthread, so a slow LLM call alone does
+# not get a worker killed; this only catches workers that are truly stuck.
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # Database pools, the OpenAI client and index locks are reset by the os.register_at_fork
+    # hooks in app.py; nothing else is per process.
+    server.log.info("Worker %s forked from the preloaded master", worker.pid)
@@ -0,0 +1,206 @@
+"""Out-of-process spaCy service shared by all web workers on a host.
+
+Each web worker that loads en_core_web_sm holds its own copy of the model. With
+NLU_SERVICE_SOCKET set, app.py instead sends the texts it needs annotated to this service
+over a Unix socket and keeps only a blank tokenizer in memory, so memory stays flat however
+many workers run. The service collects requests arriving from all connections for up to a
+few milliseconds and runs them through nlp.pipe together.
+
+Run it next to the web workers:
+
+    python nlu_service.py --socket /tmp/cooking-nlu.sock
+
+Wire format, both directions: a 4-byte big-endian length, then the payload. A request is
+JSON {"texts": [...], "pipes": [...]} naming the components to run. A response is one status
+byte, then either DocBin bytes (status 0) or a UTF-8 error message (status 1).
+"""
+import json
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+import click
+
+_LENGTH = struct.Struct("!I")
+
+
+def _send_frame(sock, payload):
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def _recv_exactly(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("NLU service connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_frame(sock):
+    (size,) = _LENGTH.unpack(_recv_exactly(sock, _LENGTH.size))
+    return _recv_exactly(sock, size)
+
+
+# --- Server ---
+class _Pending:
+    def __init__(self, texts, pipes):
+        self.texts = texts
+        self.pipes = tuple(pipes)
+        self.docs = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class NLUServer:
+    """Serves spaCy annotations over a Unix socket, micro-batching concurrent requests."""
+
+    def __init__(self, nlp, socket_path, max_batch=64, max_wait=0.005):
+        self.nlp = nlp
+        self.socket_path = socket_path
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self.batches = 0
+        self.texts = 0
+
+    def serve_forever(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path) # Left behind by a previous run
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen(128)
+        threading.Thread(target=self._run_batches, name="nlu-batcher", daemon=True).start()
+        print(f"NLU service listening on {self.socket_path} with components: {', '.join(self.nlp.pipe_names)}.")
+        try:
+            while True:
+                conn, _ = listener.accept()
+                threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+        finally:
+            listener.close()
+            os.remove(self.socket_path)
+
+    def _handle_connection(self, conn):
+        from spacy.tokens import DocBin
+        with conn:
+            while True:
+                try:
+                    request = json.loads(_recv_frame(conn))
+                except (ConnectionError, OSError):
+                    return # The client went away; its connection is simply dropped
+                pending = _Pending(request["texts"], request.get("pipes", ()))
+                self._queue.put(pending)
+                pending.done.wait()
+                if pending.error is not None:
+                    _send_frame(conn, b"\x01" + pending.error.encode("utf-8"))
+                else:
+                    _send_frame(conn, b"\x00" + DocBin(docs=pending.docs, store_user_data=False).to_bytes())
+
+    def _run_batches(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            size = len(batch[0].texts)
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(pending)
+                size += len(pending.texts)
+            self._annotate(batch)
+
+    def _annotate(self, batch):
+        """Runs every request in the batch, one nlp.pipe call per distinct component set."""
+        by_pipes = {}
+        for pending in batch:
+            by_pipes.setdefault(pending.pipes, []).append(pending)
+        for pipes, group in by_pipes.items():
+            try:
+                disable = [name for name in self.nlp.pipe_names if name not in pipes]
+                docs = iter(self.nlp.pipe((text for pending in group for text in pending.texts), disable=disable, batch_size=self.max_batch))
+                for pending in group:
+                    pending.docs = [next(docs) for _ in pending.texts]
+            except Exception as e:
+                for pending in group:
+                    pending.error = f"{type(e).__name__}: {e}"
+            self.batches += 1
+            self.texts += sum(len(pending.texts) for pending in group)
+            for pending in group:
+                pending.done.set()
+
+
+# --- Client ---
+class RemoteNLP:
+    """Client for NLUServer. Docs come back in the caller's vocab, so they mix with local ones.
+
+    Each thread keeps its own connection, opened on first use and reopened once if it broke.
+    """
+
+    def __init__(self, socket_path, vocab, timeout=2.0):
+        self.socket_path = socket_path
+        self.vocab = vocab
+        self.timeout = timeout
+        self._local = threading.local()
+        if hasattr(os, "register_at_fork"):
+            # A forked child must not share the parent's connections
+            os.register_at_fork(after_in_child=self._reset_connections)
+
+    def _reset_connections(self):
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.settimeout(self.timeout)
+            conn.connect(self.socket_path)
+            self._local.conn = conn
+        return conn
+
+    def _call(self, payload):
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                _send_frame(conn, payload)
+                return _recv_frame(conn)
+            except (ConnectionError, OSError):
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+
+    def pipe(self, texts, pipes):
+        """Annotated Docs for the texts, running only the named components in the service."""
+        from spacy.tokens import DocBin
+        texts = list(texts)
+        if not texts:
+            return []
+        response = self._call(json.dumps({"texts": texts, "pipes": list(pipes)}).encode("utf-8"))
+        if response[:1] != b"\x00":
+            raise RuntimeError(f"NLU service error: {response[1:].decode('utf-8', 'replace')}")
+        return list(DocBin().from_bytes(response[1:]).get_docs(self.vocab))
+
+
+@click.command()
+@click.option("--socket", "socket_path", envvar="NLU_SERVICE_SOCKET", required=True, help="Unix socket path to listen on.")
+@click.option("--model", envvar="SPACY_MODEL", default="en_core_web_sm", show_default=True)
+@click.option("--exclude", envvar="SPACY_EXCLUDE", default="", show_default=True,
+              help="Components never loaded; same meaning and default as in app.py.")
+@click.option("--max-batch", default=64, show_default=True, help="Most texts run through nlp.pipe at once.")
+@click.option("--max-wait-ms", default=5.0, show_default=True, help="How long the first request of a batch waits for others.")
+def main(socket_path, model, exclude, max_batch, max_wait_ms):
+    import spacy
+    nlp = spacy.load(model, exclude=[name.strip() for name in exclude.split(",") if name.strip()])
+    NLUServer(nlp, socket_path, max_batch=max_batch, max_wait=max_wait_ms / 1000).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
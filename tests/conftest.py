@@ -0,0 +1,65 @@
+"""Shared fixtures: the app imported once against a copy of recipes.db and benchmarks/fake_openai.py.
+
+app.py reads its settings at import, so the environment is set up before the first test imports
+it, and restored after the last one. spaCy loads a blank English pipeline saved to disk instead of en_core_web_sm, which keeps the
+tests fast and independent of the downloaded model; nothing here needs its tagger or NER.
+"""
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+import fake_openai
+
+
+@pytest.fixture(scope="session")
+def fake_api():
+    server = fake_openai.start(first_token_delay=0, token_delay=0)
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture(scope="session")
+def cooking_app(fake_api, tmp_path_factory):
+    import spacy
+    workdir = tmp_path_factory.mktemp("app")
+    shutil.copy(os.path.join(ROOT, "recipes.db"), workdir / "recipes.db")
+    spacy.blank("en").to_disk(workdir / "nlp")
+    settings = {
+        "OPENAI_API_KEY": "sk-test",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{fake_api.server_port}/v1", # Read when the client is first built
+        "SPACY_MODEL": str(workdir / "nlp"),
+        "STARTUP_MODE": "lazy",
+        "LLM_CACHE_ENABLED": "0",
+        "LLM_CACHE_DATABASE": str(workdir / "llm_cache.db"),
+        "OPENAI_RETRY_BASE_DELAY": "0.01",
+        "OPENAI_RETRY_MAX_DELAY": "0.05",
+    }
+    # Everything set here is undone when the session ends
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in settings.items():
+            mp.setenv(name, value)
+        import app
+        mp.setattr(app, "DATABASE", str(workdir / "recipes.db"))
+        app.init_db()
+        yield app
+
+
+@pytest.fixture
+def client(cooking_app):
+    return cooking_app.app.test_client()
+
+
+@pytest.fixture
+def llm(cooking_app, fake_api, monkeypatch):
+    """The app with a healthy fake API and fresh breaker, admission and coalescing state."""
+    fake_api.config.update(answer=fake_openai.ANSWER, first_token_delay=0, token_delay=0, fail_status=0, fail_count=0, retry_after=None)
+    fake_api.requests = 0
+    monkeypatch.setattr(cooking_app, "llm_breaker", cooking_app.CircuitBreaker(5, 30))
+    monkeypatch.setattr(cooking_app, "llm_admission", cooking_app.LLMAdmission(4, 3, 3, 0.5, 100, 2, 100))
+    monkeypatch.setattr(cooking_app, "llm_flights", cooking_app.SingleFlight(retry_on=(cooking_app.LLMOverloaded,)))
+    return cooking_app
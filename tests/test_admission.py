@@ -0,0 +1,43 @@
+"""LLM admission control: token buckets per address and per session within it."""
+import pytest
+
+
+def charge(admission, client):
+    try:
+        admission.check_rate(client)
+    except Exception as e:
+        return e.reason
+    return "ok"
+
+
+@pytest.fixture
+def admission(cooking_app):
+    # No refill, so every call below is charged against the burst
+    return cooking_app.LLMAdmission(4, 3, 3, 0, 2, 0, 3)
+
+
+def test_sessions_split_their_address_budget(admission):
+    assert [charge(admission, ("10.0.0.1", "a")) for _ in range(3)] == ["ok", "ok", "rate_limited"]
+    assert charge(admission, ("10.0.0.1", "b")) == "ok"
+    assert charge(admission, ("10.0.0.1", "b")) == "rate_limited" # The address has used its 3 calls
+    assert charge(admission, ("10.0.0.2", "a")) == "ok"
+
+
+def test_new_session_ids_get_no_extra_calls(admission):
+    results = [charge(admission, ("10.0.0.1", f"session-{i}")) for i in range(5)]
+    assert results == ["ok", "ok", "ok", "rate_limited", "rate_limited"]
+
+
+def test_a_rejected_call_charges_neither_bucket(admission):
+    for session in ("a", "b", "c"):
+        charge(admission, ("10.0.0.1", session))
+    assert charge(admission, ("10.0.0.1", "d")) == "rate_limited"
+    admission._buckets["10.0.0.1"] = (3, admission._buckets["10.0.0.1"][1]) # Refill the address only
+    assert [charge(admission, ("10.0.0.1", "d")) for _ in range(3)] == ["ok", "ok", "rate_limited"]
+
+
+def test_route_limits_by_address_whatever_the_session_header(llm, client, monkeypatch):
+    monkeypatch.setattr(llm, "llm_admission", llm.LLMAdmission(4, 3, 3, 0, 5, 0, 2))
+    statuses = [client.post("/api/process_command", json={"command": "why is my sauce lumpy", "recipe_id": 1},
+                            headers={"X-Session-Id": f"session-{i}"}).status_code for i in range(3)]
+    assert statuses == [200, 200, 429]
@@ -0,0 +1,34 @@
+"""/api/process_commands: batches of commands answered in order."""
+import pytest
+
+
+def answer(client, items):
+    return client.post("/api/process_commands", json={"commands": items})
+
+
+def test_answers_in_order(client):
+    results = answer(client, [
+        {"command": "list ingredients", "recipe_id": 1, "current_step": 0},
+        {"command": "next step", "recipe_id": 1, "current_step": 0},
+    ]).get_json()["results"]
+    assert results[0]["response"].startswith("The ingredients for")
+    assert results[1] == client.post("/api/process_command", json={"command": "next step", "recipe_id": 1, "current_step": 0}).get_json()
+
+
+def test_ids_sent_as_strings_find_the_recipe(client):
+    single = client.post("/api/process_command", json={"command": "list ingredients", "recipe_id": "1", "current_step": "0"}).get_json()
+    results = answer(client, [{"command": "list ingredients", "recipe_id": "1", "current_step": "0"}]).get_json()["results"]
+    assert results == [single]
+    assert single["response"].startswith("The ingredients for")
+
+
+@pytest.mark.parametrize("item", [
+    {"command": "next step", "recipe_id": [1]},
+    {"command": "next step", "recipe_id": {"id": 1}},
+    {"command": "next step", "recipe_id": "pancakes"},
+    {"command": "next step", "recipe_id": 1, "current_step": "two"},
+])
+def test_bad_ids_and_steps_are_rejected(client, item):
+    response = answer(client, [{"command": "next step", "recipe_id": 1}, item])
+    assert response.status_code == 400
+    assert response.get_json()["error"].startswith("Command 1:")
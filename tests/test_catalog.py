@@ -0,0 +1,49 @@
+"""Smoke tests for the catalog endpoints: keyset pagination and ETag revalidation."""
+
+
+def fetch_pages(client, path, limit):
+    pages, cursor = [], None
+    while True:
+        url = f"{path}{'&' if '?' in path else '?'}limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        body = client.get(url).get_json()
+        pages.append(body["recipes"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_the_whole_list_once_in_order(client):
+    everything = client.get("/api/recipes").get_json()
+    pages = fetch_pages(client, "/api/recipes", 7)
+    assert len(everything) > 7
+    assert all(0 < len(page) <= 7 for page in pages)
+    assert [recipe["id"] for page in pages for recipe in page] == [recipe["id"] for recipe in everything]
+
+
+def test_pages_by_category(client):
+    everything = client.get("/api/recipes_by_category?category=Vegetarian").get_json()
+    pages = fetch_pages(client, "/api/recipes_by_category?category=Vegetarian", 3)
+    assert everything
+    assert [recipe["id"] for page in pages for recipe in page] == [recipe["id"] for recipe in everything]
+
+
+def test_fields_and_bad_cursors(client):
+    body = client.get("/api/recipes?limit=2&fields=name").get_json()
+    assert all(set(recipe) == {"name"} for recipe in body["recipes"])
+    assert client.get("/api/recipes?fields=password").status_code == 400
+    assert client.get("/api/recipes?cursor=not-a-cursor").status_code == 400
+
+
+def test_etag_revalidation(client):
+    first = client.get("/api/recipes?limit=5")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and etag.startswith('"')
+
+    revalidated = client.get("/api/recipes?limit=5", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b""
+    assert revalidated.headers["ETag"] == etag
+
+    other = client.get("/api/recipes?limit=6", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+    assert other.headers["ETag"] != etag
@@ -0,0 +1,118 @@
+"""SingleFlight: identical questions asked at the same moment share one upstream call."""
+import threading
+import time
+
+import pytest
+
+QUESTION = "why is my sauce lumpy"
+
+
+def run_together(targets, stagger=0.02):
+    threads = []
+    for target in targets:
+        threads.append(threading.Thread(target=target))
+        threads[-1].start()
+        time.sleep(stagger)
+    for thread in threads:
+        thread.join(10)
+
+
+def test_identical_questions_share_one_call(llm, fake_api):
+    fake_api.config.update(first_token_delay=0.3)
+    answers = []
+    run_together([lambda: answers.append(llm.get_ai_response_llm(QUESTION, 0, None)["response"])] * 4)
+    assert answers == [fake_api.config["answer"]] * 4
+    assert fake_api.requests == 1
+    assert llm.llm_flights.stats() == {"upstream_calls": 1, "saved_calls": 3, "in_flight": 0}
+
+
+def test_streams_share_one_call(llm, fake_api):
+    fake_api.config.update(first_token_delay=0.3)
+    streams = []
+    run_together([lambda: streams.append(list(llm.stream_ai_response_llm(QUESTION, 0, None)))] * 3)
+    assert fake_api.requests == 1
+    for events in streams:
+        assert events[-1] == ("done", {"response": fake_api.config["answer"], "action": None})
+        assert [data for name, data in events if name == "chunk"] == llm.split_sentences(fake_api.config["answer"] + " ")[0]
+
+
+def test_upstream_errors_are_shared(cooking_app):
+    flights = cooking_app.SingleFlight(retry_on=(cooking_app.LLMOverloaded,))
+    errors = []
+
+    def failing_call():
+        time.sleep(0.2)
+        raise ValueError("upstream broke")
+
+    def ask():
+        try:
+            flights.do("key", failing_call)
+        except ValueError as e:
+            errors.append(e)
+
+    run_together([ask] * 3)
+    assert len(errors) == 3 and len(set(map(id, errors))) == 1
+    assert flights.stats()["upstream_calls"] == 1
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_followers_retry_admission_when_the_leader_is_turned_away(llm, fake_api, monkeypatch, stream):
+    monkeypatch.setattr(llm, "llm_admission", llm.LLMAdmission(1, 1, 0.5, 0.5, 100, 2, 100))
+    llm.llm_admission.acquire() # Another question holds the only slot
+    results = {}
+
+    def ask(name):
+        def run():
+            try:
+                if stream:
+                    results[name] = list(llm.stream_ai_response_llm(QUESTION, 0, None))[-1][1]["response"]
+                else:
+                    results[name] = llm.get_ai_response_llm(QUESTION, 0, None)["response"]
+            except llm.LLMOverloaded as e:
+                results[name] = e.reason
+        return threading.Thread(target=run)
+
+    leader = ask("leader")
+    leader.start()
+    time.sleep(0.05)
+    followers = [ask(f"follower{i}") for i in range(2)]
+    for follower in followers:
+        follower.start()
+    leader.join(5) # Timed out in the queue, without calling the API
+    assert results == {"leader": "queue_timeout"}
+    llm.llm_admission.release()
+    for follower in followers:
+        follower.join(5)
+
+    # The followers went through admission themselves: one called the API, the other shared it
+    assert results == {"leader": "queue_timeout", "follower0": fake_api.config["answer"], "follower1": fake_api.config["answer"]}
+    assert fake_api.requests == 1
+    assert llm.llm_admission.stats()["queue_timeout"] == 1
+    assert llm.llm_flights.stats() == {"upstream_calls": 1, "saved_calls": 1, "in_flight": 0}
+
+
+def test_followers_get_the_whole_answer_when_the_leader_disconnects(llm, fake_api):
+    fake_api.config.update(first_token_delay=0.2, token_delay=0.01)
+    followed = []
+    follower = threading.Timer(0.05, lambda: followed.append(list(llm.stream_ai_response_llm(QUESTION, 0, None))))
+    follower.start()
+    leader = llm.stream_ai_response_llm(QUESTION, 0, None)
+    assert next(leader)[0] == "chunk"
+    leader.close() # The leader's client went away after its first sentence
+    follower.join(10)
+
+    assert followed[0][-1] == ("done", {"response": fake_api.config["answer"], "action": None})
+    assert fake_api.requests == 1
+    assert llm.llm_flights.stats() == {"upstream_calls": 1, "saved_calls": 1, "in_flight": 0}
+    assert llm.llm_admission.stats()["in_flight"] == 0
+
+
+def test_a_call_nobody_follows_ends_with_its_leader(llm, fake_api):
+    fake_api.config.update(token_delay=0.01)
+    leader = llm.stream_ai_response_llm(QUESTION, 0, None)
+    next(leader)
+    leader.close()
+    assert llm.llm_flights.stats() == {"upstream_calls": 1, "saved_calls": 0, "in_flight": 0}
+    assert llm.llm_admission.stats()["in_flight"] == 0
+    assert llm.get_ai_response_llm(QUESTION, 0, None)["response"] == fake_api.config["answer"]
+    assert fake_api.requests == 2
@@ -0,0 +1,38 @@
+"""/healthz and the /readyz states for each STARTUP_MODE."""
+import time
+
+
+def test_healthz(client):
+    assert client.get("/healthz").get_json() == {"status": "ok"}
+
+
+def test_lazy_mode_is_always_ready(cooking_app, client, monkeypatch):
+    monkeypatch.setattr(cooking_app, "warmup_state", {"started_at": None, "finished_at": None, "error": None})
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ready"
+
+
+def test_not_ready_until_warmed_up(cooking_app, client, monkeypatch):
+    monkeypatch.setattr(cooking_app, "STARTUP_MODE", "background")
+    monkeypatch.setattr(cooking_app, "warmup_state", {"started_at": None, "finished_at": None, "error": None})
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.get_json()["status"] == "warming_up"
+
+    cooking_app.warm_up()
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.get_json()["resources"]["spacy_model"]["loaded"]
+
+
+def test_first_request_starts_the_background_warm_up(cooking_app, client, monkeypatch):
+    monkeypatch.setattr(cooking_app, "STARTUP_MODE", "background")
+    monkeypatch.setattr(cooking_app, "_startup_begun", False)
+    monkeypatch.setattr(cooking_app, "warmup_state", {"started_at": None, "finished_at": None, "error": None})
+    client.get("/healthz")
+    deadline = time.monotonic() + 10
+    while client.get("/readyz").status_code == 503 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert client.get("/readyz").status_code == 200
+    assert cooking_app.warmup_state["finished_at"] is not None
@@ -0,0 +1,38 @@
+"""Intent classification against benchmarks/intent_corpus.json, and the set_timer answers."""
+import json
+import os
+
+import pytest
+
+from conftest import ROOT
+
+with open(os.path.join(ROOT, "benchmarks", "intent_corpus.json")) as f:
+    CORPUS = json.load(f)
+
+
+@pytest.mark.parametrize("text,expected", CORPUS)
+def test_corpus(cooking_app, text, expected):
+    intent = cooking_app.classify_intent(text)
+    if intent == "load_recipe":
+        # interpret_command hands "load"/"switch to" commands that name no recipe back to the LLM
+        with cooking_app.app.app_context():
+            intent = cooking_app.interpret_command(text, intent, 0, None).get("intent", intent)
+    assert intent == expected
+
+
+@pytest.mark.parametrize("command,duration", [
+    ("set a timer for five minutes", "5 minutes"),
+    ("start a timer for 2.5 minutes", "2.5 minutes"),
+    ("set timer for twenty five seconds", "25 seconds"),
+    ("set timer for twenty-five seconds", "25 seconds"),
+    ("set timer for 10 minutes", "10 minutes"),
+])
+def test_timer_durations(client, command, duration):
+    response = client.post("/api/process_command", json={"command": command, "recipe_id": 1, "current_step": 0})
+    assert response.status_code == 200
+    assert response.get_json()["response"].startswith(f"Okay, setting a timer for {duration}.")
+
+
+def test_timer_without_a_readable_duration(client):
+    response = client.post("/api/process_command", json={"command": "set timer for 1/2 minute", "recipe_id": 1, "current_step": 0})
+    assert response.get_json()["response"] == "For how long should I set the timer?"
@@ -0,0 +1,46 @@
+"""LLMAnswerCache: answers survive in the SQLite tier, read through a shared connection pool."""
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Statements run on each connection the cache opens, one list per connection."""
+    connections = []
+    connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        connections.append([])
+        conn.set_trace_callback(connections[-1].append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", tracing_connect)
+    return connections
+
+
+def new_cache(app, path):
+    return app.LLMAnswerCache(str(path), 16, 1000, 3600)
+
+
+def test_answers_are_read_back_from_disk(cooking_app, tmp_path):
+    new_cache(cooking_app, tmp_path / "cache.db").put("key", "Whisk it.")
+    cache = new_cache(cooking_app, tmp_path / "cache.db") # Another worker: empty memory tier
+    assert cache.get("key") == "Whisk it."
+    assert cache.get("other") is None
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_threads_share_pooled_connections_and_set_up_the_schema_once(cooking_app, tmp_path, opened):
+    cache = new_cache(cooking_app, tmp_path / "cache.db")
+    cache.put("key", "Whisk it.")
+    for _ in range(5): # Like /api/process_commands, which starts a new pool of threads per batch
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for answer in executor.map(lambda _: cache.get("key"), range(8)):
+                assert answer
+        cache.memory = cooking_app.LRUCache(16) # Make the next reads go to disk
+    assert len(opened) <= cooking_app.LLM_CACHE_POOL_SIZE
+    schema_statements = [statement for statements in opened for statement in statements if "CREATE TABLE" in statement]
+    assert len(schema_statements) == 1
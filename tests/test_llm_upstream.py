@@ -0,0 +1,158 @@
+"""Retries, backoff, the circuit breaker and the offline fallback against benchmarks/fake_openai.py."""
+import time
+
+import httpx
+import openai
+import pytest
+
+QUESTION = "why is my sauce lumpy"
+
+
+def ask(app, question=QUESTION):
+    return app.get_ai_response_llm(question, 0, None)["response"]
+
+
+def record_backoffs(app, monkeypatch):
+    """The attempt numbers create_chat_completion backs off after."""
+    attempts = []
+    retry_delay = app._retry_delay
+
+    def recording(error, attempt):
+        attempts.append(attempt)
+        return retry_delay(error, attempt)
+
+    monkeypatch.setattr(app, "_retry_delay", recording)
+    return attempts
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_transient_errors_are_retried(llm, fake_api, monkeypatch, status):
+    fake_api.config.update(fail_status=status, fail_count=2)
+    backoffs = record_backoffs(llm, monkeypatch)
+    assert ask(llm) == fake_api.config["answer"]
+    assert fake_api.requests == 3
+    assert backoffs == [0, 1]
+    assert llm.llm_breaker.stats()["retries"] == 2
+    assert llm.llm_breaker.stats()["state"] == "closed"
+
+
+def test_retries_give_up_after_max_retries(llm, fake_api):
+    fake_api.config.update(fail_status=500, fail_count=-1)
+    assert ask(llm) == llm.LLM_ERROR_RESPONSE
+    assert fake_api.requests == llm.OPENAI_MAX_RETRIES + 1
+    assert llm.llm_breaker.stats()["consecutive_failures"] == 1
+
+
+def test_client_errors_are_not_retried(llm, fake_api):
+    fake_api.config.update(fail_status=400, fail_count=-1)
+    assert ask(llm) == llm.LLM_ERROR_RESPONSE
+    assert fake_api.requests == 1
+    assert llm.llm_breaker.stats()["consecutive_failures"] == 0
+
+
+def test_streams_are_retried_while_opening(llm, fake_api):
+    fake_api.config.update(fail_status=503, fail_count=1)
+    events = list(llm.stream_ai_response_llm(QUESTION, 0, None))
+    assert events[-1] == ("done", {"response": fake_api.config["answer"], "action": None})
+    assert fake_api.requests == 2
+
+
+def test_backoff_grows_exponentially_with_jitter_and_a_cap(cooking_app):
+    error = openai.InternalServerError("boom", response=httpx.Response(500, request=httpx.Request("POST", "http://x")), body=None)
+    for attempt in range(6):
+        bound = min(cooking_app.OPENAI_RETRY_MAX_DELAY, cooking_app.OPENAI_RETRY_BASE_DELAY * 2 ** attempt)
+        delays = [cooking_app._retry_delay(error, attempt) for _ in range(50)]
+        assert all(0 <= delay <= bound for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_backoff_honours_retry_after(cooking_app):
+    def rate_limited(retry_after):
+        response = httpx.Response(429, headers={"retry-after": retry_after}, request=httpx.Request("POST", "http://x"))
+        return openai.RateLimitError("slow down", response=response, body=None)
+
+    assert cooking_app._retry_delay(rate_limited("0.04"), 0) >= 0.04
+    assert cooking_app._retry_delay(rate_limited("10"), 0) is None # Longer than we wait: give up
+
+
+def test_retry_after_is_waited_for(llm, fake_api):
+    fake_api.config.update(fail_status=429, fail_count=1, retry_after="0.04")
+    start = time.monotonic()
+    assert ask(llm) == fake_api.config["answer"]
+    assert time.monotonic() - start >= 0.04
+    assert fake_api.requests == 2
+
+
+def test_long_retry_after_is_not_retried(llm, fake_api):
+    fake_api.config.update(fail_status=429, fail_count=-1, retry_after="30")
+    assert ask(llm) == llm.LLM_ERROR_RESPONSE
+    assert fake_api.requests == 1
+    assert llm.llm_breaker.stats()["consecutive_failures"] == 1
+
+
+def test_breaker_opens_short_circuits_and_closes_after_a_trial(llm, fake_api, monkeypatch):
+    monkeypatch.setattr(llm, "OPENAI_MAX_RETRIES", 0)
+    monkeypatch.setattr(llm, "llm_breaker", llm.CircuitBreaker(2, 0.2))
+    fake_api.config.update(fail_status=500, fail_count=-1)
+    assert ask(llm) == llm.LLM_ERROR_RESPONSE
+    assert llm.llm_breaker.state == "closed"
+    assert ask(llm) == llm.LLM_ERROR_RESPONSE
+    assert llm.llm_breaker.state == "open"
+
+    # Open: answered offline without calling the API
+    assert ask(llm) == llm.LLM_UNAVAILABLE_RESPONSE
+    assert fake_api.requests == 2
+    assert llm.llm_breaker.stats()["short_circuited"] == 1
+
+    # After the reset time one trial call goes out; it succeeds and closes the breaker
+    fake_api.config.update(fail_count=0)
+    time.sleep(0.25)
+    assert ask(llm) == fake_api.config["answer"]
+    assert fake_api.requests == 3
+    stats = llm.llm_breaker.stats()
+    assert (stats["state"], stats["consecutive_failures"], stats["opened"]) == ("closed", 0, 1)
+
+
+def test_breaker_reopens_when_the_trial_fails(llm, fake_api, monkeypatch):
+    monkeypatch.setattr(llm, "OPENAI_MAX_RETRIES", 0)
+    monkeypatch.setattr(llm, "llm_breaker", llm.CircuitBreaker(1, 0.2))
+    fake_api.config.update(fail_status=500, fail_count=-1)
+    ask(llm)
+    time.sleep(0.25)
+    assert ask(llm) == llm.LLM_ERROR_RESPONSE # The trial call
+    assert fake_api.requests == 2
+    assert llm.llm_breaker.stats()["opened"] == 2
+    assert ask(llm) == llm.LLM_UNAVAILABLE_RESPONSE
+    assert fake_api.requests == 2
+
+
+def test_half_open_breaker_lets_one_trial_call_through(cooking_app):
+    breaker = cooking_app.CircuitBreaker(1, 0)
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow() # Only one trial at a time
+    breaker.record_other()
+    assert breaker.allow() # A trial that said nothing about health frees the slot
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() and breaker.allow()
+
+
+def test_offline_without_an_api_key(llm, fake_api, monkeypatch):
+    monkeypatch.setattr(llm, "openai_api_key", None)
+    assert ask(llm) == llm.LLM_OFFLINE_RESPONSE
+    assert list(llm.stream_ai_response_llm(QUESTION, 0, None))[-1][1]["response"] == llm.LLM_OFFLINE_RESPONSE
+    assert fake_api.requests == 0
+
+
+def test_routes_answer_offline_while_the_breaker_is_open(llm, fake_api, client, monkeypatch):
+    monkeypatch.setattr(llm, "llm_breaker", llm.CircuitBreaker(1, 30))
+    llm.llm_breaker.record_failure()
+    response = client.post("/api/process_command", json={"command": QUESTION, "recipe_id": 1, "current_step": 0})
+    assert response.status_code == 200
+    assert response.get_json()["response"] == llm.LLM_UNAVAILABLE_RESPONSE
+    stream = client.post("/api/process_command_stream", json={"command": QUESTION, "recipe_id": 1, "current_step": 0})
+    assert llm.LLM_UNAVAILABLE_RESPONSE in stream.get_data(as_text=True)
+    assert fake_api.requests == 0
@@ -0,0 +1,22 @@
+"""Production entry point, loaded once in the gunicorn master (see gunicorn.conf.py).
+
+Everything a worker needs is built here, before the fork: the database is seeded, then the
+spaCy model, the OpenAI client and the catalog indexes are loaded. Workers inherit all of it
+and share those pages with the master copy-on-write instead of each loading their own.
+"""
+import gc
+import os
+
+# Loading happens below, after init_db, rather than in an import-time warm-up thread
+os.environ.setdefault("STARTUP_MODE", "lazy")
+
+from app import app, init_db, warm_up
+
+init_db()
+warm_up()
+
+# Everything allocated so far lives as long as the process. Freezing it moves it out of the
+# garbage collector's generations, so collections in a worker never write GC headers into
+# these objects and the shared pages stay shared.
+gc.collect()
+gc.freeze()